@@ -0,0 +1,6 @@
+"""Benchmarks for CVInsight.
+
+Run a benchmark from the repository root, e.g.::
+
+    python -m benchmarks.document_parsing --copies 200
+"""
@@ -0,0 +1,134 @@
+"""
+Benchmark comparing one LLM call per extractor with the combined single call.
+
+Processes the sample resumes with the built-in extractors against an offline
+stand-in chat model. The stand-in answers each prompt with a fixed JSON reply
+after a simulated latency of a fixed round trip plus a cost per 1k prompt
+tokens, so the wall time reflects how many calls are made and how much text
+they send. Token counts are the 4-characters-per-token estimates LLMService
+reports when the API gives none; the relative difference between the two
+modes is what matters.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+from langchain_core.language_models.chat_models import SimpleChatModel
+
+from benchmarks.document_parsing import SAMPLE_DIR
+from cvinsight.core.llm_service import LLMService
+from cvinsight.core.resume_processor import PluginResumeProcessor
+from cvinsight.base_plugins.plugin_manager import PluginManager
+from cvinsight.base_plugins.profile_extractor import ProfileExtractorPlugin
+from cvinsight.base_plugins.skills_extractor import SkillsExtractorPlugin
+from cvinsight.base_plugins.education_extractor import EducationExtractorPlugin
+from cvinsight.base_plugins.experience_extractor import ExperienceExtractorPlugin
+from cvinsight.base_plugins.yoe_extractor import YoeExtractorPlugin
+
+PROFILE = {"name": "Jane Roe", "email": "jane@example.com", "phone": None, "location": None,
+           "linkedin": None, "current_title": "Engineer", "summary": None}
+SKILLS = {"skills": ["Python", "SQL"]}
+EDUCATION = {"educations": [{"degree": "BSc", "institution": "State University", "location": None,
+                             "start_date": "01/09/2012", "end_date": "01/06/2016"}]}
+EXPERIENCE = {"work_experiences": [{"company": "Acme Corp", "role": "Engineer", "location": None,
+                                    "description": ["Built things"], "start_date": "01/07/2016",
+                                    "end_date": "01/06/2020"}]}
+
+class OfflineChatModel(SimpleChatModel):
+    """Stand-in chat model that replies with fixed JSON after a simulated latency."""
+
+    latency_ms: float = 0.0
+    ms_per_1k_prompt_tokens: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "offline-stand-in"
+
+    def _call(self, messages: List[Any], stop: Optional[List[str]] = None, run_manager: Any = None,
+              **kwargs: Any) -> str:
+        prompt = "\n".join(str(message.content) for message in messages)
+        time.sleep((self.latency_ms + self.ms_per_1k_prompt_tokens * len(prompt) / 4 / 1000) / 1000)
+        if "in a single JSON object" in prompt:
+            reply = {"profile": PROFILE, "skills": SKILLS, "education": EDUCATION, "experience": EXPERIENCE}
+        elif "work experience details" in prompt:
+            reply = EXPERIENCE
+        elif "education details" in prompt:
+            reply = EDUCATION
+        elif "list of skills" in prompt:
+            reply = SKILLS
+        else:
+            reply = PROFILE
+        return json.dumps(reply)
+
+class OfflineLLMService(LLMService):
+    """LLMService whose model is the offline stand-in."""
+
+    def __init__(self, latency_ms, ms_per_1k_prompt_tokens):
+        self._latency = (latency_ms, ms_per_1k_prompt_tokens)
+        super().__init__(model_name="offline-stand-in", api_key="offline", bypass_cache=True)
+
+    def _get_llm(self):
+        latency_ms, ms_per_1k_prompt_tokens = self._latency
+        return OfflineChatModel(latency_ms=latency_ms, ms_per_1k_prompt_tokens=ms_per_1k_prompt_tokens)
+
+def build_processor(llm_service, output_dir):
+    """Create a processor with the built-in extractors on the given service."""
+    plugin_manager = PluginManager(llm_service)
+    for plugin_class in (ProfileExtractorPlugin, SkillsExtractorPlugin, EducationExtractorPlugin,
+                         ExperienceExtractorPlugin, YoeExtractorPlugin):
+        plugin_manager.load_plugin(plugin_class)
+    return PluginResumeProcessor(resume_dir=SAMPLE_DIR, output_dir=output_dir,
+                                 log_dir=os.path.join(output_dir, "logs"), plugin_manager=plugin_manager)
+
+def run_mode(processor, paths, combined, rounds):
+    """
+    Process every sample resume in one mode.
+
+    Returns:
+        A tuple of (LLM calls, prompt tokens, completion tokens, ms per resume).
+    """
+    calls = prompt_tokens = completion_tokens = 0
+    with patch('cvinsight.core.config.COMBINED_EXTRACTION_ENABLED', combined):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for path in paths:
+                usage = processor.process_resume(path).token_usage
+                prompt_tokens += usage["prompt_tokens"]
+                completion_tokens += usage["completion_tokens"]
+                calls += 1 if "combined" in usage else sum(
+                    1 for name, extractor in usage["by_extractor"].items() if name != "yoe" and extractor["total_tokens"])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    resumes = rounds * len(paths)
+    return calls / resumes, prompt_tokens / resumes, completion_tokens / resumes, elapsed_ms / resumes
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=3, help='Times each sample resume is processed per mode')
+    parser.add_argument('--latency-ms', type=float, default=400.0, help='Simulated round trip per LLM call')
+    parser.add_argument('--ms-per-1k-prompt-tokens', type=float, default=50.0,
+                        help='Simulated prompt processing time per 1k prompt tokens')
+    args = parser.parse_args()
+
+    paths = [os.path.join(SAMPLE_DIR, f) for f in sorted(os.listdir(SAMPLE_DIR))
+             if os.path.splitext(f)[1].lower() in ('.pdf', '.docx')]
+    service = OfflineLLMService(args.latency_ms, args.ms_per_1k_prompt_tokens)
+    with tempfile.TemporaryDirectory() as output_dir:
+        processor = build_processor(service, output_dir)
+        results = [(name, run_mode(processor, paths, combined, args.rounds)) for name, combined in
+                   (("separate", False), ("combined", True))]
+
+    print(f"Resumes: {len(paths)} x {args.rounds} rounds, simulated latency {args.latency_ms:.0f} ms/call "
+          f"+ {args.ms_per_1k_prompt_tokens:.0f} ms/1k prompt tokens\n")
+    print(f"{'mode':<10}{'calls':>8}{'prompt tok':>12}{'compl. tok':>12}{'ms/resume':>12}")
+    for name, (calls, prompt, completion, ms) in results:
+        print(f"{name:<10}{calls:>8.1f}{prompt:>12.0f}{completion:>12.0f}{ms:>12.0f}")
+    (_, separate), (_, combined) = results
+    print(f"\nPrompt tokens saved per resume: {separate[1] - combined[1]:.0f} "
+          f"({1 - combined[1] / separate[1]:.0%}), latency {separate[3] / combined[3]:.2f}x lower")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark for per-file document parsing time.
+
+Compares the legacy read path (validate_file in the processor, validate_file again
+inside read_file, then read_pdf_file/read_docx_file) with the single-pass
+open_document handle on a batch built from copies of the sample resumes.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from cvinsight.core.utils.file_utils import (
+    open_document,
+    validate_file,
+    read_pdf_file,
+    read_docx_file,
+)
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resumes")
+
+def build_corpus(target_dir, copies):
+    """
+    Build a benchmark corpus by copying the sample resumes.
+
+    Args:
+        target_dir: Directory to write the corpus to.
+        copies: Number of copies of each sample resume.
+
+    Returns:
+        A list of file paths in the corpus.
+    """
+    samples = [os.path.join(SAMPLE_DIR, f) for f in sorted(os.listdir(SAMPLE_DIR))
+               if os.path.splitext(f)[1].lower() in ('.pdf', '.docx')]
+    paths = []
+    for i in range(copies):
+        for sample in samples:
+            name, ext = os.path.splitext(os.path.basename(sample))
+            path = os.path.join(target_dir, f"{name}_{i}{ext}")
+            shutil.copyfile(sample, path)
+            paths.append(path)
+    return paths
+
+def legacy_parse(file_path):
+    """Parse a file the way the processor did before the document handle."""
+    validate_file(file_path)
+    validate_file(file_path)
+    if file_path.lower().endswith('.pdf'):
+        return read_pdf_file(file_path)
+    return read_docx_file(file_path)
+
+def single_pass_parse(file_path):
+    """Parse a file with the single-pass document handle."""
+    return open_document(file_path).text
+
+def time_batch(parse, paths):
+    """
+    Time a parse function over every path.
+
+    Returns:
+        A dictionary of per-extension mean milliseconds per file.
+    """
+    timings = {}
+    for path in paths:
+        ext = os.path.splitext(path)[1].lower()
+        start = time.perf_counter()
+        parse(path)
+        timings.setdefault(ext, []).append((time.perf_counter() - start) * 1000)
+    return {ext: sum(values) / len(values) for ext, values in timings.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=200, help='Copies of each sample resume')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = build_corpus(corpus_dir, args.copies)
+        print(f"Corpus: {len(paths)} files")
+
+        before = time_batch(legacy_parse, paths)
+        after = time_batch(single_pass_parse, paths)
+
+        print(f"\n{'type':<8}{'before (ms/file)':>20}{'after (ms/file)':>20}{'speedup':>10}")
+        for ext in sorted(before):
+            print(f"{ext:<8}{before[ext]:>20.2f}{after[ext]:>20.2f}{before[ext] / after[ext]:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark for DOCX text extraction.
+
+Compares docx2txt.process with the streaming stdlib reader
+(cvinsight.core.utils.docx_reader) on a corpus of copies of the sample DOCX
+resume, reporting time per file, peak memory per file and whether both
+produce the same text.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import docx2txt
+
+from cvinsight.core.utils.docx_reader import read_docx_text
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resumes", "Gaurav_Kumar.docx")
+
+def build_corpus(target_dir, sample, copies):
+    """
+    Build a corpus of copies of a DOCX file.
+
+    Returns:
+        A list of file paths in the corpus.
+    """
+    paths = []
+    for i in range(copies):
+        path = os.path.join(target_dir, f"resume_{i}.docx")
+        shutil.copyfile(sample, path)
+        paths.append(path)
+    return paths
+
+def time_reader(read, paths):
+    """
+    Time a reader over every path.
+
+    Returns:
+        Mean milliseconds per file.
+    """
+    start = time.perf_counter()
+    for path in paths:
+        read(path)
+    return (time.perf_counter() - start) * 1000 / len(paths)
+
+def peak_memory(read, path):
+    """
+    Measure the peak Python memory allocated while reading one file.
+
+    Returns:
+        Peak allocation in KB.
+    """
+    tracemalloc.start()
+    read(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sample', default=SAMPLE, help='DOCX file to copy into the corpus')
+    parser.add_argument('--copies', type=int, default=2000, help='Number of copies in the corpus')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = build_corpus(corpus_dir, args.sample, args.copies)
+        print(f"Corpus: {len(paths)} files")
+
+        same_text = docx2txt.process(args.sample) == read_docx_text(args.sample)
+        readers = [("docx2txt", docx2txt.process), ("stdlib-docx", read_docx_text)]
+        results = [(name, time_reader(read, paths), peak_memory(read, args.sample)) for name, read in readers]
+
+        print(f"\n{'reader':<14}{'ms/file':>10}{'peak KB/file':>15}")
+        for name, ms, peak in results:
+            print(f"{name:<14}{ms:>10.3f}{peak:>15.1f}")
+        print(f"\nSpeedup: {results[0][1] / results[1][1]:.2f}x, identical text: {same_text}")
+
+if __name__ == "__main__":
+    main()
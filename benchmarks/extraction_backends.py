@@ -0,0 +1,133 @@
+"""
+Benchmark for PDF text-extraction backends.
+
+Measures the throughput of every available PDF backend (see
+cvinsight.core.utils.extraction_backends) on a local corpus and reports the
+fastest backend that extracts text from as many files as the best one. With
+--write-env, the winner is recorded as PDF_EXTRACTION_METHOD in an env file
+(e.g. .env), making it the default for later runs.
+"""
+import argparse
+import os
+import time
+
+from cvinsight.core.utils.extraction_backends import list_backends
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resumes")
+
+def load_corpus(corpus_dir, copies):
+    """
+    Load the PDFs of a corpus directory into memory.
+
+    Args:
+        corpus_dir: Directory to read PDFs from (recursively).
+        copies: Number of times each file is repeated in the corpus.
+
+    Returns:
+        A list of (file name, bytes) tuples.
+    """
+    files = []
+    for dirpath, _, filenames in os.walk(corpus_dir):
+        for filename in sorted(filenames):
+            if filename.lower().endswith('.pdf'):
+                with open(os.path.join(dirpath, filename), 'rb') as f:
+                    files.append((filename, f.read()))
+    return files * copies
+
+def run_backend(backend, corpus):
+    """
+    Extract every page of every file with one backend.
+
+    Returns:
+        A dictionary with the elapsed seconds, page count, extracted characters,
+        files with text and files that failed.
+    """
+    pages = chars = files_with_text = failures = 0
+    start = time.perf_counter()
+    for _, data in corpus:
+        try:
+            handle = backend.open(data)
+            text_chars = 0
+            for index in range(backend.page_count(handle)):
+                text_chars += len(backend.extract_page(handle, index).strip())
+                pages += 1
+        except Exception:
+            failures += 1
+            continue
+        chars += text_chars
+        files_with_text += 1 if text_chars else 0
+    return {
+        "seconds": time.perf_counter() - start,
+        "pages": pages,
+        "chars": chars,
+        "files_with_text": files_with_text,
+        "failures": failures,
+    }
+
+def pick_fastest(results):
+    """
+    Pick the fastest backend among those with the best text coverage.
+
+    Args:
+        results: A dictionary of backend name to run_backend results.
+
+    Returns:
+        The name of the winning backend.
+    """
+    best_coverage = max(result["files_with_text"] for result in results.values())
+    candidates = {name: result for name, result in results.items()
+                  if result["files_with_text"] == best_coverage}
+    return min(candidates, key=lambda name: candidates[name]["seconds"])
+
+def write_env(env_path, backend_name):
+    """
+    Record a backend as PDF_EXTRACTION_METHOD in an env file, keeping other settings.
+
+    Args:
+        env_path: Path to the env file (created if missing).
+        backend_name: The backend to record.
+    """
+    lines = []
+    if os.path.exists(env_path):
+        with open(env_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+    setting = f"PDF_EXTRACTION_METHOD={backend_name}"
+    for i, line in enumerate(lines):
+        if line.strip().startswith("PDF_EXTRACTION_METHOD="):
+            lines[i] = setting
+            break
+    else:
+        lines.append(setting)
+
+    with open(env_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--corpus', default=SAMPLE_DIR, help='Directory of PDFs to benchmark on')
+    parser.add_argument('--copies', type=int, default=50, help='Times each corpus file is processed')
+    parser.add_argument('--write-env', metavar='PATH', help='Record the fastest backend in this env file')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.copies)
+    if not corpus:
+        parser.error(f"No PDF files found in {args.corpus}")
+    print(f"Corpus: {len(corpus)} files")
+
+    results = {backend.name: run_backend(backend, corpus) for backend in list_backends('.pdf')}
+
+    print(f"\n{'backend':<12}{'files/s':>10}{'pages/s':>10}{'chars':>12}{'with text':>11}{'failed':>8}")
+    for name, result in results.items():
+        seconds = result["seconds"] or 1e-9
+        print(f"{name:<12}{len(corpus) / seconds:>10.1f}{result['pages'] / seconds:>10.1f}"
+              f"{result['chars']:>12}{result['files_with_text']:>11}{result['failures']:>8}")
+
+    fastest = pick_fastest(results)
+    print(f"\nFastest backend: {fastest}")
+    if args.write_env:
+        write_env(args.write_env, fastest)
+        print(f"Recorded PDF_EXTRACTION_METHOD={fastest} in {args.write_env}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark for batch ingestion throughput.
+
+Compares reading each file several times (size check, structural validation,
+reading the contents for extraction, and hashing the file again for the
+manifest/cache) with a single memory-mapped open whose mapping is validated,
+hashed and parsed in place. Both the I/O part alone and the full ingestion
+(including text extraction) are timed on a local synthetic corpus built from
+copies of the sample resumes.
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.document_parsing import build_corpus
+from cvinsight.core.utils.file_utils import open_document, validate_file, _read_path, _check_structure
+from cvinsight.core.utils.extraction_backends import _as_stream
+from cvinsight.core.utils.manifest import hash_file
+
+def multi_read_io(path):
+    """Size check, structural validation, full read and a separate hash pass."""
+    os.path.getsize(path)
+    validate_file(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    hash_file(path)
+    return data
+
+def single_open_io(path):
+    """One mapped open: validation and hashing run over the same mapping."""
+    data = _read_path(path)
+    _check_structure(_as_stream(data), len(data), os.path.splitext(path)[1].lower())
+    hashlib.sha256(data).hexdigest()
+    return data
+
+def multi_read_ingest(path):
+    """Legacy ingestion: separate validation and hash passes around a read() extraction."""
+    validate_file(path)
+    pages = open_document(path).pages
+    hash_file(path)
+    return pages
+
+def single_open_ingest(path):
+    """Single-open ingestion: the mapped document is parsed and hashed in place."""
+    with open_document(path) as document:
+        document.content_hash
+        return document.pages
+
+def throughput(run, paths):
+    """
+    Run a function over every path.
+
+    Returns:
+        A tuple of (files per second, MB per second).
+    """
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    start = time.perf_counter()
+    for path in paths:
+        run(path)
+    elapsed = time.perf_counter() - start
+    return len(paths) / elapsed, total_bytes / (1024 * 1024) / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=500, help='Copies of each sample resume')
+    parser.add_argument('--mmap-min-size-kb', type=int, default=0,
+                        help='MMAP_MIN_SIZE_KB for the single-open path (0 maps every file)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = build_corpus(corpus_dir, args.copies)
+        print(f"Corpus: {len(paths)} files")
+
+        print(f"\n{'stage':<10}{'path':<14}{'files/s':>10}{'MB/s':>10}")
+        for stage, runs in (("I/O", [("multi-read", multi_read_io), ("single-open", single_open_io)]),
+                            ("ingest", [("multi-read", multi_read_ingest), ("single-open", single_open_ingest)])):
+            for name, run in runs:
+                with patch('cvinsight.core.config.MMAP_READS_ENABLED', name == "single-open"), \
+                     patch('cvinsight.core.config.MMAP_MIN_SIZE_KB', args.mmap_min_size_kb):
+                    files_per_second, mb_per_second = throughput(run, paths)
+                print(f"{stage:<10}{name:<14}{files_per_second:>10.0f}{mb_per_second:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for the per-call overhead of LLMService.extract_with_llm.
+
+Runs the built-in extractor prompts against an offline stand-in chat model
+that answers instantly with a fixed JSON reply, so the time measured is the
+client-side overhead only: building the chain (JSON schema format
+instructions, prompt template, parser) plus invoking it. The uncached path
+compiles the chain on every call, as LLMService did before chains were cached.
+"""
+import argparse
+import json
+import time
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from cvinsight.core.llm_service import LLMService
+from cvinsight.base_plugins.profile_extractor import ProfileExtractorPlugin
+from cvinsight.base_plugins.skills_extractor import SkillsExtractorPlugin
+from cvinsight.base_plugins.education_extractor import EducationExtractorPlugin
+from cvinsight.base_plugins.experience_extractor import ExperienceExtractorPlugin
+
+RESUME_TEXT = "Jane Roe\njane@example.com\nSKILLS\nPython, SQL\nEXPERIENCE\nAcme Corp, Engineer, 2020 - Present"
+
+class OfflineLLMService(LLMService):
+    """LLMService whose model is a local stand-in that replies with fixed JSON."""
+
+    def __init__(self):
+        super().__init__(model_name="offline-stand-in", api_key="offline")
+
+    def _get_llm(self):
+        return FakeListChatModel(responses=[json.dumps({"name": "Jane Roe"})])
+
+def time_calls(service, plugins, calls, cached):
+    """
+    Run extract_with_llm for each plugin in turn.
+
+    Returns:
+        Mean microseconds per call.
+    """
+    start = time.perf_counter()
+    for i in range(calls):
+        plugin = plugins[i % len(plugins)]
+        if not cached:
+            service._chains.clear()
+        service.extract_with_llm(plugin.get_model(), plugin.get_prompt_template(),
+                                 plugin.get_input_variables(), plugin.prepare_input_data(RESUME_TEXT))
+    return (time.perf_counter() - start) * 1e6 / calls
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=2000, help='Number of extract_with_llm calls per path')
+    args = parser.parse_args()
+
+    service = OfflineLLMService()
+    plugins = [plugin_class(service) for plugin_class in
+               (ProfileExtractorPlugin, SkillsExtractorPlugin, EducationExtractorPlugin, ExperienceExtractorPlugin)]
+    # Warm up imports and the pydantic schema caches
+    time_calls(service, plugins, len(plugins), cached=True)
+
+    results = [(name, time_calls(service, plugins, args.calls, cached)) for name, cached in
+               (("uncached", False), ("cached", True))]
+
+    print(f"{'path':<10}{'us/call':>10}")
+    for name, us in results:
+        print(f"{name:<10}{us:>10.1f}")
+    print(f"\nOverhead saved per call: {results[0][1] - results[1][1]:.1f} us "
+          f"({results[0][1] / results[1][1]:.2f}x)")
+
+if __name__ == "__main__":
+    main()
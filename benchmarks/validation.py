@@ -0,0 +1,51 @@
+"""
+Benchmark for file validation.
+
+Compares the fast structural check of validate_file (the default) with the
+deep check that opens each document, on a batch of thousands of files built
+from copies of the sample resumes.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from cvinsight.core.utils.file_utils import validate_file
+from benchmarks.document_parsing import build_corpus
+
+def time_validation(paths, deep):
+    """
+    Validate every path in one mode.
+
+    Returns:
+        A tuple (per-extension mean milliseconds per file, number of invalid files).
+    """
+    timings = {}
+    invalid = 0
+    for path in paths:
+        ext = os.path.splitext(path)[1].lower()
+        start = time.perf_counter()
+        is_valid, _ = validate_file(path, deep=deep)
+        timings.setdefault(ext, []).append((time.perf_counter() - start) * 1000)
+        invalid += 0 if is_valid else 1
+    return {ext: sum(values) / len(values) for ext, values in timings.items()}, invalid
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=1000, help='Copies of each sample resume')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = build_corpus(corpus_dir, args.copies)
+        print(f"Corpus: {len(paths)} files")
+
+        deep, deep_invalid = time_validation(paths, deep=True)
+        fast, fast_invalid = time_validation(paths, deep=False)
+
+        print(f"\n{'type':<8}{'deep (ms/file)':>18}{'fast (ms/file)':>18}{'speedup':>10}")
+        for ext in sorted(deep):
+            print(f"{ext:<8}{deep[ext]:>18.3f}{fast[ext]:>18.3f}{deep[ext] / fast[ext]:>9.1f}x")
+        print(f"\nInvalid files: deep={deep_invalid}, fast={fast_invalid}")
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 import os
 import asyncio
 import pathlib
-from typing import Union, Dict, List, Any, Optional, Tuple
+from typing import Union, Dict, List, Any, Optional, Tuple, BinaryIO
 
 # Import internal modules
 from .core.resume_processor import PluginResumeProcessor as ResumeProcessor
@@ -64,18 +64,21 @@ def _get_processor():
         _processor = ResumeProcessor(plugin_manager=_get_plugin_manager())
     return _processor
 
-def extract_all(file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
+def extract_all(file_path: Union[str, bytes, memoryview, BinaryIO],
+                log_token_usage: bool = True, file_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Extract all information from a resume.
     
     Args:
-        file_path: Path to the resume file.
+        file_path: Path to the resume file, or its contents as bytes, memoryview
+                   or a binary file object (no temporary file is needed).
         log_token_usage: Whether to log token usage to a separate file (default: True)
+        file_name: Optional file name for in-memory resumes
         
     Returns:
         Dictionary containing all extracted information (without token usage data).
     """
-    resume = _get_processor().process_resume(file_path)
+    resume = _get_processor().process_resume(file_path, file_name=file_name)
     
     # Create a logs directory if it doesn't exist and we need to log token usage
     if log_token_usage and hasattr(resume, 'token_usage') and resume.token_usage:
@@ -87,10 +90,10 @@ def extract_all(file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
         os.makedirs(logs_dir, exist_ok=True)
         
         # Create a log filename based on the resume filename and timestamp
-        file_basename = os.path.basename(file_path)
-        file_name = os.path.splitext(file_basename)[0]
+        file_basename = resume.file_name
+        resume_name = os.path.splitext(file_basename)[0]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
+        log_file_path = os.path.join(logs_dir, f"{resume_name}_token_usage_{timestamp}.json")
         
         # Save token usage to a separate JSON file
         with open(log_file_path, 'w') as f:
@@ -206,28 +209,24 @@ def extract_years_of_experience(file_path: str) -> Optional[str]:
         return result.YoE
     return None
 
-async def _analyze_resume_async(resume_path: str, plugins: List[Any]) -> Dict[str, Any]:
+async def _analyze_resume_async(resume_path: Union[str, bytes, memoryview, BinaryIO], plugins: List[Any],
+                                file_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Internal async function to analyze resume with parallel plugin processing.
     
     Args:
-        resume_path: Path to the resume file
+        resume_path: Path to the resume file, or its contents
         plugins: List of plugin instances to use
+        file_name: Optional file name for in-memory resumes
         
     Returns:
         Dictionary with results from selected plugins
     """
     processor = _get_processor()
     
-    # Temporarily replace the plugins
-    original_plugins = processor.plugin_manager.plugins.copy()
-    processor.plugin_manager.plugins = {p.metadata.name: p for p in plugins}
-    
-    # Process the resume
-    resume = processor.process_resume(resume_path)
-    
-    # Restore original plugins
-    processor.plugin_manager.plugins = original_plugins
+    # Pass the selection instead of swapping the shared plugins: other calls may run while this one awaits
+    resume = await processor.aprocess_resume(resume_path, file_name=file_name,
+                                             plugins={p.metadata.name: p for p in plugins})
     
     if resume:
         # Ensure we return a dictionary, not a Pydantic model
@@ -240,16 +239,19 @@ async def _analyze_resume_async(resume_path: str, plugins: List[Any]) -> Dict[st
             
     return {}
 
-def analyze_resume(resume_path: Union[str, pathlib.Path], 
+def analyze_resume(resume_path: Union[str, pathlib.Path, bytes, memoryview, BinaryIO], 
                    plugins: Optional[List[str]] = None,
-                   log_token_usage: bool = True) -> Dict[str, Any]:
+                   log_token_usage: bool = True,
+                   file_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze a resume with specific plugins (runs in parallel).
     
     Args:
-        resume_path: Path to the resume file (PDF or DOCX)
+        resume_path: Path to the resume file (PDF or DOCX), or its contents as
+            bytes, memoryview or a binary file object
         plugins: List of plugin names to use (None for all plugins)
         log_token_usage: Whether to log token usage to a separate file (default: True)
+        file_name: Optional file name for in-memory resumes
         
     Returns:
         Dictionary with results from selected plugins (without token usage data).
@@ -279,15 +281,18 @@ def analyze_resume(resume_path: Union[str, pathlib.Path],
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     
+    if isinstance(resume_path, pathlib.Path):
+        resume_path = str(resume_path)
+    
     if loop.is_running():
         # Create a new loop if the current one is already running
         new_loop = asyncio.new_event_loop()
         try:
-            resume = new_loop.run_until_complete(_analyze_resume_async(str(resume_path), selected_plugins))
+            resume = new_loop.run_until_complete(_analyze_resume_async(resume_path, selected_plugins, file_name))
         finally:
             new_loop.close()
     else:
-        resume = loop.run_until_complete(_analyze_resume_async(str(resume_path), selected_plugins))
+        resume = loop.run_until_complete(_analyze_resume_async(resume_path, selected_plugins, file_name))
     
     # Create a logs directory if it doesn't exist and we need to log token usage
     if log_token_usage and resume.get('token_usage'):
@@ -299,10 +304,10 @@ def analyze_resume(resume_path: Union[str, pathlib.Path],
         os.makedirs(logs_dir, exist_ok=True)
         
         # Create a log filename based on the resume filename and timestamp
-        file_basename = os.path.basename(str(resume_path))
-        file_name = os.path.splitext(file_basename)[0]
+        file_basename = resume.get('file_name') or os.path.basename(str(resume_path))
+        resume_name = os.path.splitext(file_basename)[0]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
+        log_file_path = os.path.join(logs_dir, f"{resume_name}_token_usage_{timestamp}.json")
         
         # Save token usage to a separate JSON file
         with open(log_file_path, 'w') as f:
@@ -151,7 +151,8 @@ class BasePlugin(ABC):
                 model,
                 prompt_template,
                 input_variables,
-                input_data
+                input_data,
+                plugin_version=self.metadata.version
             )
             
             return result, token_usage
@@ -1,11 +1,11 @@
 from typing import Dict, Any, Type, List, Tuple
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import LLMExtractorPlugin, PluginMetadata, PluginCategory
 from ...models import ResumeEducation
 from datetime import date
 import logging
 
-class EducationExtractorPlugin(ExtractorPlugin):
+class EducationExtractorPlugin(LLMExtractorPlugin):
     """Extractor plugin for education information."""
     
     def __init__(self, llm_service):
@@ -52,6 +52,10 @@ Text:
         """Get the input variables for the prompt template."""
         return ["text", "today"]
     
+    def get_input_sections(self) -> List[str]:
+        """Get the resume sections the extractor needs."""
+        return ["education"]
+    
     def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {
@@ -80,9 +84,14 @@ Text:
             model,
             prompt_template,
             input_variables,
-            input_data
+            input_data,
+            plugin_version=self.metadata.version
         )
         
+        return self._process_result(result, token_usage)
+    
+    def _process_result(self, result: Any, token_usage: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize the LLM result into the extractor's output."""
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
@@ -107,4 +116,4 @@ Text:
                 edu["location"] = edu.get("location")  # Can be None
                 edu["degree"] = edu.get("degree") or ""
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result, token_usage
@@ -1,11 +1,17 @@
-from typing import Dict, Any, Type, List, Tuple
+from typing import Dict, Any, Type, List, Tuple, Optional
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import LLMExtractorPlugin, PluginMetadata, PluginCategory
 from ...models import ResumeWorkExperience
+from ...core import config
+from ...core.utils.date_utils import parse_date
+from ...core.utils.text_chunker import split_on_role_boundaries
 from datetime import date
+import asyncio
+import concurrent.futures
 import logging
+import re
 
-class ExperienceExtractorPlugin(ExtractorPlugin):
+class ExperienceExtractorPlugin(LLMExtractorPlugin):
     """Extractor plugin for work experience information."""
     
     def __init__(self, llm_service):
@@ -56,6 +62,10 @@ Text:
         """Get the input variables for the prompt template."""
         return ["text", "today"]
     
+    def get_input_sections(self) -> List[str]:
+        """Get the resume sections the extractor needs."""
+        return ["experience"]
+    
     def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {
@@ -67,6 +77,114 @@ Text:
         """
         Extract work experience information from text.
         
+        In chunked mode (config.EXPERIENCE_CHUNKING_ENABLED), text longer than
+        config.EXPERIENCE_CHUNK_TOKENS is split on role boundaries, the chunks are
+        extracted concurrently and the entries are merged into one per company.
+        
+        Args:
+            text: The text to extract information from.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        if config.EXPERIENCE_CHUNKING_ENABLED:
+            chunks = split_on_role_boundaries(text, config.EXPERIENCE_CHUNK_TOKENS)
+            if len(chunks) > 1:
+                return self._extract_chunks(chunks)
+        return self._extract_text(text)
+    
+    def _extract_chunks(self, chunks: List[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract work experience from text chunks concurrently and merge the results.
+        
+        Args:
+            chunks: The text chunks, in document order.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        logging.info(f"Extracting work experience in {len(chunks)} chunks")
+        workers = max(1, min(config.EXPERIENCE_CHUNK_WORKERS, len(chunks)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._extract_text, chunks))
+        return self._merge_chunk_results(results)
+    
+    async def aextract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract work experience information from text without blocking the event loop.
+        
+        Chunks (in chunked mode) are extracted concurrently on the event loop,
+        at most config.EXPERIENCE_CHUNK_WORKERS at a time.
+        
+        Args:
+            text: The text to extract information from.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        if config.EXPERIENCE_CHUNKING_ENABLED:
+            chunks = split_on_role_boundaries(text, config.EXPERIENCE_CHUNK_TOKENS)
+            if len(chunks) > 1:
+                logging.info(f"Extracting work experience in {len(chunks)} chunks")
+                semaphore = asyncio.Semaphore(max(1, config.EXPERIENCE_CHUNK_WORKERS))
+                
+                async def extract_chunk(chunk: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+                    async with semaphore:
+                        return await super(ExperienceExtractorPlugin, self).aextract(chunk)
+                
+                results = await asyncio.gather(*(extract_chunk(chunk) for chunk in chunks))
+                return self._merge_chunk_results(list(results))
+        return await super().aextract(text)
+    
+    def extract_batch(self, texts: List[str],
+                      max_concurrency: Optional[int] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Extract work experience information from the texts of many resumes with one batched LLM call.
+        
+        In chunked mode the chunks of every text go into the same batch and are
+        merged back per resume (see LLMExtractorPlugin.extract_batch).
+        
+        Args:
+            texts: The texts to extract information from.
+            max_concurrency: Maximum number of LLM requests in flight.
+        
+        Returns:
+            A list of (extracted_data, token_usage) tuples, one per text.
+        """
+        if config.EXPERIENCE_CHUNKING_ENABLED:
+            chunked = [split_on_role_boundaries(text, config.EXPERIENCE_CHUNK_TOKENS) for text in texts]
+        else:
+            chunked = [[text] for text in texts]
+        results = super().extract_batch([chunk for chunks in chunked for chunk in chunks], max_concurrency)
+        
+        merged = []
+        position = 0
+        for chunks in chunked:
+            chunk_results = results[position:position + len(chunks)]
+            position += len(chunks)
+            merged.append(self._merge_chunk_results(chunk_results) if len(chunks) > 1 else chunk_results[0])
+        return merged
+    
+    def _merge_chunk_results(self, results: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Merge the per-chunk results and token usage, in document order."""
+        entries = [exp for result, _ in results for exp in result["work_experiences"]]
+        token_usage = {
+            "total_tokens": sum(usage.get("total_tokens", 0) for _, usage in results),
+            "prompt_tokens": sum(usage.get("prompt_tokens", 0) for _, usage in results),
+            "completion_tokens": sum(usage.get("completion_tokens", 0) for _, usage in results),
+            "source": results[0][1].get("source", "plugin"),
+            "chunks": len(results),
+            "extractor": self.metadata.name
+        }
+        if any(usage.get("is_estimated") for _, usage in results):
+            token_usage["is_estimated"] = True
+        
+        return {"work_experiences": merge_work_experiences(entries)}, token_usage
+    
+    def _extract_text(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract work experience information from text with a single LLM call.
+        
         Args:
             text: The text to extract information from.
             
@@ -84,9 +202,14 @@ Text:
             model,
             prompt_template,
             input_variables,
-            input_data
+            input_data,
+            plugin_version=self.metadata.version
         )
         
+        return self._process_result(result, token_usage)
+    
+    def _process_result(self, result: Any, token_usage: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize the LLM result into the extractor's output."""
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
@@ -112,4 +235,74 @@ Text:
                 exp["location"] = exp.get("location")  # Can be None
                 exp["role"] = exp.get("role") or ""
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result, token_usage
+
+
+_COMPANY_SUFFIX_RE = re.compile(
+    r'\b(inc|incorporated|ltd|limited|llc|llp|plc|pvt|private|corp|corporation|co|company|gmbh|ag|bv)\b',
+    re.IGNORECASE
+)
+
+def _company_key(company: str) -> str:
+    """Normalize a company name so that e.g. 'Acme Corp.' and 'ACME' compare equal."""
+    key = re.sub(r'[^\w\s]', ' ', (company or "").lower())
+    return " ".join(_COMPANY_SUFFIX_RE.sub(" ", key).split())
+
+def _as_list(description: Any) -> List[str]:
+    """Turn a description that may be a string, a list or empty into a list of non-empty items."""
+    if isinstance(description, list):
+        return [item for item in description if item]
+    return [description] if description else []
+
+def _is_more_recent(start, end, other_start, other_end) -> bool:
+    """Compare two positions by end date, then by start date; unknown dates sort first."""
+    if not end:
+        return False
+    if not other_end or end != other_end:
+        return not other_end or end > other_end
+    return bool(start and (not other_start or start > other_start))
+
+def merge_work_experiences(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge work experience entries into one entry per company.
+    
+    Applies the "one entry per company" rule across separately extracted chunks:
+    the earliest start date and the latest end date are kept, the role comes from
+    the most recent entry, and descriptions are combined without duplicates.
+    Entries without a company are kept as they are.
+    
+    Args:
+        entries: Work experience dictionaries, in document order.
+        
+    Returns:
+        The merged entries, in order of first appearance.
+    """
+    merged = []
+    by_company = {}
+    for entry in entries:
+        entry = dict(entry)
+        entry["description"] = _as_list(entry.get("description"))
+        key = _company_key(entry.get("company", ""))
+        if not key:
+            merged.append(entry)
+            continue
+        if key not in by_company:
+            by_company[key] = entry
+            merged.append(entry)
+            continue
+        
+        current = by_company[key]
+        current_start, entry_start = parse_date(current.get("start_date")), parse_date(entry.get("start_date"))
+        current_end, entry_end = parse_date(current.get("end_date")), parse_date(entry.get("end_date"))
+        
+        # The most recent position gives the role
+        if _is_more_recent(entry_start, entry_end, current_start, current_end):
+            current["role"] = entry.get("role") or current.get("role", "")
+        if entry_start and (not current_start or entry_start < current_start):
+            current["start_date"] = entry["start_date"]
+        if entry_end and (not current_end or entry_end > current_end):
+            current["end_date"] = entry["end_date"]
+        current["location"] = current.get("location") or entry.get("location")
+        current["description"] += [item for item in entry["description"] if item not in current["description"]]
+    
+    return merged
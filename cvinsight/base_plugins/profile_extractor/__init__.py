@@ -1,10 +1,11 @@
-from typing import Dict, List, Any, Tuple, Type
+from typing import Dict, List, Any, Tuple, Type, Optional
 from pydantic import BaseModel
 from ...models.resume_models import ResumeProfile
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import LLMExtractorPlugin, PluginMetadata, PluginCategory, InputWindow
+from ...core import config
 import logging
 
-class ProfileExtractorPlugin(ExtractorPlugin):
+class ProfileExtractorPlugin(LLMExtractorPlugin):
     """Plugin for extracting profile information from resumes."""
     
     def __init__(self, llm_service=None):
@@ -59,6 +60,16 @@ Text:
         """Get the input variables for the prompt template."""
         return ["text"]
     
+    def get_input_window(self) -> Optional[InputWindow]:
+        """
+        Get the part of the resume the extractor needs.
+        
+        With config.PROFILE_FIRST_PAGE_ONLY only the first page is sent, where
+        contact details usually are; the processor repeats the extraction on the
+        full text when the name, email or phone is not found there.
+        """
+        return InputWindow(first_pages=1) if config.PROFILE_FIRST_PAGE_ONLY else None
+    
     def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {"text": extracted_text}
@@ -84,9 +95,14 @@ Text:
             model,
             prompt_template,
             input_variables,
-            input_data
+            input_data,
+            plugin_version=self.metadata.version
         )
         
+        return self._process_result(result, token_usage)
+    
+    def _process_result(self, result: Any, token_usage: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize the LLM result into the extractor's output."""
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
@@ -101,4 +117,4 @@ Text:
             for field in fields:
                 processed_result[field] = getattr(result, field, None)
                 
-        return processed_result, token_usage
\ No newline at end of file
+        return processed_result, token_usage
@@ -1,10 +1,10 @@
 from typing import Dict, Any, Type, List, Tuple
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import LLMExtractorPlugin, PluginMetadata, PluginCategory
 from ...models import Skills
 import logging
 
-class SkillsExtractorPlugin(ExtractorPlugin):
+class SkillsExtractorPlugin(LLMExtractorPlugin):
     """Extractor plugin for skills information."""
     
     def __init__(self, llm_service=None):
@@ -49,6 +49,10 @@ Text:
         """Get the input variables for the prompt template."""
         return ["text"]
     
+    def get_input_sections(self) -> List[str]:
+        """Get the resume sections the extractor needs."""
+        return ["skills"]
+    
     def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {"text": extracted_text}
@@ -74,9 +78,14 @@ Text:
             model,
             prompt_template,
             input_variables,
-            input_data
+            input_data,
+            plugin_version=self.metadata.version
         )
         
+        return self._process_result(result, token_usage)
+    
+    def _process_result(self, result: Any, token_usage: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize the LLM result into the extractor's output."""
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
@@ -91,4 +100,4 @@ Text:
                 "skills": getattr(result, "skills", [])
             }
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result, token_usage
@@ -5,13 +5,136 @@ import json
 from typing import Optional, Dict, Any
 import click
 
+def _analyze(source, plugin_list: Optional[list], file_name: Optional[str] = None) -> Dict[str, Any]:
+    """Run the selected plugins (or the full extraction) on a resume path or its contents."""
+    if plugin_list:
+        from cvinsight import analyze_resume
+        return analyze_resume(source, plugin_list, file_name=file_name)
+    from cvinsight import extract_all
+    return extract_all(source, file_name=file_name)
+
+def _configure_llm_cache(no_cache: bool, refresh_cache: bool) -> None:
+    """Apply the --no-cache/--refresh-cache flags to the shared LLM service."""
+    from cvinsight.api import _get_llm_service
+    service = _get_llm_service()
+    service.bypass_cache = no_cache
+    service.refresh_cache = refresh_cache
+
+def _print_result(result: Dict[str, Any]) -> None:
+    """Print a human-readable summary of a resume analysis."""
+    click.echo("\nResume Analysis Results:")
+    if "name" in result:
+        click.echo(f"Name: {result.get('name', 'Not found')}")
+    if "email" in result:
+        click.echo(f"Email: {result.get('email', 'Not found')}")
+    if "skills" in result:
+        click.echo(f"Skills: {', '.join(result.get('skills', []))}")
+    if "educations" in result:
+        click.echo("\nEducation:")
+        for edu in result.get("educations", []):
+            click.echo(f"- {edu.get('degree')} at {edu.get('institution')}")
+    if "work_experiences" in result:
+        click.echo("\nExperience:")
+        for exp in result.get("work_experiences", []):
+            click.echo(f"- {exp.get('role')} at {exp.get('company')}")
+    if "YoE" in result:
+        click.echo(f"\nYears of Experience: {result.get('YoE', 'Not found')}")
+    elif "years_of_experience" in result:
+        click.echo(f"\nYears of Experience: {result.get('years_of_experience', 'Not found')}")
+
+def _save_result(result: Dict[str, Any], output: str, resume_name: str) -> None:
+    """Save a resume analysis as JSON in the output directory."""
+    os.makedirs(output, exist_ok=True)
+    output_file = os.path.join(output, f"{os.path.splitext(os.path.basename(resume_name))[0]}.json")
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+    click.echo(f"\nResults saved to {output_file}")
+
+def _process_archive(archive_path: str, plugin_list: Optional[list], output: Optional[str], json_output: bool) -> None:
+    """Process every resume in an archive, streaming members from memory."""
+    from cvinsight.core.utils.archive_utils import iter_archive
+    
+    results = {}
+    try:
+        for file_name, data in iter_archive(archive_path):
+            try:
+                result = _analyze(data, plugin_list, file_name=file_name)
+            except Exception as e:
+                click.echo(f"Error processing {file_name}: {e}", err=True)
+                continue
+            
+            if json_output:
+                results[file_name] = result
+            else:
+                click.echo(f"\n=== {file_name} ===")
+                _print_result(result)
+            if output:
+                _save_result(result, output, file_name)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    
+    if json_output:
+        click.echo(json.dumps(results, indent=2))
+
+def _process_directory(resume_dir: str, output: Optional[str], force: bool, pipeline: bool, json_output: bool,
+                       batch: bool = False, max_concurrency: Optional[int] = None) -> None:
+    """Process every resume in a directory, skipping the ones already processed."""
+    from cvinsight.api import _get_plugin_manager
+    from cvinsight.core import config
+    from cvinsight.core.resume_processor import PluginResumeProcessor
+    
+    processor = PluginResumeProcessor(resume_dir=resume_dir, output_dir=output or config.OUTPUT_DIR,
+                                      plugin_manager=_get_plugin_manager())
+    processor.process_all_resumes(force=force, pipelined=pipeline or None, batched=batch or None,
+                                  max_concurrency=max_concurrency)
+    stats = processor.run_stats
+    
+    if json_output:
+        click.echo(json.dumps(stats, indent=2))
+    else:
+        click.echo(f"\nProcessed: {stats['processed']}, skipped (unchanged): {stats['skipped']}, "
+                   f"rejected (not a resume): {stats['rejected']}, errors: {stats['errors']}")
+        click.echo(f"Results saved to {processor.output_dir}")
+    if stats["errors"]:
+        sys.exit(1)
+
+def _watch_directory(resume_dir: str, output: Optional[str]) -> None:
+    """Process resumes as they arrive in a directory until interrupted."""
+    from cvinsight.api import _get_plugin_manager
+    from cvinsight.core import config
+    from cvinsight.core.resume_processor import PluginResumeProcessor
+    from cvinsight.core.resume_watcher import ResumeWatcher
+    
+    processor = PluginResumeProcessor(resume_dir=resume_dir, output_dir=output or config.OUTPUT_DIR,
+                                      plugin_manager=_get_plugin_manager())
+    click.echo(f"Watching {resume_dir} for new resumes (Ctrl+C to stop)...")
+    try:
+        ResumeWatcher(processor).run()
+    except KeyboardInterrupt:
+        pass
+    stats = processor.run_stats
+    click.echo(f"\nProcessed: {stats['processed']}, skipped (unchanged): {stats['skipped']}, "
+               f"rejected (not a resume): {stats['rejected']}, errors: {stats['errors']}")
+
 @click.command(help="CVInsight - AI-powered resume analysis")
-@click.option('--resume', type=str, help='Process a single resume file')
+@click.option('--resume', type=str, help='Process a single resume file, or every resume in a .zip/.tar.gz archive')
+@click.option('--resume-dir', type=str, help='Process every resume in a directory, skipping unchanged ones')
+@click.option('--force', is_flag=True, help='With --resume-dir, reprocess resumes that are unchanged')
+@click.option('--pipeline', is_flag=True, help='With --resume-dir, parse the next resumes while waiting on the LLM')
+@click.option('--batch', is_flag=True, help='With --resume-dir, send each extractor\'s LLM calls for many resumes as one batch')
+@click.option('--max-concurrency', type=int, help='With --batch, LLM requests in flight per extractor (default: LLM_BATCH_MAX_CONCURRENCY)')
+@click.option('--watch', is_flag=True, help='Keep processing resumes as they arrive in --resume-dir (default: RESUME_DIR)')
+@click.option('--no-cache', is_flag=True, help='Do not use the LLM response cache (LLM_CACHE_ENABLED)')
+@click.option('--refresh-cache', is_flag=True, help='Call the LLM even for cached responses and replace them')
 @click.option('--output', type=str, help='Output directory for results')
 @click.option('--list-plugins', is_flag=True, help='List available plugins')
 @click.option('--plugins', type=str, help='Comma-separated list of plugins to use')
 @click.option('--json', 'json_output', is_flag=True, help='Output results as JSON')
-def main(resume: Optional[str], output: Optional[str], list_plugins: bool, plugins: Optional[str], json_output: bool):
+def main(resume: Optional[str], resume_dir: Optional[str], force: bool, pipeline: bool, batch: bool,
+         max_concurrency: Optional[int], watch: bool,
+         no_cache: bool, refresh_cache: bool, output: Optional[str],
+         list_plugins: bool, plugins: Optional[str], json_output: bool):
     """Entry point for the CVInsight CLI."""
     # Handle plugin listing
     if list_plugins:
@@ -26,6 +149,9 @@ def main(resume: Optional[str], output: Optional[str], list_plugins: bool, plugi
                 click.echo(f"- {plugin['name']} (v{plugin['version']}): {plugin['description']}")
         return
     
+    if no_cache or refresh_cache:
+        _configure_llm_cache(no_cache, refresh_cache)
+    
     # Handle resume processing
     if resume:
         resume_path = resume
@@ -38,45 +164,34 @@ def main(resume: Optional[str], output: Optional[str], list_plugins: bool, plugi
         if plugins:
             plugin_list = [p.strip() for p in plugins.split(',')]
         
+        from cvinsight.core.utils.archive_utils import is_archive
+        if is_archive(resume_path):
+            _process_archive(resume_path, plugin_list, output, json_output)
+            return
+        
         # Process the resume
-        if plugin_list:
-            from cvinsight import analyze_resume
-            result = analyze_resume(resume_path, plugin_list)
-        else:
-            from cvinsight import extract_all
-            result = extract_all(resume_path)
+        result = _analyze(resume_path, plugin_list)
         
         # Output the results
         if json_output:
             click.echo(json.dumps(result, indent=2))
         else:
-            click.echo("\nResume Analysis Results:")
-            if "name" in result:
-                click.echo(f"Name: {result.get('name', 'Not found')}")
-            if "email" in result:
-                click.echo(f"Email: {result.get('email', 'Not found')}")
-            if "skills" in result:
-                click.echo(f"Skills: {', '.join(result.get('skills', []))}")
-            if "educations" in result:
-                click.echo("\nEducation:")
-                for edu in result.get("educations", []):
-                    click.echo(f"- {edu.get('degree')} at {edu.get('institution')}")
-            if "work_experiences" in result:
-                click.echo("\nExperience:")
-                for exp in result.get("work_experiences", []):
-                    click.echo(f"- {exp.get('role')} at {exp.get('company')}")
-            if "YoE" in result:
-                click.echo(f"\nYears of Experience: {result.get('YoE', 'Not found')}")
-            elif "years_of_experience" in result:
-                click.echo(f"\nYears of Experience: {result.get('years_of_experience', 'Not found')}")
+            _print_result(result)
         
         # Save results to file if output directory specified
         if output:
-            os.makedirs(output, exist_ok=True)
-            output_file = os.path.join(output, f"{os.path.splitext(os.path.basename(resume_path))[0]}.json")
-            with open(output_file, 'w') as f:
-                json.dump(result, f, indent=2)
-            click.echo(f"\nResults saved to {output_file}")
+            _save_result(result, output, resume_path)
+    elif resume_dir or watch:
+        if not resume_dir:
+            from cvinsight.core import config
+            resume_dir = config.RESUME_DIR
+        if not os.path.isdir(resume_dir):
+            click.echo(f"Error: Resume directory not found at {resume_dir}", err=True)
+            sys.exit(1)
+        if watch:
+            _watch_directory(resume_dir, output)
+        else:
+            _process_directory(resume_dir, output, force, pipeline, json_output, batch, max_concurrency)
     else:
         click.echo(click.get_current_context().get_help())
 
@@ -1,5 +1,5 @@
 """Client interface for CVInsight."""
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, BinaryIO
 import pathlib
 import os
 
@@ -7,7 +7,6 @@ from .core.llm_service import LLMService
 from .core.resume_processor import PluginResumeProcessor as ResumeProcessor
 from .base_plugins.plugin_manager import PluginManager
 from .models.resume_models import (
-    ResumeProfile,
     Education,
     Experience,
     Skills
@@ -19,7 +18,8 @@ class CVInsightClient:
     This client provides methods for analyzing resumes using Google's Gemini models.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None,
+                 bypass_cache: bool = False, refresh_cache: bool = False):
         """
         Initialize the CVInsight client.
         
@@ -27,29 +27,35 @@ class CVInsightClient:
             api_key: Google API key for accessing Gemini models. If None, will look for
                     GOOGLE_API_KEY environment variable
             model_name: The name of the model to use. If None, will use default from config
+            bypass_cache: Do not use the LLM response cache (see LLM_CACHE_ENABLED)
+            refresh_cache: Call the LLM even for cached responses and replace them
         """
         # Store API key in environment if provided
         if api_key:
             os.environ["GOOGLE_API_KEY"] = api_key
             
         # Initialize services
-        self._llm_service = LLMService(model_name=model_name)
+        self._llm_service = LLMService(model_name=model_name, bypass_cache=bypass_cache,
+                                       refresh_cache=refresh_cache)
         self._plugin_manager = PluginManager(self._llm_service)
         self._plugin_manager.load_all_plugins()
         self._processor = ResumeProcessor(plugin_manager=self._plugin_manager)
     
-    def extract_all(self, file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
+    def extract_all(self, file_path: Union[str, bytes, memoryview, BinaryIO],
+                    log_token_usage: bool = True, file_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract all information from a resume.
         
         Args:
-            file_path: Path to the resume file.
+            file_path: Path to the resume file, or its contents as bytes, memoryview
+                       or a binary file object (no temporary file is needed).
             log_token_usage: Whether to log token usage to a separate file (default: True)
+            file_name: Optional file name for in-memory resumes
             
         Returns:
             Dictionary containing all extracted information (without token usage data).
         """
-        resume = self._processor.process_resume(file_path)
+        resume = self._processor.process_resume(file_path, file_name=file_name)
         
         # Create a logs directory if it doesn't exist and we need to log token usage
         if log_token_usage and hasattr(resume, 'token_usage') and resume.token_usage:
@@ -61,10 +67,10 @@ class CVInsightClient:
             os.makedirs(logs_dir, exist_ok=True)
             
             # Create a log filename based on the resume filename and timestamp
-            file_basename = os.path.basename(file_path)
-            file_name = os.path.splitext(file_basename)[0]
+            file_basename = resume.file_name
+            resume_name = os.path.splitext(file_basename)[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
+            log_file_path = os.path.join(logs_dir, f"{resume_name}_token_usage_{timestamp}.json")
             
             # Save token usage to a separate JSON file
             with open(log_file_path, 'w') as f:
@@ -81,30 +87,28 @@ class CVInsightClient:
         
         return resume
     
-    def extract_profile(self, file_path: str) -> Dict[str, Any]:
+    def extract_profile(self, file_path: Union[str, bytes, memoryview, BinaryIO],
+                        file_name: Optional[str] = None, speculative: Optional[bool] = None) -> Dict[str, Any]:
         """
         Extract profile information from a resume.
         
+        Only the profile extractor runs. With speculative extraction (opt-in via
+        SPECULATIVE_PROFILE_ENABLED or speculative=True) it starts on the first
+        page while the remaining pages are still being parsed.
+        
         Args:
-            file_path: Path to the resume file.
+            file_path: Path to the resume file, or its contents.
+            file_name: Optional file name for in-memory resumes.
+            speculative: Start on the first page. Defaults to config.SPECULATIVE_PROFILE_ENABLED.
             
         Returns:
-            Dictionary containing profile information.
+            Dictionary containing profile information (name, email, phone, linkedin,
+            current_title, summary).
         """
-        result = self._processor.process_resume(file_path)
-        if hasattr(result, 'name'):
-            # Create dictionary from resume fields
-            profile_data = {
-                'name': result.name,
-                'email': result.email,
-                'phone': result.contact_number
-            }
-            return profile_data
-        elif result.get("profile"):
-            # Convert to dictionary if it's a Pydantic model
-            profile = ResumeProfile(**result.get("profile", {}))
-            return profile.model_dump() if hasattr(profile, 'model_dump') else profile.__dict__
-        return {}
+        if isinstance(file_path, pathlib.Path):
+            file_path = str(file_path)
+        profile = self._processor.extract_profile(file_path, file_name=file_name, speculative=speculative)
+        return profile or {}
     
     def extract_education(self, file_path: str) -> List[Dict[str, Any]]:
         """
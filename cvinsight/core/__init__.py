@@ -9,6 +9,9 @@ from .resume_processor import PluginResumeProcessor as ResumeProcessor
 from .utils import (
     read_file,
     validate_file,
+    open_document,
+    iter_text,
+    ResumeDocument,
     parse_date,
     calculate_experience,
     setup_logging,
@@ -23,6 +26,9 @@ __all__ = [
     'ResumeProcessor',
     'read_file',
     'validate_file',
+    'open_document',
+    'iter_text',
+    'ResumeDocument',
     'parse_date',
     'calculate_experience',
     'setup_logging',
@@ -0,0 +1,200 @@
+"""
+Single-call extraction of the profile, skills, education and work experience.
+
+By default each resume costs four LLM calls, each re-sending the resume text
+together with its own format instructions. In combined mode
+(config.COMBINED_EXTRACTION_ENABLED) one prompt returns a merged schema
+(CombinedExtraction) and the reply is split back into the per-plugin results,
+normalized by each plugin, so Resume.from_extractors_output and the YoE
+extractor work unchanged.
+"""
+import logging
+from datetime import date
+from typing import Dict, Any, List, Tuple, Optional
+from ..models import CombinedExtraction, ResumeProfile, Skills, ResumeEducation, ResumeWorkExperience
+
+# Part of the combined schema -> Pydantic model the part's extractor returns
+COMBINED_PARTS = {
+    "profile": ResumeProfile,
+    "skills": Skills,
+    "education": ResumeEducation,
+    "experience": ResumeWorkExperience
+}
+
+COMBINED_PROMPT_TEMPLATE = """
+You are an expert resume parser. Your task is to extract the following information from the resume text provided below, in a single JSON object.
+
+profile: the contact information of the candidate.
+- Name: Name of the candidate
+- Location: Current location of the candidate, if present
+- Email: The candidate's email address
+- Phone: The candidate's phone number, including country code if present
+- LinkedIn: LinkedIn profile URL if present. If present and there is no http/https, prepend the https in front of url
+- Current Title: The candidate's current job title if present
+- Summary: A brief summary or objective statement if present.
+If any of these fields are not present in the resume, return null for that field.
+
+skills: the list of skills mentioned in the Skills section.
+
+education: every education entry of the Education section, with the following details:
+- College/School (output as "institution")
+- Start Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no start date is mentioned, return null. If you encounter Present then use the current date, i.e. {today}.
+- End Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no end date is mentioned, return null. If you encounter Present then use the current date, i.e. {today}.
+- Location
+- Degree
+
+experience: every entry of the Work Experience section, with the following details:
+- Company
+- Job Description: Returns in array of string. If the resume provides the work description. Add every point into result in array of string.
+- Start Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use the current date, i.e. {today}.
+- End Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use the current date, i.e. {today}.
+- Location
+- Role: Extract ONLY the job title (e.g., "Data Engineer", "Software Developer", "Project Manager"). Do NOT include project information or descriptions in this field - just the official job title.
+IMPORTANT: Create only ONE entry per company, even if the person worked on multiple projects or had multiple roles at the same company. If there were multiple positions at the same company, use the most senior or most recent role in the Role field. The earliest start date and the latest end date should be used for the company's overall employment period.
+
+If a section cannot be found, return an empty list for it.
+
+Return your output as a JSON object with the below schema.
+{format_instructions}
+
+Text:
+{text}
+"""
+
+COMBINED_INPUT_VARIABLES = ["text", "today"]
+
+def can_combine(plugins: Dict[str, Any]) -> bool:
+    """
+    Check whether the combined prompt can stand in for the given extractors.
+
+    Every part needs an extractor whose output model is the part's model and
+    that can normalize a raw LLM result, as the built-in extractors do; with a
+    replaced, custom or missing extractor each plugin keeps its own prompt.
+
+    Args:
+        plugins: Extractor plugins by part name (profile, skills, education, experience).
+
+    Returns:
+        True if every part is covered by such an extractor.
+    """
+    for part, model in COMBINED_PARTS.items():
+        plugin = plugins.get(part)
+        if plugin is None or not callable(getattr(plugin, "_process_result", None)):
+            return False
+        try:
+            if plugin.get_model() is not model:
+                return False
+        except Exception:
+            return False
+    return True
+
+def _input_data(text: str) -> Dict[str, Any]:
+    """Prepare the input data for the combined prompt."""
+    return {
+        "text": text,
+        "today": date.today().strftime("%d/%m/%Y")
+    }
+
+def _plugin_version(plugins: Dict[str, Any]) -> str:
+    """Version of the combined call for the response cache: the versions of the plugins it replaces."""
+    return ",".join(f"{plugins[part].metadata.name}={plugins[part].metadata.version}" for part in COMBINED_PARTS)
+
+def split_combined_result(result: Dict[str, Any], plugins: Dict[str, Any]) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Split a combined reply into the per-plugin results.
+
+    Each part is normalized by its plugin, exactly as if the plugin had made the
+    call; the token usage of each part is zero and marked as "combined", the
+    cost of the call is reported once for the whole resume.
+
+    Args:
+        result: The combined reply, a CombinedExtraction dictionary.
+        plugins: Extractor plugins by part name.
+
+    Returns:
+        A dictionary of (extracted data, token usage) by part name.
+    """
+    results = {}
+    for part in COMBINED_PARTS:
+        part_usage = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "combined"}
+        results[part] = plugins[part]._process_result(result.get(part) or {}, part_usage)
+    return results
+
+def _finish(result: Any, token_usage: Dict[str, Any], plugins: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Split a combined reply, or return None if the call failed."""
+    if not isinstance(result, dict) or not result:
+        logging.warning("Combined extraction returned no result, falling back to one call per extractor")
+        return None
+    token_usage["extractor"] = "combined"
+    return split_combined_result(result, plugins), token_usage
+
+def extract_combined(llm_service: Any, text: str,
+                     plugins: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Extract the profile, skills, education and work experience with one LLM call.
+
+    Args:
+        llm_service: The LLMService to call.
+        text: The full resume text.
+        plugins: Extractor plugins by part name (see can_combine).
+
+    Returns:
+        A tuple of (results by part name, token usage of the call), or None if the
+        call failed and the extractors should run separately.
+    """
+    result, token_usage = llm_service.extract_with_llm(
+        CombinedExtraction,
+        COMBINED_PROMPT_TEMPLATE,
+        COMBINED_INPUT_VARIABLES,
+        _input_data(text),
+        plugin_version=_plugin_version(plugins)
+    )
+    return _finish(result, token_usage, plugins)
+
+def extract_combined_batch(llm_service: Any, texts: List[str], plugins: Dict[str, Any],
+                           max_concurrency: Optional[int] = None
+                           ) -> List[Optional[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+    """
+    Run the combined extraction for many resumes with one batched LLM call.
+
+    Args:
+        llm_service: The LLMService to call.
+        texts: The full text of each resume.
+        plugins: Extractor plugins by part name (see can_combine).
+        max_concurrency: Maximum number of LLM requests in flight.
+
+    Returns:
+        One entry per text, as returned by extract_combined.
+    """
+    outputs = llm_service.batch_extract_with_llm(
+        CombinedExtraction,
+        COMBINED_PROMPT_TEMPLATE,
+        COMBINED_INPUT_VARIABLES,
+        [_input_data(text) for text in texts],
+        plugin_version=_plugin_version(plugins),
+        max_concurrency=max_concurrency
+    )
+    return [_finish(result, token_usage, plugins) for result, token_usage in outputs]
+
+async def aextract_combined(llm_service: Any, text: str,
+                            plugins: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Extract the profile, skills, education and work experience with one awaited LLM call.
+
+    Args:
+        llm_service: The LLMService to call.
+        text: The full resume text.
+        plugins: Extractor plugins by part name (see can_combine).
+
+    Returns:
+        A tuple of (results by part name, token usage of the call), or None if the
+        call failed and the extractors should run separately.
+    """
+    result, token_usage = await llm_service.aextract_with_llm(
+        CombinedExtraction,
+        COMBINED_PROMPT_TEMPLATE,
+        COMBINED_INPUT_VARIABLES,
+        _input_data(text),
+        plugin_version=_plugin_version(plugins)
+    )
+    return _finish(result, token_usage, plugins)
@@ -15,11 +15,91 @@ DEFAULT_LLM_MODEL = os.environ.get("DEFAULT_LLM_MODEL", "gemini-2.0-flash")
 DATE_FORMAT = constants.DEFAULT_DATE_FORMAT
 
 # PDF processing configuration
-PDF_EXTRACTION_METHOD = "PyPDF2"  # Options: 'PyPDF2', 'custom'
+# Text-extraction backends (see core/utils/extraction_backends.py). Options: 'PyPDF2',
+# 'stdlib' (alias 'custom'), and 'pypdf', 'pdfminer', 'pymupdf' when installed
+PDF_EXTRACTION_METHOD = os.environ.get("PDF_EXTRACTION_METHOD", constants.DEFAULT_PDF_EXTRACTION_METHOD)
+# Backends tried, in order, when the preferred one returns no text (default: stdlib; 'all' tries every available backend)
+PDF_EXTRACTION_FALLBACKS = [name.strip() for name in (os.environ.get("PDF_EXTRACTION_FALLBACKS") or constants.DEFAULT_PDF_EXTRACTION_FALLBACKS).split(",") if name.strip()]
+DOCX_EXTRACTION_METHOD = os.environ.get("DOCX_EXTRACTION_METHOD", constants.DEFAULT_DOCX_EXTRACTION_METHOD)  # Options: 'docx2txt', 'stdlib-docx' (opt-in, its text can differ slightly)
+PDF_PARALLEL_EXTRACTION = os.environ.get("PDF_PARALLEL_EXTRACTION", "False").lower() == "true"
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", str(constants.DEFAULT_PDF_PARALLEL_MIN_PAGES)))
+PDF_PARALLEL_WORKERS = int(os.environ.get("PDF_PARALLEL_WORKERS", str(os.cpu_count() or 1)))
+
+# Memory-map large resume files instead of reading them (validation, hashing and
+# extraction share the mapping instead of a private copy)
+MMAP_READS_ENABLED = os.environ.get("MMAP_READS_ENABLED", "True").lower() == "true"
+MMAP_MIN_SIZE_KB = int(os.environ.get("MMAP_MIN_SIZE_KB", str(constants.DEFAULT_MMAP_MIN_SIZE_KB)))
 
 # File validation
 MAX_PDF_SIZE_MB = constants.MAX_FILE_SIZE_MB  # Maximum PDF file size in MB
 ALLOWED_FILE_EXTENSIONS = constants.RESUME_FILE_EXTENSIONS  # Allowed file extensions
+ALLOWED_ARCHIVE_EXTENSIONS = constants.RESUME_ARCHIVE_EXTENSIONS  # Archives streamed by process_all_resumes and the CLI
+# validate_file only checks file structure unless deep validation (full parse) is enabled
+DEEP_FILE_VALIDATION = os.environ.get("DEEP_FILE_VALIDATION", "False").lower() == "true"
+
+# Strip repeated page headers/footers and collapse whitespace before prompting the extractors.
+# Opt-in: it changes the text the LLM sees, and therefore the extraction output
+TEXT_NORMALIZATION_ENABLED = os.environ.get("TEXT_NORMALIZATION_ENABLED", "False").lower() == "true"
+
+# Feed each extractor only the resume sections it needs (falls back to the full text when unsure).
+# Opt-in: it changes the text the LLM sees, and therefore the extraction output
+SECTION_SEGMENTATION_ENABLED = os.environ.get("SECTION_SEGMENTATION_ENABLED", "False").lower() == "true"
+SECTION_MIN_CHARS = int(os.environ.get("SECTION_MIN_CHARS", str(constants.DEFAULT_SECTION_MIN_CHARS)))
+
+# Send the profile extractor only the first page (retried on the full text when the contact details are incomplete).
+# Opt-in: it changes the text the LLM sees, and therefore the extraction output
+PROFILE_FIRST_PAGE_ONLY = os.environ.get("PROFILE_FIRST_PAGE_ONLY", "False").lower() == "true"
+
+# Reject documents that are clearly not resumes (blank scans, cover letters, invoices) before any LLM call
+RESUME_CLASSIFIER_ENABLED = os.environ.get("RESUME_CLASSIFIER_ENABLED", "False").lower() == "true"
+RESUME_MIN_CHARS = int(os.environ.get("RESUME_MIN_CHARS", str(constants.DEFAULT_RESUME_MIN_CHARS)))
+
+# Chunked (map-reduce) work experience extraction for very long resumes
+EXPERIENCE_CHUNKING_ENABLED = os.environ.get("EXPERIENCE_CHUNKING_ENABLED", "False").lower() == "true"
+EXPERIENCE_CHUNK_TOKENS = int(os.environ.get("EXPERIENCE_CHUNK_TOKENS", str(constants.DEFAULT_EXPERIENCE_CHUNK_TOKENS)))
+EXPERIENCE_CHUNK_WORKERS = int(os.environ.get("EXPERIENCE_CHUNK_WORKERS", str(constants.DEFAULT_EXPERIENCE_CHUNK_WORKERS)))
+
+# Combined extraction: one LLM call returns the profile, skills, education and work
+# experience together (see core/combined_extraction.py) instead of one call per extractor
+COMBINED_EXTRACTION_ENABLED = os.environ.get("COMBINED_EXTRACTION_ENABLED", "False").lower() == "true"
+
+# Extracted text cache (keyed by file content hash + extraction backend)
+TEXT_CACHE_ENABLED = os.environ.get("TEXT_CACHE_ENABLED", "False").lower() == "true"
+TEXT_CACHE_DIR = os.environ.get("TEXT_CACHE_DIR", constants.DEFAULT_TEXT_CACHE_DIR)
+TEXT_CACHE_MAX_SIZE_MB = int(os.environ.get("TEXT_CACHE_MAX_SIZE_MB", str(constants.DEFAULT_TEXT_CACHE_MAX_SIZE_MB)))
+
+# Persistent LLM response cache (keyed by model, prompt template, plugin version and input data)
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "False").lower() == "true"
+LLM_CACHE_PATH = os.environ.get("LLM_CACHE_PATH", constants.DEFAULT_LLM_CACHE_PATH)
+LLM_CACHE_TTL_HOURS = float(os.environ.get("LLM_CACHE_TTL_HOURS", str(constants.DEFAULT_LLM_CACHE_TTL_HOURS)))  # 0: never expire
+LLM_CACHE_MAX_SIZE_MB = int(os.environ.get("LLM_CACHE_MAX_SIZE_MB", str(constants.DEFAULT_LLM_CACHE_MAX_SIZE_MB)))
+
+# Incremental batch processing: skip resumes already processed in their current form
+INCREMENTAL_PROCESSING_ENABLED = os.environ.get("INCREMENTAL_PROCESSING_ENABLED", "True").lower() == "true"
+MANIFEST_PATH = os.environ.get("MANIFEST_PATH")  # Defaults to DEFAULT_MANIFEST_FILENAME in the output directory
+# The manifest is saved every MANIFEST_SAVE_INTERVAL records (or MANIFEST_SAVE_SECONDS) and at the end of a
+# run, so an interrupted run keeps most of its progress without rewriting the file after every resume
+MANIFEST_SAVE_INTERVAL = int(os.environ.get("MANIFEST_SAVE_INTERVAL", str(constants.DEFAULT_MANIFEST_SAVE_INTERVAL)))
+MANIFEST_SAVE_SECONDS = float(os.environ.get("MANIFEST_SAVE_SECONDS", str(constants.DEFAULT_MANIFEST_SAVE_SECONDS)))
+
+# Speculative profile extraction: start the profile extractor on the first page while
+# the remaining pages are parsed (falls back to the full text if no name/email is found)
+SPECULATIVE_PROFILE_ENABLED = os.environ.get("SPECULATIVE_PROFILE_ENABLED", "False").lower() == "true"
+
+# Pipelined batch mode: parse the next resumes while the LLM calls for the current ones run
+PIPELINE_ENABLED = os.environ.get("PIPELINE_ENABLED", "False").lower() == "true"
+PIPELINE_QUEUE_SIZE = int(os.environ.get("PIPELINE_QUEUE_SIZE", str(constants.DEFAULT_PIPELINE_QUEUE_SIZE)))
+PIPELINE_EXTRACT_WORKERS = int(os.environ.get("PIPELINE_EXTRACT_WORKERS", str(constants.DEFAULT_PIPELINE_EXTRACT_WORKERS)))
+
+# Batched LLM calls in batch runs: send each extractor's inputs for a group of resumes through the chain's batch interface
+LLM_BATCH_ENABLED = os.environ.get("LLM_BATCH_ENABLED", "False").lower() == "true"
+LLM_BATCH_SIZE = int(os.environ.get("LLM_BATCH_SIZE", str(constants.DEFAULT_LLM_BATCH_SIZE)))
+LLM_BATCH_MAX_CONCURRENCY = int(os.environ.get("LLM_BATCH_MAX_CONCURRENCY", str(constants.DEFAULT_LLM_BATCH_MAX_CONCURRENCY)))
+
+# Watch-folder mode (cvinsight --resume-dir DIR --watch)
+WATCH_POLL_INTERVAL = float(os.environ.get("WATCH_POLL_INTERVAL", str(constants.DEFAULT_WATCH_POLL_INTERVAL)))
+WATCH_SETTLE_SECONDS = float(os.environ.get("WATCH_SETTLE_SECONDS", str(constants.DEFAULT_WATCH_SETTLE_SECONDS)))
+WATCH_MAX_WORKERS = int(os.environ.get("WATCH_MAX_WORKERS", str(constants.DEFAULT_WATCH_MAX_WORKERS)))
 
 # Directory configuration
 RESUME_DIR = os.environ.get("RESUME_DIR", "./Resumes")
@@ -6,6 +6,51 @@ This file centralizes constants that might otherwise be hardcoded in multiple pl
 # File-related constants
 RESUME_FILE_EXTENSIONS = ['.pdf', '.docx']
 MAX_FILE_SIZE_MB = 10  # Maximum file size in MB
+RESUME_ARCHIVE_EXTENSIONS = ['.zip', '.tar', '.tar.gz', '.tgz']  # Archives of resumes processed in bulk
+
+# Section segmentation constants
+DEFAULT_SECTION_MIN_CHARS = 50  # Sections shorter than this are not trusted and the full text is used
+
+# Resume pre-classifier constants
+DEFAULT_RESUME_MIN_CHARS = 200  # Documents with less text are rejected without calling the LLM
+
+# Chunked work experience extraction constants
+DEFAULT_EXPERIENCE_CHUNK_TOKENS = 1500  # Token budget per experience chunk
+DEFAULT_EXPERIENCE_CHUNK_WORKERS = 4  # Chunks extracted concurrently
+
+# Text extraction cache constants
+DEFAULT_TEXT_CACHE_DIR = "./.cache/text"
+DEFAULT_TEXT_CACHE_MAX_SIZE_MB = 256
+
+# LLM response cache constants
+DEFAULT_LLM_CACHE_PATH = "./.cache/llm_responses.sqlite3"
+DEFAULT_LLM_CACHE_TTL_HOURS = 168  # One week
+DEFAULT_LLM_CACHE_MAX_SIZE_MB = 64
+
+# Incremental batch processing constants
+DEFAULT_MANIFEST_FILENAME = ".cvinsight_manifest.json"  # Written to the output directory
+DEFAULT_MANIFEST_SAVE_INTERVAL = 25  # Records between manifest saves during a run
+DEFAULT_MANIFEST_SAVE_SECONDS = 30.0  # Save at the next record once this long has passed since the last save
+
+# Pipelined batch processing constants
+DEFAULT_PIPELINE_QUEUE_SIZE = 4  # Parsed documents waiting for the extractors (and results waiting to be saved)
+DEFAULT_PIPELINE_EXTRACT_WORKERS = 2  # Resumes whose LLM calls run at the same time
+
+# Batched LLM invocation constants
+DEFAULT_LLM_BATCH_SIZE = 16  # Resumes whose inputs are sent to each extractor in one batch
+DEFAULT_LLM_BATCH_MAX_CONCURRENCY = 8  # LLM requests of an extractor batch in flight at the same time
+
+# Watch-folder constants
+DEFAULT_WATCH_POLL_INTERVAL = 1.0  # Seconds between scans of the resume directory
+DEFAULT_WATCH_SETTLE_SECONDS = 2.0  # A file must stay unchanged this long before it is processed
+DEFAULT_WATCH_MAX_WORKERS = 4  # Resumes processed concurrently
+
+# Text extraction constants
+DEFAULT_MMAP_MIN_SIZE_KB = 1024  # Smaller files are cheaper to read() than to map
+DEFAULT_PDF_EXTRACTION_METHOD = "PyPDF2"
+DEFAULT_DOCX_EXTRACTION_METHOD = "docx2txt"
+DEFAULT_PDF_EXTRACTION_FALLBACKS = "stdlib"
+DEFAULT_PDF_PARALLEL_MIN_PAGES = 30  # Only split documents with at least this many pages
 
 # Date-related constants
 DEFAULT_DATE_FORMAT = "%d/%m/%Y"
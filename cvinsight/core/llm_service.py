@@ -2,23 +2,91 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.schema import LLMResult
 from functools import lru_cache
 from . import config
-from typing import Type, Any, Dict, Tuple, Optional
+from typing import Type, Any, Dict, List, Tuple, Optional
 from pydantic import BaseModel
+from .utils.llm_cache import LLMResponseCache, get_llm_cache
 import logging
 import os
+import threading
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """Callback handler that collects the token usage of an LLM call."""
+    
+    def __init__(self):
+        super().__init__()
+        self.token_usage = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "source": "not_set"
+        }
+        
+    def on_llm_end(self, response: LLMResult, **kwargs) -> None:
+        """Extract token usage from the LLM response."""
+        # First check for usage_metadata in the generations (specific to Gemini via langchain_google_genai)
+        token_found = False
+        if hasattr(response, "generations") and response.generations:
+            for gen_list in response.generations:
+                for gen in gen_list:
+                    # Check for usage_metadata (Gemini's specific location for token info)
+                    if hasattr(gen, "usage_metadata") and gen.usage_metadata:
+                        usage = gen.usage_metadata
+                        self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
+                        self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)  # Gemini uses input_tokens
+                        self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)  # Gemini uses output_tokens
+                        self.token_usage["source"] = "usage_metadata"
+                        token_found = True
+                        logging.info(f"Token usage found in usage_metadata: {usage}")
+                        return
+                    
+                    # Check for usage_metadata in generation's message (alternate location)
+                    if hasattr(gen, "message") and hasattr(gen.message, "usage_metadata") and gen.message.usage_metadata:
+                        usage = gen.message.usage_metadata
+                        self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
+                        self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)
+                        self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)
+                        self.token_usage["source"] = "message_usage_metadata"
+                        token_found = True
+                        logging.info(f"Token usage found in message usage_metadata: {usage}")
+                        return
+                        
+                    # Fall back to checking in generation_info
+                    if hasattr(gen, "generation_info") and gen.generation_info:
+                        usage = gen.generation_info.get("token_usage", {})
+                        if usage:
+                            self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
+                            self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0) 
+                            self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
+                            self.token_usage["source"] = "generation_info"
+                            token_found = True
+        
+        # Check for token usage in llm_output (standard location)
+        if not token_found and hasattr(response, "llm_output") and response.llm_output:
+            usage = response.llm_output.get("token_usage", {})
+            if usage:
+                self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
+                self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0)
+                self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
+                self.token_usage["source"] = "llm_output"
 
 class LLMService:
     """Service for interacting with LLM API."""
     
-    def __init__(self, model_name=None, api_key=None):
+    def __init__(self, model_name=None, api_key=None, response_cache=None, bypass_cache=False, refresh_cache=False):
         """
         Initialize the LLM service.
         
         Args:
             model_name: The name of the model to use. Defaults to config.DEFAULT_LLM_MODEL.
             api_key: The API key to use. If None, will use config.GOOGLE_API_KEY
+            response_cache: The LLMResponseCache for extraction responses. Defaults to
+                            the shared cache (if config.LLM_CACHE_ENABLED).
+            bypass_cache: Neither read nor write the response cache.
+            refresh_cache: Always call the LLM, replacing the cached responses.
         """
         self.model_name = model_name or config.DEFAULT_LLM_MODEL
         self.api_key = api_key or config.GOOGLE_API_KEY or os.environ.get("GOOGLE_API_KEY")
@@ -27,6 +95,12 @@ class LLMService:
             raise ValueError("Google API key is required. Either provide it directly to LLMService or set the GOOGLE_API_KEY environment variable.")
             
         self.llm = self._get_llm()
+        self.response_cache = response_cache if response_cache is not None else get_llm_cache()
+        self.bypass_cache = bypass_cache
+        self.refresh_cache = refresh_cache
+        # Compiled chains by (model, Pydantic model, prompt template, input variables)
+        self._chains = {}
+        self._chains_lock = threading.Lock()
     
     def _get_llm(self):
         """
@@ -59,16 +133,47 @@ class LLMService:
         
         return prompt | self.llm | parser
     
+    def get_extraction_chain(self, pydantic_model: Type[BaseModel], prompt_template: str, input_variables: list):
+        """
+        Get the extraction chain for a model and prompt, compiling it on first use.
+        
+        Building a chain regenerates the JSON schema format instructions and the
+        prompt template, so each distinct chain is built once per service and
+        reused for every later call.
+        
+        Args:
+            pydantic_model: The Pydantic model to use for parsing the output.
+            prompt_template: The prompt template to use.
+            input_variables: The list of input variables for the prompt template.
+            
+        Returns:
+            A chain that can be used to extract information.
+        """
+        key = (self.model_name, pydantic_model, prompt_template, tuple(input_variables))
+        chain = self._chains.get(key)
+        if chain is None:
+            with self._chains_lock:
+                chain = self._chains.get(key)
+                if chain is None:
+                    chain = self.create_extraction_chain(pydantic_model, prompt_template, input_variables)
+                    self._chains[key] = chain
+        return chain
+    
     def extract_with_llm(self, pydantic_model: Type[BaseModel], prompt_template: str, 
-                        input_variables: list, input_data: dict) -> Tuple[Any, Dict[str, int]]:
+                        input_variables: list, input_data: dict,
+                        plugin_version: Optional[str] = None) -> Tuple[Any, Dict[str, int]]:
         """
         Extract information from text using a language model.
         
+        Responses are served from the response cache when one is configured; a
+        cache hit costs no tokens and reports the tokens it saved.
+        
         Args:
             pydantic_model: The Pydantic model to use for parsing the output.
             prompt_template: The prompt template to use.
             input_variables: The list of input variables for the prompt template.
             input_data: The input data to pass to the prompt template.
+            plugin_version: Version of the calling plugin, part of the cache key.
             
         Returns:
             A tuple containing:
@@ -76,116 +181,189 @@ class LLMService:
             - A dictionary with token usage information
         """
         try:
-            # Initialize token usage
-            token_usage = {
-                "total_tokens": 0,
-                "prompt_tokens": 0,
-                "completion_tokens": 0
-            }
-            
-            # Create a custom callback handler to track token usage
-            from langchain.callbacks.base import BaseCallbackHandler
-            from langchain.schema import LLMResult
-            
-            class TokenUsageCallbackHandler(BaseCallbackHandler):
-                def __init__(self):
-                    super().__init__()
-                    self.token_usage = {
-                        "total_tokens": 0,
-                        "prompt_tokens": 0,
-                        "completion_tokens": 0,
-                        "source": "not_set"
-                    }
-                    
-                def on_llm_end(self, response: LLMResult, **kwargs) -> None:
-                    """Extract token usage from the LLM response."""
-                    # First check for usage_metadata in the generations (specific to Gemini via langchain_google_genai)
-                    token_found = False
-                    if hasattr(response, "generations") and response.generations:
-                        for gen_list in response.generations:
-                            for gen in gen_list:
-                                # Check for usage_metadata (Gemini's specific location for token info)
-                                if hasattr(gen, "usage_metadata") and gen.usage_metadata:
-                                    usage = gen.usage_metadata
-                                    self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
-                                    self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)  # Gemini uses input_tokens
-                                    self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)  # Gemini uses output_tokens
-                                    self.token_usage["source"] = "usage_metadata"
-                                    token_found = True
-                                    logging.info(f"Token usage found in usage_metadata: {usage}")
-                                    return
-                                
-                                # Check for usage_metadata in generation's message (alternate location)
-                                if hasattr(gen, "message") and hasattr(gen.message, "usage_metadata") and gen.message.usage_metadata:
-                                    usage = gen.message.usage_metadata
-                                    self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
-                                    self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)
-                                    self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)
-                                    self.token_usage["source"] = "message_usage_metadata"
-                                    token_found = True
-                                    logging.info(f"Token usage found in message usage_metadata: {usage}")
-                                    return
-                                    
-                                # Fall back to checking in generation_info
-                                if hasattr(gen, "generation_info") and gen.generation_info:
-                                    usage = gen.generation_info.get("token_usage", {})
-                                    if usage:
-                                        self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
-                                        self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0) 
-                                        self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
-                                        self.token_usage["source"] = "generation_info"
-                                        token_found = True
-                    
-                    # Check for token usage in llm_output (standard location)
-                    if not token_found and hasattr(response, "llm_output") and response.llm_output:
-                        usage = response.llm_output.get("token_usage", {})
-                        if usage:
-                            self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
-                            self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0)
-                            self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
-                            self.token_usage["source"] = "llm_output"
+            cache_key, cached = self._cached_response(pydantic_model, prompt_template, plugin_version, input_data)
+            if cached is not None:
+                return cached
             
             # Use the custom callback to track token usage
             callback_handler = TokenUsageCallbackHandler()
             
-            # Create the chain and include our callback
-            chain = self.create_extraction_chain(pydantic_model, prompt_template, input_variables)
+            # Reuse the compiled chain and include our callback
+            chain = self.get_extraction_chain(pydantic_model, prompt_template, input_variables)
             
             # Invoke the chain with our custom callback
-            from langchain.callbacks.manager import CallbackManager
             result = chain.invoke(input_data, config={"callbacks": [callback_handler]})
             
-            # Get token usage from callback
-            token_usage = callback_handler.token_usage
-            
-            # Estimate tokens if we couldn't get accurate counts
-            if token_usage["total_tokens"] == 0:
-                # Estimate based on text length
-                prompt_text = prompt_template.format(**input_data)
-                # Rough estimate: 4 chars per token
-                estimated_prompt_tokens = len(prompt_text) // 4
-                estimated_completion_tokens = len(str(result)) // 4
-                
-                token_usage["prompt_tokens"] = estimated_prompt_tokens
-                token_usage["completion_tokens"] = estimated_completion_tokens
-                token_usage["total_tokens"] = estimated_prompt_tokens + estimated_completion_tokens
-                token_usage["is_estimated"] = True
-                token_usage["source"] = "estimation"
-                logging.info(f"Token counts are estimated. No token information provided by API.")
-            
-            # Convert Pydantic model to dictionary (for consistency)
-            if isinstance(result, pydantic_model):
-                return result.model_dump(), token_usage
-            elif isinstance(result, dict):
-                return result, token_usage
-            elif hasattr(result, "__dict__"):
-                return result.__dict__, token_usage
-                
-            # If we got here, something unexpected happened. Return an empty dict.
-            return {}, token_usage
+            return self._finish_extraction(chain, pydantic_model, prompt_template, input_data,
+                                           result, callback_handler.token_usage, cache_key)
             
         except Exception as e:
             print(f"Error extracting information with LLM: {e}")
             # Return an empty dictionary and empty token usage
             empty_token_usage = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "error"}
-            return {}, empty_token_usage 
\ No newline at end of file
+            return {}, empty_token_usage
+    
+    async def aextract_with_llm(self, pydantic_model: Type[BaseModel], prompt_template: str,
+                                input_variables: list, input_data: dict,
+                                plugin_version: Optional[str] = None) -> Tuple[Any, Dict[str, int]]:
+        """
+        Extract information from text using a language model, asynchronously.
+        
+        Same as extract_with_llm, but the chain is awaited with ainvoke, so many
+        calls can be in flight on one event loop without a thread each.
+        
+        Args:
+            pydantic_model: The Pydantic model to use for parsing the output.
+            prompt_template: The prompt template to use.
+            input_variables: The list of input variables for the prompt template.
+            input_data: The input data to pass to the prompt template.
+            plugin_version: Version of the calling plugin, part of the cache key.
+            
+        Returns:
+            A tuple of (extracted information, token usage), as extract_with_llm.
+        """
+        try:
+            cache_key, cached = self._cached_response(pydantic_model, prompt_template, plugin_version, input_data)
+            if cached is not None:
+                return cached
+            
+            callback_handler = TokenUsageCallbackHandler()
+            chain = self.get_extraction_chain(pydantic_model, prompt_template, input_variables)
+            result = await chain.ainvoke(input_data, config={"callbacks": [callback_handler]})
+            
+            return self._finish_extraction(chain, pydantic_model, prompt_template, input_data,
+                                           result, callback_handler.token_usage, cache_key)
+            
+        except Exception as e:
+            logging.error(f"Error extracting information with LLM: {e}")
+            empty_token_usage = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "error"}
+            return {}, empty_token_usage
+    
+    def batch_extract_with_llm(self, pydantic_model: Type[BaseModel], prompt_template: str,
+                               input_variables: list, inputs: List[dict],
+                               plugin_version: Optional[str] = None,
+                               max_concurrency: Optional[int] = None) -> List[Tuple[Any, Dict[str, int]]]:
+        """
+        Extract information from many inputs with one batched chain call.
+        
+        Inputs served from the response cache are not sent; the others go
+        through the chain's batch interface with at most max_concurrency
+        requests in flight, so throughput is bounded by the API quota rather
+        than by one call after another. A failed input does not fail the batch.
+        
+        Args:
+            pydantic_model: The Pydantic model to use for parsing the output.
+            prompt_template: The prompt template to use.
+            input_variables: The list of input variables for the prompt template.
+            inputs: The input data of each call.
+            plugin_version: Version of the calling plugin, part of the cache key.
+            max_concurrency: Maximum number of requests in flight. Defaults to
+                             config.LLM_BATCH_MAX_CONCURRENCY.
+        
+        Returns:
+            A list of (extracted information, token usage) tuples, one per input
+            and in the same order, as extract_with_llm.
+        """
+        outputs = [None] * len(inputs)
+        pending = []
+        for index, input_data in enumerate(inputs):
+            cache_key, cached = self._cached_response(pydantic_model, prompt_template, plugin_version, input_data)
+            if cached is not None:
+                outputs[index] = cached
+            else:
+                pending.append((index, cache_key))
+        if not pending:
+            return outputs
+        
+        chain = self.get_extraction_chain(pydantic_model, prompt_template, input_variables)
+        max_concurrency = max(1, max_concurrency or config.LLM_BATCH_MAX_CONCURRENCY)
+        handlers = [TokenUsageCallbackHandler() for _ in pending]
+        configs = [{"callbacks": [handler], "max_concurrency": max_concurrency} for handler in handlers]
+        try:
+            results = chain.batch([inputs[index] for index, _ in pending], config=configs, return_exceptions=True)
+        except Exception as e:
+            results = [e] * len(pending)
+        
+        for (index, cache_key), handler, result in zip(pending, handlers, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                outputs[index] = self._finish_extraction(chain, pydantic_model, prompt_template, inputs[index],
+                                                         result, handler.token_usage, cache_key)
+            except Exception as e:
+                logging.error(f"Error extracting information with LLM (batch item {index}): {e}")
+                empty_token_usage = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "error"}
+                outputs[index] = ({}, empty_token_usage)
+        return outputs
+    
+    def _cached_response(self, pydantic_model: Type[BaseModel], prompt_template: str,
+                         plugin_version: Optional[str], input_data: dict) -> Tuple[Optional[str], Optional[Tuple[Any, Dict[str, Any]]]]:
+        """
+        Look up an extraction call in the response cache.
+        
+        Returns:
+            A tuple of (cache key, or None if the cache is not used; the cached
+            (result, token usage), or None on a miss or refresh).
+        """
+        if self.response_cache is None or self.bypass_cache:
+            return None, None
+        cache_key = LLMResponseCache.make_key(self.model_name, pydantic_model, prompt_template,
+                                              plugin_version, input_data)
+        cached = None if self.refresh_cache else self.response_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        
+        result, cached_usage = cached
+        logging.info("LLM response served from cache")
+        return cache_key, (result, {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "source": "cache",
+            "saved_tokens": cached_usage.get("total_tokens", 0)
+        })
+    
+    def _finish_extraction(self, chain: Any, pydantic_model: Type[BaseModel], prompt_template: str,
+                           input_data: dict, result: Any, token_usage: Dict[str, Any],
+                           cache_key: Optional[str]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Estimate missing token counts, convert the result to a dictionary and cache it.
+        
+        Returns:
+            A tuple of (extracted information, token usage).
+        """
+        # Estimate tokens if we couldn't get accurate counts
+        if token_usage["total_tokens"] == 0:
+            # Estimate based on text length
+            # The compiled prompt fills in the format instructions too
+            prompt = getattr(chain, 'first', None)
+            if isinstance(prompt, PromptTemplate):
+                prompt_text = prompt.format(**input_data)
+            else:
+                prompt_text = prompt_template.format(**input_data)
+            # Rough estimate: 4 chars per token
+            estimated_prompt_tokens = len(prompt_text) // 4
+            estimated_completion_tokens = len(str(result)) // 4
+            
+            token_usage["prompt_tokens"] = estimated_prompt_tokens
+            token_usage["completion_tokens"] = estimated_completion_tokens
+            token_usage["total_tokens"] = estimated_prompt_tokens + estimated_completion_tokens
+            token_usage["is_estimated"] = True
+            token_usage["source"] = "estimation"
+            logging.info(f"Token counts are estimated. No token information provided by API.")
+        
+        # Convert Pydantic model to dictionary (for consistency)
+        if isinstance(result, pydantic_model):
+            result = result.model_dump()
+        elif isinstance(result, dict):
+            pass
+        elif hasattr(result, "__dict__"):
+            result = result.__dict__
+        else:
+            # If we got here, something unexpected happened. Return an empty dict.
+            return {}, token_usage
+        
+        # Empty results are not cached, so a retry asks the LLM again
+        if cache_key is not None and result:
+            self.response_cache.put(cache_key, self.model_name, result, token_usage)
+        return result, token_usage
@@ -1,21 +1,29 @@
 import os
+import time
+import asyncio
 import logging
 import concurrent.futures
+import threading
+import queue
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Union, BinaryIO, Iterator
 from ..models.resume_models import Resume
-from ..plugins.base import PluginMetadata, PluginCategory
+from ..plugins.base import PluginMetadata, PluginCategory, InputWindow, ExtractorPlugin
 from . import config
 from . import constants
 
+# Default of the text_cache argument: use the shared cache; an explicit None or False disables caching
+_SHARED_TEXT_CACHE = object()
+
 class PluginResumeProcessor:
     """
     Class for processing resumes using the plugin system.
     """
     
     def __init__(self, resume_dir: str = "./Resumes", output_dir: str = "./Results", 
-                 log_dir: str = "./logs/token_usage", plugin_manager: Optional[Any] = None):
+                 log_dir: str = "./logs/token_usage", plugin_manager: Optional[Any] = None,
+                 text_cache: Any = _SHARED_TEXT_CACHE, manifest_path: Optional[str] = None):
         """
         Initialize the PluginResumeProcessor.
         
@@ -24,11 +32,35 @@ class PluginResumeProcessor:
             output_dir: Directory to save processed results
             log_dir: Directory to save token usage logs
             plugin_manager: The plugin manager to use, or None to create a new one
+            text_cache: The TextCache for extracted text, or None/False to disable it.
+                        Defaults to the shared cache from config (disabled unless
+                        TEXT_CACHE_ENABLED is set)
+            manifest_path: Path of the batch processing manifest, or None to use
+                           config.MANIFEST_PATH (default: a file in output_dir)
         """
+        from .utils.text_cache import get_text_cache
+        
         self.resume_dir = resume_dir
         self.output_dir = output_dir
         self.log_dir = log_dir
         self.plugin_manager = plugin_manager
+        if text_cache is _SHARED_TEXT_CACHE:
+            text_cache = get_text_cache()
+        self.text_cache = text_cache if text_cache is not False else None
+        self.manifest_path = manifest_path or config.MANIFEST_PATH or os.path.join(
+            output_dir, constants.DEFAULT_MANIFEST_FILENAME)
+        self.manifest = None
+        self.run_stats = {"processed": 0, "skipped": 0, "rejected": 0, "errors": 0}
+        # Guards run_stats and the manifest when resumes are processed concurrently
+        self._lock = threading.Lock()
+        # Serializes manifest saves, taken before _lock so snapshots are written in order
+        self._save_lock = threading.Lock()
+        self._unsaved_records = 0
+        self._last_save = 0.0
+        # Plugin versions of the run started with begin_run
+        self._run_plugin_versions = None
+        # Output settings of the current batch run, checked and recorded with plugin versions
+        self._run_settings = None
         
         # Ensure output directories exist
         os.makedirs(self.output_dir, exist_ok=True)
@@ -36,169 +68,1298 @@ class PluginResumeProcessor:
     
     def get_resume_files(self) -> List[str]:
         """
-        Get all resume files in the resume directory.
+        Get all resume files and resume archives in the resume directory.
         
         Returns:
-            A list of resume file names
+            A list of resume and archive file names
         """
+        from .utils.archive_utils import is_archive
+        
         if not os.path.exists(self.resume_dir):
             logging.error(f"Error: Directory not found at {self.resume_dir}")
             return []
         
-        # Get all PDF files in the directory
+        # Get all PDF/DOCX files and archives in the directory
         return [f for f in os.listdir(self.resume_dir) 
-                if os.path.splitext(f)[1].lower() in config.ALLOWED_FILE_EXTENSIONS]
+                if os.path.splitext(f)[1].lower() in config.ALLOWED_FILE_EXTENSIONS or is_archive(f)]
     
-    def process_resume(self, pdf_file_path: str) -> Optional[Resume]:
+    def process_resume(self, pdf_file_path: Union[str, bytes, memoryview, BinaryIO],
+                       file_name: Optional[str] = None, speculative: Optional[bool] = None) -> Optional[Resume]:
         """
         Process a single resume file using plugins.
         
         Args:
-            pdf_file_path: Path to the PDF resume file.
+            pdf_file_path: Path to the PDF/DOCX resume file, or its contents as
+                           bytes, memoryview, a binary file object or an iterable
+                           of byte chunks (uploads are read with MAX_FILE_SIZE_MB
+                           enforced as the bytes arrive).
+            file_name: Optional file name for in-memory resumes (used to detect the
+                       type and to name the results)
+            speculative: Start the profile extraction on the first page while the
+                         remaining pages are parsed. Defaults to
+                         config.SPECULATIVE_PROFILE_ENABLED. Not used when the
+                         pre-classifier or combined mode is enabled.
             
         Returns:
             A Resume object with extracted information or None if processing failed.
         """
-        from .utils.file_utils import read_file, validate_file
+        if config.RESUME_CLASSIFIER_ENABLED or config.COMBINED_EXTRACTION_ENABLED:
+            # A rejected resume or the combined call would discard the first-page extraction
+            speculative = False
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            early_profile = []
+            on_first_page = self._speculative_profile_starter(executor, early_profile, speculative)
+            document = self._open_document(pdf_file_path, file_name, on_first_page=on_first_page)
+            if document is None:
+                for future in early_profile:
+                    self._discard_speculation(future, "the resume could not be read")
+                return None
+            with document:
+                return self.process_document(document, early_profile=early_profile[0] if early_profile else None)
+    
+    def extract_profile(self, source: Union[str, bytes, memoryview, BinaryIO],
+                        file_name: Optional[str] = None,
+                        speculative: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """
+        Extract only the profile information (name, contact details) from a resume.
         
-        file_basename = os.path.basename(pdf_file_path)
+        In speculative mode the profile extractor starts on the first page while
+        the remaining pages are parsed, so interactive callers get the profile
+        after roughly one LLM call instead of a full parse plus the LLM call.
         
-        # Validate the file
-        is_valid, message = validate_file(pdf_file_path)
-        if not is_valid:
-            logging.error(f"Validation failed for {file_basename}: {message}")
+        Args:
+            source: Path to the resume, or its contents.
+            file_name: Optional file name for in-memory resumes.
+            speculative: Start on the first page. Defaults to config.SPECULATIVE_PROFILE_ENABLED.
+            
+        Returns:
+            The profile extractor's output, or None if the resume cannot be read.
+        """
+        profile_plugin = self.plugin_manager.get_plugin("profile_extractor")
+        if profile_plugin is None:
             return None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            early_profile = []
+            on_first_page = self._speculative_profile_starter(executor, early_profile, speculative)
+            document = self._open_document(source, file_name, on_first_page=on_first_page)
+            if document is None:
+                for future in early_profile:
+                    self._discard_speculation(future, "the resume could not be read")
+                return None
+            with document:
+                text = self._normalized_text(document)[0]
+                # Build the same input process_resume would send the profile extractor
+                sections = None
+                if config.SECTION_SEGMENTATION_ENABLED:
+                    from .utils.section_segmenter import segment_sections
+                    sections = segment_sections(text)
+                page_texts = None
+                if isinstance(self._input_window_for(profile_plugin), InputWindow):
+                    page_texts = self._page_texts(document)
+                profile_text = self._input_text_for(profile_plugin, text, sections, page_texts)
+            profile, _, _ = self._resolve_profile(profile_plugin, early_profile[0] if early_profile else None,
+                                                  profile_text, text)
+            return profile
+    
+    def _speculative_profile_starter(self, executor: concurrent.futures.Executor, futures: List[Any],
+                                     speculative: Optional[bool]) -> Optional[Any]:
+        """
+        Build the open_document callback that starts the profile extraction on the first page.
+        
+        Args:
+            executor: Executor to run the profile extraction on.
+            futures: List the started future is appended to.
+            speculative: Whether speculation is enabled, or None to use config.
+            
+        Returns:
+            The callback, or None if speculation is disabled or there is no profile extractor.
+        """
+        if speculative is None:
+            speculative = config.SPECULATIVE_PROFILE_ENABLED
+        profile_plugin = self.plugin_manager.get_plugin("profile_extractor") if speculative else None
+        if profile_plugin is None:
+            return None
+        
+        def start(first_page: str) -> None:
+            if config.TEXT_NORMALIZATION_ENABLED:
+                from .utils.text_normalizer import normalize_pages
+                first_page = normalize_pages([first_page])[0]
+            if first_page.strip():
+                logging.debug(f"Starting profile extraction on the first page ({len(first_page)} chars)")
+                futures.append(executor.submit(self._speculate_profile, profile_plugin, first_page))
+        return start
+    
+    def _speculate_profile(self, profile_plugin: Any, first_page: str
+                           ) -> Tuple[Dict[str, Any], Dict[str, Any], str]:
+        """Run the profile extractor on the first page; returns (profile, token usage, first page)."""
+        profile, token_usage = profile_plugin.extract(first_page)
+        return profile, token_usage, first_page
+    
+    def _discard_speculation(self, early_profile: Any, reason: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a speculative profile extraction that is no longer needed.
         
+        An extraction that is already running cannot be cancelled, so it is
+        waited for and its token usage is logged and returned.
+        
+        Args:
+            early_profile: Future of the first-page extraction.
+            reason: Why the extraction is discarded, for the log message.
+            
+        Returns:
+            The token usage of the discarded call, or None if it never ran.
+        """
+        if early_profile.cancel():
+            return None
         try:
-            logging.info(f"Extracting text from {file_basename}")
-            # Extract text from the resume
-            extracted_text = read_file(pdf_file_path)
-            
-            logging.info(f"Extracting information using plugins from {file_basename}")
-            
-            # Initialize token usage dictionary
-            total_token_usage = {
-                "total_tokens": 0,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "by_extractor": {},
-                "source": "plugins"
-            }
+            _, token_usage, _ = early_profile.result()
+        except Exception as e:
+            logging.warning(f"Speculative profile extraction failed: {e}")
+            return None
+        logging.info(f"Discarded the speculative profile extraction because {reason} "
+                     f"({token_usage.get('total_tokens', 0)} tokens)")
+        return token_usage
+    
+    def _resolve_profile(self, profile_plugin: Any, early_profile: Optional[Any], text: str,
+                         extracted_text: str) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Get the profile from a speculative first-page extraction, or from the extractor's input.
+        
+        A result taken from less than the full text (the speculative first page,
+        or the extractor's page window) is accepted when it has the candidate's
+        contact details; otherwise the extraction is repeated once on the full text.
+        
+        Args:
+            profile_plugin: The profile extractor plugin.
+            early_profile: Future of the first-page extraction, or None.
+            text: The text the profile extractor would receive.
+            extracted_text: The full resume text.
             
-            # Get all extractor plugins
-            extractor_plugins = self.plugin_manager.get_extractor_plugins()
+        Returns:
+            A tuple of (profile, token usage, speculation report or None).
+        """
+        if early_profile is None:
+            profile, token_usage = profile_plugin.extract(text)
+            speculation = None
+        else:
+            profile, token_usage, text = early_profile.result()
+            speculation = {"accepted": True}
+        
+        if self._needs_full_text_profile(profile, text, extracted_text):
+            profile, retry_usage = profile_plugin.extract(extracted_text)
+            token_usage = self._add_retry_usage(token_usage, retry_usage)
+            if speculation is not None:
+                speculation = {"accepted": False}
+        return profile, token_usage, speculation
+    
+    def _profile_complete(self, profile: Any) -> bool:
+        """Check whether a profile result has the candidate's name, email and phone."""
+        return bool(profile) and all(profile.get(field) for field in ("name", "email", "phone"))
+    
+    def _needs_full_text_profile(self, profile: Any, text: str, extracted_text: str) -> bool:
+        """
+        Check whether the profile should be extracted again from the full text.
+        
+        Contact details are often only partly on the first page (e.g. a phone
+        number in a footer on the last page), so a result from a narrowed input
+        missing the name, email or phone is not trusted.
+        
+        Args:
+            profile: The profile extracted from the narrowed input.
+            text: The input the profile extractor received.
+            extracted_text: The full resume text.
             
-            # Log which plugins we're using
-            logging.info(f"Using {len(extractor_plugins)} extractor plugins: {', '.join(extractor_plugins.keys())}")
-            
-            # Specifically get the plugins we need
-            profile_plugin = self.plugin_manager.get_plugin("profile_extractor")
-            skills_plugin = self.plugin_manager.get_plugin("skills_extractor")
-            education_plugin = self.plugin_manager.get_plugin("education_extractor")
-            experience_plugin = self.plugin_manager.get_plugin("experience_extractor")
-            yoe_plugin = self.plugin_manager.get_plugin("yoe_extractor")
-            
-            # Extract information concurrently using plugins (except for experience and YoE)
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_profile = executor.submit(profile_plugin.extract, extracted_text) if profile_plugin else None
-                future_skills = executor.submit(skills_plugin.extract, extracted_text) if skills_plugin else None
-                future_education = executor.submit(education_plugin.extract, extracted_text) if education_plugin else None
-                
-                # Get results and token usage for profile, skills, and education
-                profile, profile_token_usage = future_profile.result() if future_profile else ({}, {})
-                skills, skills_token_usage = future_skills.result() if future_skills else ({}, {})
-                education, education_token_usage = future_education.result() if future_education else ({}, {})
+        Returns:
+            True if the input was narrowed and the name, email or phone is missing.
+        """
+        if text == extracted_text or self._profile_complete(profile):
+            return False
+        logging.info("Contact details incomplete in the profile extractor's input, extracting from the full text")
+        return True
+    
+    def _add_retry_usage(self, token_usage: Dict[str, Any], retry_usage: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the token usage of a retried extraction to the usage of the first attempt."""
+        combined_usage = dict(retry_usage)
+        for key in ("total_tokens", "prompt_tokens", "completion_tokens"):
+            combined_usage[key] = token_usage.get(key, 0) + retry_usage.get(key, 0)
+        return combined_usage
+    
+    def _normalized_text(self, document: Any) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Get the text the extractors receive for a document.
+        
+        Returns:
+            A tuple of (text, normalization stats or None if normalization is disabled).
+        """
+        if not config.TEXT_NORMALIZATION_ENABLED:
+            return document.text, None
+        from .utils.text_normalizer import normalize_pages
+        return normalize_pages(document.pages)
+    
+    def _open_document(self, source: Union[str, bytes, memoryview, BinaryIO],
+                       file_name: Optional[str] = None, on_first_page: Optional[Any] = None) -> Optional[Any]:
+        """
+        Open, validate and parse a resume in a single pass.
+        
+        Args:
+            source: Path to the resume, or its contents.
+            file_name: Optional file name for in-memory resumes.
+            on_first_page: Optional callback passed on to open_document.
             
-            # Run experience extractor first
-            experience, experience_token_usage = experience_plugin.extract(extracted_text) if experience_plugin else ({}, {})
+        Returns:
+            The ResumeDocument, or None if the file is invalid or cannot be parsed.
+        """
+        from .utils.file_utils import open_document, describe_source
+        
+        file_basename = describe_source(source, file_name)
+        logging.info(f"Extracting text from {file_basename}")
+        try:
+            return open_document(source, cache=self.text_cache, file_name=file_name, on_first_page=on_first_page)
+        except ValueError as e:
+            logging.error(f"Validation failed for {file_basename}: {e}")
+        except Exception as e:
+            logging.exception(f"Error processing resume {file_basename}: {e}")
+        return None
+    
+    def process_document(self, document: Any, early_profile: Optional[Any] = None) -> Optional[Resume]:
+        """
+        Process an already opened resume document using plugins.
+        
+        Args:
+            document: A ResumeDocument returned by open_document.
+            early_profile: Future of a profile extraction already started on the
+                           first page (see process_resume), or None.
+            
+        Returns:
+            A Resume object with extracted information or None if processing failed
+            or the pre-classifier rejected the document (see document.rejection).
+        """
+        file_basename = document.file_name
+        
+        try:
+            prepared = self._prepare_extraction(document)
+            if prepared is None:
+                if early_profile is not None:
+                    self._discard_speculation(early_profile, "the resume was rejected")
+                return None
+            extracted_text, _, _, _, plugins = prepared
+            profile_plugin, yoe_plugin = plugins[0], plugins[4]
+            
+            speculation = None
+            combined = None
+            combined_plugins = self._combined_plugins(plugins)
+            if combined_plugins is not None:
+                from .combined_extraction import extract_combined
+                if early_profile is not None:
+                    # The combined call extracts the profile too
+                    discarded_usage = self._discard_speculation(early_profile, "the combined call extracts the profile")
+                    early_profile = None
+                    if discarded_usage is not None:
+                        speculation = {"accepted": False, "discarded": True,
+                                       **{key: discarded_usage.get(key, 0)
+                                          for key in ("total_tokens", "prompt_tokens", "completion_tokens")}}
+                combined = extract_combined(profile_plugin.llm_service, extracted_text, combined_plugins)
+            
+            if combined is not None:
+                results, combined_usage = combined
+                self._use_full_text(prepared, combined_plugins)
+            else:
+                results, separate_speculation = self._extract_separately(prepared, early_profile)
+                speculation = separate_speculation or speculation
+                combined_usage = None
             
             # Then run YoE extractor with experience data
-            yoe, yoe_token_usage = yoe_plugin.extract(experience) if yoe_plugin else ({}, {})
+            results["yoe"] = yoe_plugin.extract(results["experience"][0]) if yoe_plugin else ({}, {})
             
             logging.debug(f"Extraction completed for {file_basename}")
+            return self._assemble_resume(document, prepared, results, speculation, combined_usage)
             
-            # Aggregate token usage
-            for extractor_name, extractor_usage in [
-                ("profile", profile_token_usage),
-                ("skills", skills_token_usage),
-                ("education", education_token_usage),
-                ("experience", experience_token_usage),
-                ("yoe", yoe_token_usage)
-            ]:
-                if extractor_usage:
-                    total_token_usage["total_tokens"] += extractor_usage.get("total_tokens", 0)
-                    total_token_usage["prompt_tokens"] += extractor_usage.get("prompt_tokens", 0)
-                    total_token_usage["completion_tokens"] += extractor_usage.get("completion_tokens", 0)
-                    
-                    # Store by extractor for detailed breakdown
-                    total_token_usage["by_extractor"][extractor_name] = {
-                        "total_tokens": extractor_usage.get("total_tokens", 0),
-                        "prompt_tokens": extractor_usage.get("prompt_tokens", 0),
-                        "completion_tokens": extractor_usage.get("completion_tokens", 0),
-                        "source": extractor_usage.get("source", "plugin")
-                    }
-            
-            logging.info(f"Total tokens used for {file_basename}: {total_token_usage['total_tokens']}")
-            
-            # Create a Resume object from the extracted information
-            resume = Resume.from_extractors_output(
-                profile, skills, education, experience, yoe, pdf_file_path, total_token_usage
-            )
-            
-            # Process any custom plugins
-            custom_plugins = [p for p in self.plugin_manager.plugins.values() 
-                             if p.metadata.category == PluginCategory.CUSTOM]
-            
-            for plugin in custom_plugins:
-                try:
-                    if hasattr(plugin, 'process_resume'):
-                        plugin_data = plugin.process_resume(resume, extracted_text)
-                        if plugin_data:
-                            resume.add_plugin_data(plugin.metadata.name, plugin_data)
-                except Exception as e:
-                    logging.error(f"Error processing custom plugin {plugin.metadata.name}: {e}")
+        except Exception as e:
+            logging.exception(f"Error processing resume {file_basename}: {e}")
+            return None
+    
+    def _extract_separately(self, prepared: Tuple[Any, ...], early_profile: Optional[Any]
+                            ) -> Tuple[Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """
+        Run the profile, skills, education and experience extractors, one LLM call each.
+        
+        Args:
+            prepared: The tuple returned by _prepare_extraction.
+            early_profile: Future of a speculative profile extraction, or None.
+            
+        Returns:
+            A tuple of ((extracted data, token usage) by extractor name, the
+            speculative profile report or None).
+        """
+        extracted_text, _, _, inputs, plugins = prepared
+        profile_plugin, skills_plugin, education_plugin, experience_plugin, _ = plugins
+        
+        # Extract information concurrently using plugins (except for experience and YoE)
+        speculation = None
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            future_profile = None
+            if profile_plugin:
+                # A speculative extraction may already be running on the first page
+                future_profile = executor.submit(self._resolve_profile, profile_plugin, early_profile,
+                                                 inputs["profile"], extracted_text)
+            future_skills = executor.submit(skills_plugin.extract, inputs["skills"]) if skills_plugin else None
+            future_education = executor.submit(education_plugin.extract, inputs["education"]) if education_plugin else None
+            
+            # Get results and token usage for profile, skills, and education
+            profile, profile_token_usage, speculation = future_profile.result() if future_profile else ({}, {}, None)
+            skills, skills_token_usage = future_skills.result() if future_skills else ({}, {})
+            education, education_token_usage = future_education.result() if future_education else ({}, {})
+        
+        # Run experience extractor first
+        experience, experience_token_usage = experience_plugin.extract(inputs["experience"]) if experience_plugin else ({}, {})
+        
+        results = {
+            "profile": (profile, profile_token_usage),
+            "skills": (skills, skills_token_usage),
+            "education": (education, education_token_usage),
+            "experience": (experience, experience_token_usage)
+        }
+        return results, speculation
+    
+    def _combined_plugins(self, plugins: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Get the extractors a combined LLM call replaces, if combined mode applies.
+        
+        Args:
+            plugins: The (profile, skills, education, experience, yoe) plugins.
+            
+        Returns:
+            The extractor plugins by part name, or None if combined extraction is
+            disabled or not every extractor can be combined (see can_combine).
+        """
+        if not config.COMBINED_EXTRACTION_ENABLED:
+            return None
+        from .combined_extraction import can_combine
+        combined_plugins = dict(zip(("profile", "skills", "education", "experience"), plugins[:4]))
+        if not can_combine(combined_plugins):
+            logging.info("Combined extraction needs the built-in extractors, using one call per extractor")
+            return None
+        return combined_plugins
+    
+    def _use_full_text(self, prepared: Tuple[Any, ...], combined_plugins: Dict[str, Any]) -> None:
+        """Record that the combined extractors received the full text, not their sections."""
+        extracted_text, _, _, inputs, _ = prepared
+        for part in combined_plugins:
+            inputs[part] = extracted_text
+    
+    async def aprocess_resume(self, source: Union[str, bytes, memoryview, BinaryIO],
+                              file_name: Optional[str] = None,
+                              plugins: Optional[Dict[str, Any]] = None) -> Optional[Resume]:
+        """
+        Process a single resume without blocking the event loop.
+        
+        The document is opened and parsed in a worker thread, then every LLM
+        extractor is awaited concurrently (see aprocess_document).
+        
+        Args:
+            source: Path to the resume file, or its contents (see process_resume)
+            file_name: Name to use for in-memory resumes
+            plugins: Plugins to use by name, or None for the plugin manager's plugins
+            
+        Returns:
+            A Resume object with extracted information or None if processing failed
+        """
+        document = await asyncio.to_thread(self._open_document, source, file_name)
+        if document is None:
+            return None
+        with document:
+            return await self.aprocess_document(document, plugins=plugins)
+    
+    async def aprocess_document(self, document: Any,
+                                plugins: Optional[Dict[str, Any]] = None) -> Optional[Resume]:
+        """
+        Process an already opened resume document, awaiting the extractors concurrently.
+        
+        The profile, skills, education and experience extractors run at the same
+        time through their aextract coroutines; extractors without one run in a
+        worker thread. The YoE extractor then runs on the experience result.
+        
+        Args:
+            document: A ResumeDocument returned by open_document.
+            plugins: Plugins to use by name, or None for the plugin manager's plugins.
+                     Passing them here, rather than swapping the plugin manager's,
+                     keeps concurrent calls on one event loop independent.
+            
+        Returns:
+            A Resume object with extracted information or None if processing failed
+            or the pre-classifier rejected the document (see document.rejection).
+        """
+        file_basename = document.file_name
+        
+        try:
+            prepared = await asyncio.to_thread(self._prepare_extraction, document, plugins)
+            if prepared is None:
+                return None
+            extracted_text, _, _, inputs, extractors = prepared
+            profile_plugin, skills_plugin, education_plugin, experience_plugin, yoe_plugin = extractors
+            
+            combined = None
+            combined_plugins = self._combined_plugins(extractors)
+            if combined_plugins is not None:
+                from .combined_extraction import aextract_combined
+                combined = await aextract_combined(profile_plugin.llm_service, extracted_text, combined_plugins)
+            
+            if combined is not None:
+                results, combined_usage = combined
+                self._use_full_text(prepared, combined_plugins)
+            else:
+                text_plugins = [("profile", profile_plugin), ("skills", skills_plugin),
+                                ("education", education_plugin), ("experience", experience_plugin)]
+                names = [name for name, plugin in text_plugins if plugin]
+                outputs = await asyncio.gather(*(self._aextract(plugin, inputs[name])
+                                                 for name, plugin in text_plugins if plugin))
+                results = dict(zip(names, outputs))
+                for name, _ in text_plugins:
+                    results.setdefault(name, ({}, {}))
+                profile, profile_token_usage = results["profile"]
+                if profile_plugin and self._needs_full_text_profile(profile, inputs["profile"], extracted_text):
+                    profile, retry_usage = await self._aextract(profile_plugin, extracted_text)
+                    results["profile"] = (profile, self._add_retry_usage(profile_token_usage, retry_usage))
+                combined_usage = None
+            
+            # The YoE extractor is a local calculation on the experience data
+            results["yoe"] = yoe_plugin.extract(results["experience"][0]) if yoe_plugin else ({}, {})
             
-            return resume
+            logging.debug(f"Extraction completed for {file_basename}")
+            return self._assemble_resume(document, prepared, results, combined_usage=combined_usage,
+                                         plugins=plugins)
             
         except Exception as e:
             logging.exception(f"Error processing resume {file_basename}: {e}")
             return None
     
-    def process_all_resumes(self) -> Tuple[int, int]:
+    async def _aextract(self, plugin: Any, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Await a plugin's extraction, in a worker thread if it has no aextract coroutine.
+        
+        Args:
+            plugin: The extractor plugin.
+            text: The input text for the plugin.
+            
+        Returns:
+            A tuple of (extracted data, token usage).
+        """
+        if asyncio.iscoroutinefunction(getattr(plugin, "aextract", None)):
+            return await plugin.aextract(text)
+        return await asyncio.to_thread(plugin.extract, text)
+    
+    def _prepare_extraction(self, document: Any,
+                            plugins: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, Optional[Dict[str, Any]], Any,
+                                                                                       Dict[str, str], Tuple[Any, ...]]]:
+        """
+        Normalize, classify and segment a document and build each extractor's input.
+        
+        Args:
+            document: A ResumeDocument returned by open_document.
+            plugins: Plugins to use by name, or None for the plugin manager's plugins.
+            
+        Returns:
+            A tuple of (extracted text, normalization report, sections, input text by
+            extractor, (profile, skills, education, experience, yoe) plugins), or None
+            if the pre-classifier rejected the document (see document.rejection).
+        """
+        file_basename = document.file_name
+        
+        extracted_text, normalization = self._normalized_text(document)
+        if normalization is not None:
+            logging.info(f"Normalized text of {file_basename}: {normalization['original_chars']} -> "
+                         f"{normalization['normalized_chars']} chars")
+        
+        if config.RESUME_CLASSIFIER_ENABLED:
+            # Reject cover letters, invoices and blank scans before any LLM call
+            from .utils.resume_classifier import classify_resume
+            classification = classify_resume(extracted_text)
+            if not classification["is_resume"]:
+                logging.warning(f"Rejected {file_basename} as not a resume: {classification['reason']}")
+                document.rejection = classification
+                return None
+        
+        logging.info(f"Extracting information using plugins from {file_basename}")
+        
+        # Get all extractor plugins
+        if plugins is None:
+            extractor_plugins = self.plugin_manager.get_extractor_plugins()
+            get_plugin = self.plugin_manager.get_plugin
+        else:
+            extractor_plugins = {name: plugin for name, plugin in plugins.items()
+                                 if isinstance(plugin, ExtractorPlugin)}
+            get_plugin = plugins.get
+        
+        # Log which plugins we're using
+        logging.info(f"Using {len(extractor_plugins)} extractor plugins: {', '.join(extractor_plugins.keys())}")
+        
+        # Specifically get the plugins we need
+        profile_plugin = get_plugin("profile_extractor")
+        skills_plugin = get_plugin("skills_extractor")
+        education_plugin = get_plugin("education_extractor")
+        experience_plugin = get_plugin("experience_extractor")
+        yoe_plugin = get_plugin("yoe_extractor")
+        
+        # Segment the resume once so each extractor only receives the sections it needs
+        sections = None
+        if config.SECTION_SEGMENTATION_ENABLED:
+            from .utils.section_segmenter import segment_sections
+            sections = segment_sections(extracted_text)
+        text_plugins = [("profile", profile_plugin), ("skills", skills_plugin),
+                        ("education", education_plugin), ("experience", experience_plugin)]
+        # Split the pages only if an extractor asks for a page window
+        page_texts = None
+        if any(isinstance(self._input_window_for(plugin), InputWindow) for _, plugin in text_plugins if plugin):
+            page_texts = self._page_texts(document)
+        inputs = {
+            name: self._input_text_for(plugin, extracted_text, sections, page_texts)
+            for name, plugin in text_plugins
+            if plugin
+        }
+        
+        plugins = (profile_plugin, skills_plugin, education_plugin, experience_plugin, yoe_plugin)
+        return extracted_text, normalization, sections, inputs, plugins
+    
+    def _assemble_resume(self, document: Any, prepared: Tuple[Any, ...],
+                         results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
+                         speculation: Optional[Dict[str, Any]] = None,
+                         combined_usage: Optional[Dict[str, Any]] = None,
+                         plugins: Optional[Dict[str, Any]] = None) -> Resume:
+        """
+        Build the Resume and its token usage report from the extractor results.
+        
+        Args:
+            document: The processed ResumeDocument.
+            prepared: The tuple returned by _prepare_extraction.
+            results: (extracted data, token usage) by extractor name: profile,
+                     skills, education, experience and yoe.
+            speculation: The speculative profile report, or None.
+            combined_usage: Token usage of the combined extraction call, or None
+                            if each extractor made its own call.
+            plugins: Plugins to use by name, or None for the plugin manager's plugins.
+            
+        Returns:
+            The Resume, with data from any custom plugins added.
+        """
+        extracted_text, normalization, sections, inputs, extractors = prepared
+        
+        # Initialize token usage dictionary
+        total_token_usage = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "by_extractor": {},
+            "source": "plugins"
+        }
+        
+        # Aggregate token usage
+        for extractor_name in ("profile", "skills", "education", "experience", "yoe"):
+            extractor_usage = results[extractor_name][1]
+            if extractor_usage:
+                total_token_usage["total_tokens"] += extractor_usage.get("total_tokens", 0)
+                total_token_usage["prompt_tokens"] += extractor_usage.get("prompt_tokens", 0)
+                total_token_usage["completion_tokens"] += extractor_usage.get("completion_tokens", 0)
+                
+                # Store by extractor for detailed breakdown
+                total_token_usage["by_extractor"][extractor_name] = {
+                    "total_tokens": extractor_usage.get("total_tokens", 0),
+                    "prompt_tokens": extractor_usage.get("prompt_tokens", 0),
+                    "completion_tokens": extractor_usage.get("completion_tokens", 0),
+                    "source": extractor_usage.get("source", "plugin")
+                }
+                if extractor_name in inputs:
+                    input_chars = len(inputs[extractor_name])
+                    total_token_usage["by_extractor"][extractor_name].update({
+                        "input_chars": input_chars,
+                        # Rough estimate: 4 chars per token, as in LLMService
+                        "estimated_prompt_tokens_saved": max(0, len(extracted_text) - input_chars) // 4
+                    })
+        
+        if combined_usage is not None:
+            # One call extracted the profile, skills, education and experience
+            for key in ("total_tokens", "prompt_tokens", "completion_tokens"):
+                total_token_usage[key] += combined_usage.get(key, 0)
+            total_token_usage["combined"] = {
+                "total_tokens": combined_usage.get("total_tokens", 0),
+                "prompt_tokens": combined_usage.get("prompt_tokens", 0),
+                "completion_tokens": combined_usage.get("completion_tokens", 0),
+                "source": combined_usage.get("source", "plugin"),
+                "extractors": [name for name, (_, usage) in results.items() if usage.get("source") == "combined"],
+                "input_chars": len(extracted_text)
+            }
+        
+        if normalization is not None:
+            # Every text extractor receives the normalized text, so the savings apply once per prompt
+            prompt_count = 1 if combined_usage is not None else sum(1 for plugin in extractors[:4] if plugin)
+            total_token_usage["normalization"] = {
+                **normalization,
+                "prompts": prompt_count,
+                "estimated_prompt_tokens_saved": normalization["estimated_tokens_saved"] * prompt_count
+            }
+        
+        if speculation is not None:
+            if speculation.get("discarded"):
+                # The first-page call was made but its result was not used
+                for key in ("total_tokens", "prompt_tokens", "completion_tokens"):
+                    total_token_usage[key] += speculation.get(key, 0)
+            total_token_usage["speculative_profile"] = speculation
+        
+        if sections is not None:
+            total_token_usage["segmentation"] = {
+                "sections": {name: len(text) for name, text in sections.sections.items()},
+                "input_chars": {name: len(text) for name, text in inputs.items()},
+                # Rough estimate: 4 chars per token, as in LLMService
+                "estimated_prompt_tokens_saved": sum(
+                    (len(extracted_text) - len(text)) // 4 for text in inputs.values()
+                )
+            }
+        
+        logging.info(f"Total tokens used for {document.file_name}: {total_token_usage['total_tokens']}")
+        
+        # Create a Resume object from the extracted information
+        resume = Resume.from_extractors_output(
+            results["profile"][0], results["skills"][0], results["education"][0],
+            results["experience"][0], results["yoe"][0], document.file_path, total_token_usage
+        )
+        
+        # Process any custom plugins
+        custom_plugins = [p for p in (self.plugin_manager.plugins if plugins is None else plugins).values() 
+                         if getattr(p.metadata, 'category', None) == PluginCategory.CUSTOM]
+        
+        for plugin in custom_plugins:
+            try:
+                if hasattr(plugin, 'process_resume'):
+                    plugin_data = plugin.process_resume(resume, extracted_text)
+                    if plugin_data:
+                        resume.add_plugin_data(plugin.metadata.name, plugin_data)
+            except Exception as e:
+                logging.error(f"Error processing custom plugin {plugin.metadata.name}: {e}")
+        
+        return resume
+    
+    def _input_text_for(self, plugin: Any, extracted_text: str, sections: Any,
+                        page_texts: Optional[List[str]] = None) -> str:
         """
-        Process all resumes in the resume directory.
+        Get the text to pass to an extractor plugin.
         
+        Args:
+            plugin: The extractor plugin.
+            extracted_text: The full resume text.
+            sections: The ResumeSections of the resume, or None if segmentation is disabled.
+            page_texts: The text of each page, or None if no extractor declares a page window.
+            
+        Returns:
+            The sections the plugin asks for via get_input_sections if they are found
+            reliably, else its page window from get_input_window, else the full text.
+        """
+        get_input_sections = getattr(plugin, 'get_input_sections', None)
+        section_names = get_input_sections() if sections is not None and callable(get_input_sections) else None
+        if isinstance(section_names, (list, tuple)):
+            text = sections.text_for(section_names)
+            if text is not extracted_text:
+                return text
+            logging.debug(f"Sections {section_names} not found reliably, using the full text")
+        
+        window = self._input_window_for(plugin)
+        if isinstance(window, InputWindow) and page_texts is not None:
+            text = window.apply(page_texts)
+            # An empty window (e.g. a blank first page) would leave the extractor with nothing
+            if text.strip():
+                return text
+        return extracted_text
+    
+    def _input_window_for(self, plugin: Any) -> Optional[InputWindow]:
+        """Get the page window an extractor plugin declares, if any."""
+        get_input_window = getattr(plugin, 'get_input_window', None)
+        return get_input_window() if callable(get_input_window) else None
+    
+    def _page_texts(self, document: Any) -> List[str]:
+        """Get the text of each page, normalized like the full text."""
+        if not config.TEXT_NORMALIZATION_ENABLED:
+            return list(document.pages)
+        from .utils.text_normalizer import normalize_page_texts
+        return normalize_page_texts(document.pages)
+    
+    def process_all_resumes(self, force: bool = False, pipelined: Optional[bool] = None,
+                            batched: Optional[bool] = None, max_concurrency: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Process all resumes in the resume directory, including the resumes
+        inside .zip/.tar(.gz) archives.
+        
+        Unless incremental processing is disabled or force is set, resumes
+        recorded in the manifest as already processed (same content and plugin
+        versions, result still on disk) are skipped. The skipped count is
+        available in run_stats.
+        
+        In pipelined mode, parsing the next resumes overlaps with the LLM calls
+        for the current ones (see _process_pipelined). In batched mode, each
+        extractor's inputs for a group of resumes are sent as one batch (see
+        _process_batched); batched mode takes precedence over pipelined mode.
+        
+        Args:
+            force: Reprocess every resume, ignoring the manifest.
+            pipelined: Run the parse, extract and save stages concurrently.
+                       Defaults to config.PIPELINE_ENABLED.
+            batched: Batch the LLM calls across resumes. Defaults to config.LLM_BATCH_ENABLED.
+            max_concurrency: In batched mode, the maximum number of LLM requests of an
+                             extractor in flight. Defaults to config.LLM_BATCH_MAX_CONCURRENCY.
+            
         Returns:
             A tuple of (number of processed resumes, number of errors)
         """
+        pipelined = config.PIPELINE_ENABLED if pipelined is None else pipelined
+        batched = config.LLM_BATCH_ENABLED if batched is None else batched
         resume_files = self.get_resume_files()
-        processed_count = 0
-        error_count = 0
+        plugin_versions = self._begin_run()
+        try:
+            if batched:
+                self._process_batched(resume_files, plugin_versions, force, max_concurrency)
+            elif pipelined:
+                self._process_pipelined(resume_files, plugin_versions, force)
+            else:
+                for key, size, mtime, source, file_name in self._iter_pending(resume_files, plugin_versions, force):
+                    output_file, content_hash, rejection = self._process_and_save(source, file_name=file_name)
+                    self._record(key, size, mtime, content_hash, plugin_versions, output_file, rejection)
+        finally:
+            self._end_run()
+        
+        if self.text_cache is not None:
+            stats = self.text_cache.stats()
+            logging.info(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, "
+                         f"{stats['evictions']} evictions")
+        
+        return self.run_stats["processed"], self.run_stats["errors"]
+    
+    def process_archive(self, archive_path: str, force: bool = False) -> Tuple[int, int]:
+        """
+        Process every resume in a .zip or .tar(.gz) archive.
+        
+        Members are streamed into the readers from memory one at a time, without
+        extracting the archive to disk. Members the manifest lists as already
+        processed are skipped unless force is set.
+        
+        Args:
+            archive_path: Path to the archive.
+            force: Reprocess every member, ignoring the manifest.
+            
+        Returns:
+            A tuple of (number of processed resumes, number of errors)
+        """
+        plugin_versions = self._begin_run()
+        try:
+            self._process_archive_members(archive_path, plugin_versions, force)
+        finally:
+            self._end_run()
+        return self.run_stats["processed"], self.run_stats["errors"]
+    
+    def begin_run(self) -> None:
+        """
+        Start an open-ended batch run, e.g. for a watcher feeding in files as they arrive.
+        
+        Resets run_stats and loads the manifest. Process each file with
+        process_path and finish with end_run, which saves the manifest.
+        """
+        self._run_plugin_versions = self._begin_run()
+    
+    def process_path(self, path: str, force: bool = False) -> None:
+        """
+        Process a resume file or archive within a run started with begin_run.
+        
+        The outcome is counted in run_stats and recorded in the manifest. Safe to
+        call from several threads at once.
+        
+        Args:
+            path: Path to a resume or a .zip/.tar(.gz) archive of resumes.
+            force: Reprocess the file even if the manifest lists it as unchanged.
+            
+        Raises:
+            RuntimeError: If no run was started with begin_run.
+        """
+        from .utils.archive_utils import is_archive
+        
+        plugin_versions = self._run_plugin_versions
+        if plugin_versions is None:
+            raise RuntimeError("process_path called outside a run; call begin_run first")
+        if is_archive(path):
+            self._process_archive_members(path, plugin_versions, force)
+        else:
+            self._process_file(path, plugin_versions, force)
+    
+    def end_run(self) -> Dict[str, int]:
+        """
+        Finish a run started with begin_run: save the manifest and log the summary.
+        
+        Returns:
+            The run_stats of the run.
+        """
+        self._end_run()
+        self._run_plugin_versions = None
+        return self.run_stats
+    
+    def _begin_run(self) -> Dict[str, Any]:
+        """
+        Reset run_stats and load the manifest for a batch run.
+        
+        Returns:
+            The plugin versions to check and record in the manifest.
+        """
+        from .utils.manifest import ProcessingManifest
+        
+        self.run_stats = {"processed": 0, "skipped": 0, "rejected": 0, "errors": 0}
+        self.manifest = ProcessingManifest(self.manifest_path) if config.INCREMENTAL_PROCESSING_ENABLED else None
+        self._unsaved_records = 0
+        self._last_save = time.monotonic()
+        self._run_settings = self._output_settings()
+        return self._plugin_versions()
+    
+    def _end_run(self) -> None:
+        """Save the manifest and log the batch summary."""
+        if self.manifest is not None:
+            with self._save_lock:
+                self.manifest.save()
+            self.manifest = None
+        logging.info(f"Processed {self.run_stats['processed']} resumes, skipped {self.run_stats['skipped']} "
+                     f"unchanged, rejected {self.run_stats['rejected']} non-resumes, {self.run_stats['errors']} errors")
+    
+    def _process_archive_members(self, archive_path: str, plugin_versions: Dict[str, Any], force: bool) -> None:
+        """
+        Process the resumes in an archive, counting the outcomes in run_stats.
+        
+        Args:
+            archive_path: Path to the archive.
+            plugin_versions: Plugin versions recorded in the manifest.
+            force: Reprocess members the manifest lists as unchanged.
+        """
+        for key, size, mtime, data, file_name in self._iter_pending_members(archive_path, plugin_versions, force):
+            output_file, content_hash, rejection = self._process_and_save(data, file_name=file_name)
+            self._record(key, size, mtime, content_hash, plugin_versions, output_file, rejection)
+    
+    def _process_file(self, file_path: str, plugin_versions: Dict[str, Any], force: bool) -> None:
+        """
+        Process a single resume file, counting the outcome in run_stats.
+        
+        Args:
+            file_path: Path to the resume.
+            plugin_versions: Plugin versions recorded in the manifest.
+            force: Reprocess the file even if the manifest lists it as unchanged.
+        """
+        pending = self._pending_file(file_path, plugin_versions, force)
+        if pending is not None:
+            key, size, mtime, source, file_name = pending
+            output_file, content_hash, rejection = self._process_and_save(source, file_name=file_name)
+            self._record(key, size, mtime, content_hash, plugin_versions, output_file, rejection)
+    
+    def _iter_pending(self, resume_files: List[str], plugin_versions: Dict[str, Any],
+                      force: bool) -> Iterator[Tuple[str, int, Optional[float], Union[str, bytes], Optional[str]]]:
+        """
+        Yield the resumes of a batch that are due for processing.
+        
+        Args:
+            resume_files: File names in the resume directory (resumes and archives).
+            plugin_versions: Plugin versions recorded in the manifest.
+            force: Yield resumes the manifest lists as unchanged too.
+            
+        Yields:
+            Tuples of (manifest key, size, mtime, source, file name); the source is
+            a path, or the contents of an archive member.
+        """
+        from .utils.archive_utils import is_archive
         
         for resume_file in resume_files:
+            file_path = os.path.join(self.resume_dir, resume_file)
+            if is_archive(resume_file):
+                yield from self._iter_pending_members(file_path, plugin_versions, force)
+                continue
+            pending = self._pending_file(file_path, plugin_versions, force)
+            if pending is not None:
+                yield pending
+    
+    def _iter_pending_members(self, archive_path: str, plugin_versions: Dict[str, Any],
+                              force: bool) -> Iterator[Tuple[str, int, Optional[float], bytes, str]]:
+        """Yield the members of an archive that are due, like _iter_pending."""
+        from .utils.archive_utils import iter_archive
+        from .utils.manifest import hash_bytes
+        
+        logging.info(f"Processing archive {os.path.basename(archive_path)}")
+        try:
+            for file_name, data in iter_archive(archive_path):
+                # Members have no mtime of their own, so the content hash decides
+                key = f"{os.path.abspath(archive_path)}::{file_name}"
+                if not force and self._is_unchanged(key, len(data), None, plugin_versions, lambda: hash_bytes(data)):
+                    logging.info(f"Skipping unchanged {file_name}")
+                    self._count("skipped")
+                    continue
+                yield key, len(data), None, data, file_name
+        except ValueError as e:
+            logging.error(str(e))
+            self._count("errors")
+    
+    def _pending_file(self, file_path: str, plugin_versions: Dict[str, Any],
+                      force: bool) -> Optional[Tuple[str, int, float, str, None]]:
+        """Check whether a resume file is due, returning its _iter_pending tuple or None."""
+        from .utils.manifest import hash_file
+        
+        key = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            logging.error(f"Cannot read {file_path}: {e}")
+            self._count("errors")
+            return None
+        
+        if not force and self._is_unchanged(key, stat.st_size, stat.st_mtime, plugin_versions,
+                                            lambda: hash_file(file_path)):
+            logging.info(f"Skipping unchanged {os.path.basename(file_path)}")
+            self._count("skipped")
+            return None
+        return key, stat.st_size, stat.st_mtime, file_path, None
+    
+    def _process_pipelined(self, resume_files: List[str], plugin_versions: Dict[str, Any], force: bool) -> None:
+        """
+        Process a batch as a parse -> extract -> save pipeline.
+        
+        One thread opens and parses the resumes (CPU-bound) while
+        PIPELINE_EXTRACT_WORKERS threads run the extractors (waiting on the LLM)
+        and one thread saves the results and updates the manifest. The stages
+        are connected by queues of at most PIPELINE_QUEUE_SIZE items, so parsing
+        runs ahead of the LLM calls by a bounded number of documents.
+        
+        Args:
+            resume_files: File names in the resume directory (resumes and archives).
+            plugin_versions: Plugin versions recorded in the manifest.
+            force: Reprocess resumes the manifest lists as unchanged.
+        """
+        workers = max(1, config.PIPELINE_EXTRACT_WORKERS)
+        parsed = queue.Queue(maxsize=max(1, config.PIPELINE_QUEUE_SIZE))
+        extracted = queue.Queue(maxsize=max(1, config.PIPELINE_QUEUE_SIZE))
+        
+        def parse_stage() -> None:
             try:
-                file_path = os.path.join(self.resume_dir, resume_file)
-                logging.info(f"Processing {resume_file}")
-                
-                resume = self.process_resume(file_path)
-                
-                if resume:
-                    self.save_resume(resume)
-                    processed_count += 1
-                else:
-                    error_count += 1
+                for key, size, mtime, source, file_name in self._iter_pending(resume_files, plugin_versions, force):
+                    document = self._open_document(source, file_name)
+                    if document is None:
+                        self._count("errors")
+                        continue
+                    parsed.put((key, size, mtime, document))
             except Exception as e:
-                logging.exception(f"Error processing {resume_file}: {e}")
-                error_count += 1
+                logging.exception(f"Error reading resumes: {e}")
+            finally:
+                # One end marker per extract worker
+                for _ in range(workers):
+                    parsed.put(None)
+        
+        def extract_stage() -> None:
+            while True:
+                item = parsed.get()
+                if item is None:
+                    return
+                key, size, mtime, document = item
+                resume, content_hash = None, None
+                try:
+                    with document:
+                        content_hash = document.content_hash
+                        resume = self.process_document(document)
+                except Exception as e:
+                    logging.exception(f"Error processing {document.file_name}: {e}")
+                # Always pass the item on, so the save stage counts every resume
+                extracted.put((key, size, mtime, content_hash, resume, document.rejection))
+        
+        def save_stage() -> None:
+            while True:
+                item = extracted.get()
+                if item is None:
+                    return
+                key, size, mtime, content_hash, resume, rejection = item
+                output_file = self.save_resume(resume) if resume else None
+                self._record(key, size, mtime, content_hash, plugin_versions, output_file, rejection)
+        
+        parser = threading.Thread(target=parse_stage, name="cvinsight-parse")
+        extractors = [threading.Thread(target=extract_stage, name=f"cvinsight-extract-{i}") for i in range(workers)]
+        saver = threading.Thread(target=save_stage, name="cvinsight-save")
+        for thread in [parser, *extractors, saver]:
+            thread.start()
+        parser.join()
+        for thread in extractors:
+            thread.join()
+        extracted.put(None)
+        saver.join()
+    
+    def _process_batched(self, resume_files: List[str], plugin_versions: Dict[str, Any], force: bool,
+                         max_concurrency: Optional[int] = None) -> None:
+        """
+        Process a batch in groups of LLM_BATCH_SIZE resumes with batched LLM calls.
+        
+        Each group is parsed first; then every extractor receives the inputs of
+        all the resumes in the group at once (see ExtractorPlugin.extract_batch),
+        the extractors running at the same time. The results are then saved and
+        recorded one resume at a time.
+        
+        Args:
+            resume_files: File names in the resume directory (resumes and archives).
+            plugin_versions: Plugin versions recorded in the manifest.
+            force: Reprocess resumes the manifest lists as unchanged.
+            max_concurrency: Maximum number of LLM requests of an extractor in flight.
+        """
+        batch_size = max(1, config.LLM_BATCH_SIZE)
+        group = []
+        for pending in self._iter_pending(resume_files, plugin_versions, force):
+            group.append(pending)
+            if len(group) >= batch_size:
+                self._process_group(group, plugin_versions, max_concurrency)
+                group = []
+        if group:
+            self._process_group(group, plugin_versions, max_concurrency)
+    
+    def _process_group(self, group: List[Tuple[str, int, Optional[float], Union[str, bytes], Optional[str]]],
+                       plugin_versions: Dict[str, Any], max_concurrency: Optional[int]) -> None:
+        """Parse, extract (batched), save and record a group of resumes from _iter_pending."""
+        parsed = []
+        for key, size, mtime, source, file_name in group:
+            display_name = file_name or os.path.basename(source)
+            logging.info(f"Processing {display_name}")
+            document = self._open_document(source, file_name)
+            if document is None:
+                self._record(key, size, mtime, None, plugin_versions, None)
+                continue
+            try:
+                with document:
+                    content_hash = document.content_hash
+                    prepared = self._prepare_extraction(document)
+            except Exception as e:
+                logging.exception(f"Error processing resume {display_name}: {e}")
+                self._record(key, size, mtime, None, plugin_versions, None)
+                continue
+            if prepared is None:
+                self._record(key, size, mtime, content_hash, plugin_versions, None, document.rejection)
+                continue
+            parsed.append((key, size, mtime, content_hash, document, prepared))
+        if not parsed:
+            return
+        
+        try:
+            extracted = self._extract_batched([prepared for *_, prepared in parsed], max_concurrency)
+        except Exception as e:
+            logging.exception(f"Error extracting a batch of {len(parsed)} resumes: {e}")
+            extracted = [None] * len(parsed)
+        
+        for (key, size, mtime, content_hash, document, prepared), outcome in zip(parsed, extracted):
+            output_file = None
+            try:
+                if outcome is not None:
+                    results, combined_usage = outcome
+                    yoe_plugin = prepared[4][4]
+                    results["yoe"] = yoe_plugin.extract(results["experience"][0]) if yoe_plugin else ({}, {})
+                    resume = self._assemble_resume(document, prepared, results, combined_usage=combined_usage)
+                    output_file = self.save_resume(resume)
+            except Exception as e:
+                logging.exception(f"Error processing resume {document.file_name}: {e}")
+            self._record(key, size, mtime, content_hash, plugin_versions, output_file)
+    
+    def _extract_batched(self, prepared_list: List[Tuple[Any, ...]], max_concurrency: Optional[int]
+                         ) -> List[Tuple[Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]], Optional[Dict[str, Any]]]]:
+        """
+        Run the profile, skills, education and experience extractors on many resumes, one batch per extractor.
+        
+        Args:
+            prepared_list: Tuples returned by _prepare_extraction, one per resume.
+            max_concurrency: Maximum number of LLM requests of an extractor in flight.
+            
+        Returns:
+            One (results by extractor name, combined call token usage or None) tuple per resume.
+        """
+        max_concurrency = max_concurrency or config.LLM_BATCH_MAX_CONCURRENCY
+        plugins = prepared_list[0][4]
+        outcomes = [None] * len(prepared_list)
+        
+        combined_plugins = self._combined_plugins(plugins)
+        if combined_plugins is not None:
+            from .combined_extraction import extract_combined_batch
+            combined = extract_combined_batch(plugins[0].llm_service, [prepared[0] for prepared in prepared_list],
+                                              combined_plugins, max_concurrency)
+            for index, (prepared, outcome) in enumerate(zip(prepared_list, combined)):
+                if outcome is not None:
+                    self._use_full_text(prepared, combined_plugins)
+                    outcomes[index] = outcome
+        
+        # The resumes without a combined result: one batch per extractor
+        pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        if not pending:
+            return outcomes
+        names = ("profile", "skills", "education", "experience")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {
+                name: executor.submit(self._extract_batch, plugin,
+                                      [prepared_list[index][3][name] for index in pending], max_concurrency)
+                for name, plugin in zip(names, plugins[:4])
+                if plugin
+            }
+            batches = {name: future.result() for name, future in futures.items()}
+        if "profile" in batches:
+            # Resumes without a name or email in the profile input: one more batch on the full text
+            retries = [position for position, index in enumerate(pending)
+                       if self._needs_full_text_profile(batches["profile"][position][0],
+                                                        prepared_list[index][3]["profile"], prepared_list[index][0])]
+            if retries:
+                retried = self._extract_batch(plugins[0], [prepared_list[pending[position]][0] for position in retries],
+                                              max_concurrency)
+                for position, (profile, retry_usage) in zip(retries, retried):
+                    batches["profile"][position] = (profile, self._add_retry_usage(batches["profile"][position][1],
+                                                                                   retry_usage))
+        for position, index in enumerate(pending):
+            results = {name: batches[name][position] if name in batches else ({}, {}) for name in names}
+            outcomes[index] = (results, None)
+        return outcomes
+    
+    def _extract_batch(self, plugin: Any, texts: List[str],
+                       max_concurrency: int) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run a plugin on many texts, with extract_batch if it has one.
         
-        return processed_count, error_count
+        Args:
+            plugin: The extractor plugin.
+            texts: The input text of each resume.
+            max_concurrency: Maximum number of extractions in flight.
+            
+        Returns:
+            A list of (extracted data, token usage) tuples, one per text.
+        """
+        if hasattr(plugin, "extract_batch"):
+            return plugin.extract_batch(texts, max_concurrency=max_concurrency)
+        workers = max(1, min(max_concurrency, len(texts)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(plugin.extract, texts))
+    
+    def _count(self, outcome: str) -> None:
+        """Count a processing outcome ('processed', 'skipped', 'rejected' or 'errors') in run_stats."""
+        with self._lock:
+            self.run_stats[outcome] += 1
     
-    def save_resume(self, resume: Resume) -> None:
+    def _is_unchanged(self, key: str, size: int, mtime: Optional[float],
+                      plugin_versions: Dict[str, Any], get_hash: Any) -> bool:
+        """Check the manifest for a resume already processed in its current form."""
+        from .utils.resume_classifier import CLASSIFIER_VERSION
+        
+        if self.manifest is None:
+            return False
+        with self._lock:
+            return self.manifest.is_unchanged(key, size, mtime, plugin_versions, get_hash,
+                                              skip_rejected=config.RESUME_CLASSIFIER_ENABLED,
+                                              classifier_version=CLASSIFIER_VERSION,
+                                              settings=self._run_settings)
+    
+    def _record(self, key: str, size: int, mtime: Optional[float], content_hash: Optional[str],
+                plugin_versions: Dict[str, Any], output_file: Optional[str],
+                rejection: Optional[Dict[str, Any]] = None) -> None:
+        """Count the outcome of processing a resume and record it in the manifest."""
+        from .utils.resume_classifier import CLASSIFIER_VERSION
+        
+        if rejection is not None:
+            self._count("rejected")
+        elif output_file is None:
+            self._count("errors")
+            return
+        else:
+            self._count("processed")
+        with self._lock:
+            if self.manifest is None:
+                return
+            self.manifest.record(key, size, mtime, content_hash, plugin_versions, output_file,
+                                 rejected=rejection["reason"] if rejection is not None else None,
+                                 classifier_version=CLASSIFIER_VERSION,
+                                 settings=self._run_settings)
+            self._unsaved_records += 1
+            due = (self._unsaved_records >= max(1, config.MANIFEST_SAVE_INTERVAL)
+                   or time.monotonic() - self._last_save >= config.MANIFEST_SAVE_SECONDS)
+        if due:
+            self._flush_manifest()
+    
+    def _flush_manifest(self) -> None:
+        """Save the manifest during a run, so an interrupted run keeps its progress."""
+        with self._save_lock:
+            with self._lock:
+                if self.manifest is None or not self._unsaved_records:
+                    return
+                manifest = self.manifest
+                entries = manifest.snapshot()
+                self._unsaved_records = 0
+                self._last_save = time.monotonic()
+            # Written outside _lock, so the workers keep recording while the file is saved
+            manifest.save(entries)
+    
+    def _plugin_versions(self) -> Dict[str, Any]:
+        """
+        Get the versions of the plugins that produce the results.
+        
+        Returns:
+            A dictionary of plugin name to version.
+        """
+        plugins = dict(self.plugin_manager.get_extractor_plugins())
+        plugins.update({name: plugin for name, plugin in getattr(self.plugin_manager, 'plugins', {}).items()
+                        if getattr(plugin.metadata, 'category', None) == PluginCategory.CUSTOM})
+        return {name: getattr(plugin.metadata, 'version', None) for name, plugin in sorted(plugins.items())}
+    
+    def _output_settings(self) -> Dict[str, Any]:
+        """
+        Get the settings that change the extracted results, so re-runs redo files processed under others.
+        
+        Returns:
+            A dictionary of setting name to value.
+        """
+        return {
+            "LLM_MODEL": config.LLM_MODEL,
+            "LLM_TEMPERATURE": config.LLM_TEMPERATURE,
+            "PDF_EXTRACTION_METHOD": config.PDF_EXTRACTION_METHOD,
+            "PDF_EXTRACTION_FALLBACKS": list(config.PDF_EXTRACTION_FALLBACKS),
+            "DOCX_EXTRACTION_METHOD": config.DOCX_EXTRACTION_METHOD,
+            "TEXT_NORMALIZATION_ENABLED": config.TEXT_NORMALIZATION_ENABLED,
+            "SECTION_SEGMENTATION_ENABLED": config.SECTION_SEGMENTATION_ENABLED,
+            "SECTION_MIN_CHARS": config.SECTION_MIN_CHARS,
+            "PROFILE_FIRST_PAGE_ONLY": config.PROFILE_FIRST_PAGE_ONLY,
+            "EXPERIENCE_CHUNKING_ENABLED": config.EXPERIENCE_CHUNKING_ENABLED,
+            "COMBINED_EXTRACTION_ENABLED": config.COMBINED_EXTRACTION_ENABLED
+        }
+    
+    def _process_and_save(self, source: Union[str, bytes],
+                          file_name: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Process a single resume and save the result.
+        
+        Args:
+            source: Path to the resume, or its contents.
+            file_name: File name for in-memory resumes.
+            
+        Returns:
+            A tuple of (path of the saved result, content hash of the resume,
+            pre-classifier rejection); the path is None on error or rejection.
+        """
+        display_name = file_name or os.path.basename(source)
+        try:
+            logging.info(f"Processing {display_name}")
+            
+            document = self._open_document(source, file_name)
+            if document is None:
+                return None, None, None
+            with document:
+                # Hashed over the same buffer the extractors read, for the manifest
+                content_hash = document.content_hash
+                resume = self.process_document(document)
+            
+            if resume:
+                return self.save_resume(resume), content_hash, None
+            return None, content_hash, document.rejection
+        except Exception as e:
+            logging.exception(f"Error processing {display_name}: {e}")
+            return None, None, None
+    
+    def save_resume(self, resume: Resume) -> Optional[str]:
         """
         Save a processed resume to the output directory.
         
         Args:
             resume: The processed Resume object.
+            
+        Returns:
+            The path of the saved JSON file, or None if saving failed.
         """
         try:
             # Get the base name without extension
@@ -229,8 +1390,10 @@ class PluginResumeProcessor:
                 logging.info(f"Token usage logged to {log_file_path}")
             
             logging.info(f"Saved processed resume to {output_file}")
+            return output_file
         except Exception as e:
             logging.exception(f"Error saving resume: {e}")
+            return None
     
     def print_token_usage_report(self, resume: Resume, log_file: str = None) -> None:
         """
@@ -263,6 +1426,29 @@ class PluginResumeProcessor:
                 print(f"    Total: {usage.get('total_tokens', 0)}")
                 print(f"    Prompt: {usage.get('prompt_tokens', 0)}")
                 print(f"    Completion: {usage.get('completion_tokens', 0)}")
+                if usage.get('estimated_prompt_tokens_saved'):
+                    print(f"    Estimated prompt tokens saved: {usage['estimated_prompt_tokens_saved']}")
+        
+        # If one call extracted every section
+        if "combined" in token_usage:
+            combined = token_usage["combined"]
+            print("\nCombined extraction:")
+            print(f"  Extractors: {', '.join(combined.get('extractors', []))}")
+            print(f"  Total: {combined.get('total_tokens', 0)}")
+            print(f"  Prompt: {combined.get('prompt_tokens', 0)}")
+            print(f"  Completion: {combined.get('completion_tokens', 0)}")
+        
+        # If the text was normalized before prompting
+        if "normalization" in token_usage:
+            normalization = token_usage["normalization"]
+            print("\nText normalization:")
+            print(f"  Characters: {normalization.get('original_chars', 0)} -> {normalization.get('normalized_chars', 0)}")
+            print(f"  Estimated prompt tokens saved: {normalization.get('estimated_prompt_tokens_saved', 0)}")
+        
+        # If each extractor only received its sections
+        if "segmentation" in token_usage:
+            print("\nSection segmentation:")
+            print(f"  Estimated prompt tokens saved: {token_usage['segmentation'].get('estimated_prompt_tokens_saved', 0)}")
         
         # If token usage is estimated
         if token_usage.get("is_estimated", False):
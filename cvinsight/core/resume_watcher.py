@@ -0,0 +1,158 @@
+import os
+import time
+import logging
+import threading
+import concurrent.futures
+from typing import Optional, Dict, Any, List, Tuple
+from . import config
+
+class ResumeWatcher:
+    """
+    Watch a drop folder and process resumes as they arrive.
+
+    The folder is polled (and, when the optional watchdog package is installed,
+    also watched through inotify/FSEvents so new files wake the loop at once).
+    A file is only processed once its size and mtime have stayed the same for
+    settle_seconds, so partially written files are never picked up. Ready files
+    are handed to a bounded worker pool and each result is saved as soon as it
+    is done. The processor's manifest records every processed file, so a restart
+    does not process the folder again.
+    """
+
+    def __init__(self, processor: Any, poll_interval: Optional[float] = None,
+                 settle_seconds: Optional[float] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the watcher.
+
+        Args:
+            processor: The PluginResumeProcessor whose resume_dir is watched.
+            poll_interval: Seconds between scans. Defaults to config.WATCH_POLL_INTERVAL.
+            settle_seconds: Seconds a file must stay unchanged before it is processed.
+                            Defaults to config.WATCH_SETTLE_SECONDS.
+            max_workers: Resumes processed concurrently. Defaults to config.WATCH_MAX_WORKERS.
+        """
+        self.processor = processor
+        self.poll_interval = poll_interval if poll_interval is not None else config.WATCH_POLL_INTERVAL
+        self.settle_seconds = settle_seconds if settle_seconds is not None else config.WATCH_SETTLE_SECONDS
+        self.max_workers = max(1, max_workers or config.WATCH_MAX_WORKERS)
+
+        # path -> ((size, mtime), time first seen with that signature)
+        self._observed: Dict[str, Tuple[Tuple[int, float], float]] = {}
+        # path -> signature of the version that was handed to a worker
+        self._handled: Dict[str, Tuple[int, float]] = {}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def poll(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[Tuple[str, Tuple[int, float]]]:
+        """
+        Scan the folder and return the files that are ready to process.
+
+        Args:
+            now: The current monotonic time (for tests), or None to read the clock.
+            limit: Maximum number of files to return; the rest stay ready for the next poll.
+
+        Returns:
+            A list of (path, (size, mtime)) tuples.
+        """
+        now = time.monotonic() if now is None else now
+        ready = []
+        present = set()
+        for name in sorted(self.processor.get_resume_files()):
+            path = os.path.join(self.processor.resume_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            present.add(path)
+            signature = (stat.st_size, stat.st_mtime)
+            with self._lock:
+                if path in self._in_flight or self._handled.get(path) == signature:
+                    continue
+
+            observed = self._observed.get(path)
+            if observed is None or observed[0] != signature:
+                # New or still being written: start (or restart) the settle timer
+                self._observed[path] = (signature, now)
+                continue
+            if now - observed[1] < self.settle_seconds or (limit is not None and len(ready) >= limit):
+                continue
+            del self._observed[path]
+            ready.append((path, signature))
+
+        # Forget files that were removed from the folder
+        for path in list(self._observed):
+            if path not in present:
+                del self._observed[path]
+        return ready
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """
+        Process arriving resumes until stop_event is set or the process is interrupted.
+
+        Args:
+            stop_event: Event that stops the watcher, or None to run until interrupted.
+
+        Returns:
+            The processor's run_stats for the session.
+        """
+        stop_event = stop_event or threading.Event()
+        self.processor.begin_run()
+        observer = self._start_observer()
+        logging.info(f"Watching {self.processor.resume_dir} for new resumes")
+
+        def process(path: str, signature: Tuple[int, float]) -> None:
+            try:
+                self.processor.process_path(path)
+            except Exception as e:
+                logging.exception(f"Error processing {os.path.basename(path)}: {e}")
+            finally:
+                with self._lock:
+                    self._in_flight.discard(path)
+                    self._handled[path] = signature
+                # A worker is free: pick up the next ready file without waiting for the poll
+                self._wake.set()
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while not stop_event.is_set():
+                    # Clear before scanning, so a wake-up that arrives during the scan is not lost
+                    self._wake.clear()
+                    with self._lock:
+                        free = self.max_workers - len(self._in_flight)
+                    for path, signature in self.poll(limit=free):
+                        with self._lock:
+                            self._in_flight.add(path)
+                        executor.submit(process, path, signature)
+                    self._wake.wait(self.poll_interval)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self.processor.end_run()
+        return self.processor.run_stats
+
+    def _start_observer(self) -> Optional[Any]:
+        """
+        Start a watchdog observer that wakes the poll loop on file-system events.
+
+        Returns:
+            The running observer, or None if watchdog is not installed.
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            logging.debug("watchdog is not installed, polling the resume directory")
+            return None
+
+        wake = self._wake
+
+        class _WakeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+
+        observer = Observer()
+        observer.schedule(_WakeHandler(), self.processor.resume_dir, recursive=False)
+        observer.start()
+        return observer
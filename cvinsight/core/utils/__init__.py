@@ -2,7 +2,8 @@
 # This file intentionally left mostly empty to avoid circular imports 
 
 # Re-export utility functions
-from .file_utils import read_file, validate_file
+from .file_utils import read_file, validate_file, open_document, iter_text, read_stream, ResumeDocument
+from .extraction_backends import ExtractionBackend, register_backend, get_backend, list_backends
 from .date_utils import parse_date, calculate_experience
 from .logging_utils import setup_logging
 from .log_utils import cleanup_token_usage_logs
@@ -0,0 +1,106 @@
+import os
+import logging
+import tarfile
+import zipfile
+from .. import config
+
+def is_archive(file_path):
+    """
+    Check whether a file is a supported resume archive, by its name.
+
+    Args:
+        file_path: Path or name of the file.
+
+    Returns:
+        True for .zip, .tar, .tar.gz and .tgz files.
+    """
+    return os.fspath(file_path).lower().endswith(tuple(config.ALLOWED_ARCHIVE_EXTENSIONS))
+
+def _member_file_name(member_name):
+    """
+    Build a flat file name for an archive member.
+
+    Folders are joined into the name (e.g. 'batch1/cv.pdf' -> 'batch1_cv.pdf') so that
+    same-named resumes in different folders do not overwrite each other's results.
+    """
+    parts = [part for part in member_name.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+    return "_".join(parts)
+
+def _is_resume_member(member_name):
+    """Check whether an archive member looks like a resume file."""
+    base_name = os.path.basename(member_name.rstrip('/'))
+    # Skip hidden files such as macOS '._resume.pdf' resource forks
+    if not base_name or base_name.startswith('.') or member_name.startswith('__MACOSX/'):
+        return False
+    return os.path.splitext(base_name)[1].lower() in config.ALLOWED_FILE_EXTENSIONS
+
+def _read_member(stream, member_name, max_bytes):
+    """
+    Read a member's contents, refusing members larger than max_bytes.
+
+    At most max_bytes + 1 bytes are read, so a member whose declared size is
+    wrong (e.g. a zip bomb) cannot exhaust memory.
+
+    Returns:
+        The member contents, or None if it is too large.
+    """
+    data = stream.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        logging.warning(f"Skipping {member_name}: larger than {config.MAX_PDF_SIZE_MB}MB")
+        return None
+    return data
+
+def _iter_zip(archive_path, max_bytes):
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _is_resume_member(info.filename):
+                continue
+            if info.file_size > max_bytes:
+                logging.warning(f"Skipping {info.filename}: larger than {config.MAX_PDF_SIZE_MB}MB")
+                continue
+            with archive.open(info) as member:
+                data = _read_member(member, info.filename, max_bytes)
+            if data is not None:
+                yield _member_file_name(info.filename), data
+
+def _iter_tar(archive_path, max_bytes):
+    # Stream mode ('r|*') reads the archive front to back without seeking, so
+    # compressed tarballs are never decompressed as a whole
+    with tarfile.open(archive_path, mode='r|*') as archive:
+        for info in archive:
+            if not info.isfile() or not _is_resume_member(info.name):
+                continue
+            if info.size > max_bytes:
+                logging.warning(f"Skipping {info.name}: larger than {config.MAX_PDF_SIZE_MB}MB")
+                continue
+            member = archive.extractfile(info)
+            data = _read_member(member, info.name, max_bytes)
+            if data is not None:
+                yield _member_file_name(info.name), data
+
+def iter_archive(archive_path):
+    """
+    Stream the resumes contained in a .zip or .tar(.gz) archive.
+
+    Members are read into memory one at a time and never extracted to disk, so
+    memory use is bounded by the largest resume (at most MAX_PDF_SIZE_MB)
+    regardless of the archive size. Members that are not resumes or exceed the
+    size limit are skipped.
+
+    Args:
+        archive_path: Path to the archive.
+
+    Yields:
+        Tuples (file name, contents) for each resume in the archive.
+
+    Raises:
+        ValueError: If the file is not a readable archive.
+    """
+    max_bytes = int(config.MAX_PDF_SIZE_MB * 1024 * 1024)
+    try:
+        if os.fspath(archive_path).lower().endswith('.zip'):
+            yield from _iter_zip(archive_path, max_bytes)
+        else:
+            yield from _iter_tar(archive_path, max_bytes)
+    except (zipfile.BadZipFile, tarfile.TarError) as e:
+        raise ValueError(f"Invalid archive {os.path.basename(archive_path)}: {e}")
@@ -0,0 +1,69 @@
+"""
+Streaming DOCX text reader built on zipfile and incremental XML parsing.
+
+Only the headers, word/document.xml and the footers are read: each part is
+decompressed and parsed incrementally, and finished paragraphs are released as
+soon as their text is collected. Media parts are never touched. The output
+matches docx2txt.process (headers, then the body, then footers; paragraphs
+separated by blank lines).
+"""
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+READER_VERSION = "1.0.0"
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_PARAGRAPH = _W + 'p'
+_TEXT = _W + 't'
+_TAB = _W + 'tab'
+_BREAKS = (_W + 'br', _W + 'cr')
+
+_HEADER_RE = re.compile(r'word/header[0-9]*\.xml')
+_FOOTER_RE = re.compile(r'word/footer[0-9]*\.xml')
+DOCUMENT_PART = 'word/document.xml'
+
+def _iter_part_text(archive, name):
+    """Yield the text fragments of an XML part in document order."""
+    with archive.open(name) as part:
+        for event, elem in ET.iterparse(part, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == _PARAGRAPH:
+                    yield '\n\n'
+                elif tag == _TAB:
+                    yield '\t'
+                elif tag in _BREAKS:
+                    yield '\n'
+            elif tag == _TEXT:
+                if elem.text:
+                    yield elem.text
+            elif tag == _PARAGRAPH:
+                # The paragraph's text has been yielded; free its subtree
+                elem.clear()
+
+def read_docx_text(stream):
+    """
+    Extract the text of a DOCX file in one streaming pass.
+
+    Args:
+        stream: A path or seekable binary stream over the DOCX file.
+
+    Returns:
+        The document text.
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a zip archive.
+        KeyError: If the archive has no word/document.xml.
+        xml.etree.ElementTree.ParseError: If a part is not well-formed XML.
+    """
+    with zipfile.ZipFile(stream) as archive:
+        names = archive.namelist()
+        if DOCUMENT_PART not in names:
+            raise KeyError(f"There is no item named '{DOCUMENT_PART}' in the archive")
+        parts = ([name for name in names if _HEADER_RE.match(name)] + [DOCUMENT_PART]
+                 + [name for name in names if _FOOTER_RE.match(name)])
+        fragments = []
+        for name in parts:
+            fragments.extend(_iter_part_text(archive, name))
+    return ''.join(fragments).strip()
@@ -0,0 +1,422 @@
+"""
+Registry of text-extraction backends.
+
+Each backend knows how to open a document from its raw bytes and extract the
+text of a page. The backend named in config (PDF_EXTRACTION_METHOD /
+DOCX_EXTRACTION_METHOD) is tried first; if it cannot open a document or returns
+no text for a page, the remaining backends of the chain are tried in turn.
+Optional libraries (pypdf, pdfminer.six, PyMuPDF) are registered always but
+only used when they are installed.
+"""
+import io
+import logging
+from abc import ABC, abstractmethod
+from importlib import metadata
+import PyPDF2
+import docx2txt
+from .. import config
+from .pdf_parser import SimplePdfReader, PARSER_VERSION
+from .docx_reader import read_docx_text, READER_VERSION
+
+class ExtractionBackend(ABC):
+    """Base class for text-extraction backends."""
+
+    # Name used in config and in the text cache key
+    name = None
+    # Alternative names accepted in config
+    aliases = ()
+    # File extensions this backend can read
+    extensions = ()
+    # Distribution name used to look up the backend version
+    distribution = None
+
+    def is_available(self):
+        """
+        Check whether the backend's library is installed.
+
+        Returns:
+            True if the backend can be used.
+        """
+        return True
+
+    @property
+    def version(self):
+        """
+        Get the version of the backend's library.
+
+        Returns:
+            The version string, or 'unknown' if it cannot be determined.
+        """
+        try:
+            return metadata.version(self.distribution)
+        except (metadata.PackageNotFoundError, ValueError, TypeError):
+            return "unknown"
+
+    @property
+    def identifier(self):
+        """
+        Get the identifier of the backend and its version.
+
+        Returns:
+            A string of the form '<name>-<version>'.
+        """
+        return f"{self.name}-{self.version}"
+
+    @abstractmethod
+    def open(self, data):
+        """
+        Open a document.
+
+        Args:
+            data: The raw document contents (bytes or any buffer).
+
+        Returns:
+            A backend-specific handle passed to page_count and extract_page.
+
+        Raises:
+            Exception: If the document cannot be opened by this backend.
+        """
+        pass
+
+    @abstractmethod
+    def page_count(self, handle):
+        """
+        Get the number of pages of an open document.
+
+        Args:
+            handle: A handle returned by open.
+
+        Returns:
+            The number of pages.
+        """
+        pass
+
+    @abstractmethod
+    def extract_page(self, handle, index):
+        """
+        Extract the text of a page.
+
+        Args:
+            handle: A handle returned by open.
+            index: Zero-based page index.
+
+        Returns:
+            The text of the page (may be empty).
+        """
+        pass
+
+class PyPDF2Backend(ExtractionBackend):
+    """PDF text extraction with PyPDF2."""
+
+    name = "PyPDF2"
+    extensions = ('.pdf',)
+
+    @property
+    def version(self):
+        return PyPDF2.__version__
+
+    def open(self, data):
+        return PyPDF2.PdfReader(_as_stream(data))
+
+    def page_count(self, handle):
+        return len(handle.pages)
+
+    def extract_page(self, handle, index):
+        return handle.pages[index].extract_text() or ""
+
+class StdlibPdfBackend(ExtractionBackend):
+    """PDF text extraction with the built-in pure-stdlib parser."""
+
+    name = "stdlib"
+    aliases = ("custom",)
+    extensions = ('.pdf',)
+
+    @property
+    def version(self):
+        return PARSER_VERSION
+
+    def open(self, data):
+        return SimplePdfReader(data)
+
+    def page_count(self, handle):
+        return len(handle.pages)
+
+    def extract_page(self, handle, index):
+        return handle.pages[index].extract_text() or ""
+
+class PypdfBackend(ExtractionBackend):
+    """PDF text extraction with pypdf, the successor of PyPDF2 (if installed)."""
+
+    name = "pypdf"
+    extensions = ('.pdf',)
+    distribution = "pypdf"
+
+    def is_available(self):
+        return _importable("pypdf")
+
+    def open(self, data):
+        import pypdf
+        return pypdf.PdfReader(_as_stream(data))
+
+    def page_count(self, handle):
+        return len(handle.pages)
+
+    def extract_page(self, handle, index):
+        return handle.pages[index].extract_text() or ""
+
+class PdfminerBackend(ExtractionBackend):
+    """PDF text extraction with pdfminer.six (if installed)."""
+
+    name = "pdfminer"
+    extensions = ('.pdf',)
+    distribution = "pdfminer.six"
+
+    def is_available(self):
+        return _importable("pdfminer")
+
+    def open(self, data):
+        # Lay the document out once; extract_text(page_numbers=...) would re-parse it for every page
+        from pdfminer.high_level import extract_pages
+        return list(extract_pages(_as_stream(data)))
+
+    def page_count(self, handle):
+        return len(handle)
+
+    def extract_page(self, handle, index):
+        from pdfminer.layout import LTTextContainer
+        return "".join(element.get_text() for element in handle[index] if isinstance(element, LTTextContainer))
+
+class PyMuPDFBackend(ExtractionBackend):
+    """PDF text extraction with PyMuPDF (if installed)."""
+
+    name = "pymupdf"
+    aliases = ("fitz",)
+    extensions = ('.pdf',)
+    distribution = "PyMuPDF"
+
+    def is_available(self):
+        return _importable("fitz")
+
+    def open(self, data):
+        import fitz
+        return fitz.open(stream=bytes(data), filetype="pdf")
+
+    def page_count(self, handle):
+        return handle.page_count
+
+    def extract_page(self, handle, index):
+        return handle[index].get_text() or ""
+
+class StdlibDocxBackend(ExtractionBackend):
+    """
+    DOCX text extraction with the built-in streaming reader. The whole document is a single page.
+
+    Produces the same text as docx2txt in one streaming pass, without touching media parts.
+    """
+
+    name = "stdlib-docx"
+    aliases = ("native",)
+    extensions = ('.docx',)
+
+    @property
+    def version(self):
+        return READER_VERSION
+
+    def open(self, data):
+        # Reading the text is cheap enough to double as validation
+        return read_docx_text(_as_stream(data))
+
+    def page_count(self, handle):
+        return 1
+
+    def extract_page(self, handle, index):
+        return handle
+
+class Docx2txtBackend(ExtractionBackend):
+    """DOCX text extraction with docx2txt. The whole document is a single page."""
+
+    name = "docx2txt"
+    extensions = ('.docx',)
+    distribution = "docx2txt"
+
+    def open(self, data):
+        # docx2txt fails on anything that is not a DOCX zip, so a successful
+        # extraction doubles as validation
+        return docx2txt.process(_as_stream(data)) or ""
+
+    def page_count(self, handle):
+        return 1
+
+    def extract_page(self, handle, index):
+        return handle
+
+_backends = {}
+_aliases = {}
+
+def register_backend(backend):
+    """
+    Register a text-extraction backend.
+
+    Backends are tried as fallbacks in registration order.
+
+    Args:
+        backend: An ExtractionBackend instance.
+    """
+    _backends[backend.name.lower()] = backend
+    for alias in backend.aliases:
+        _aliases[alias.lower()] = backend.name.lower()
+    logging.debug(f"Registered extraction backend: {backend.name}")
+
+def get_backend(name):
+    """
+    Get a registered backend by name or alias (case-insensitive).
+
+    Args:
+        name: The backend name.
+
+    Returns:
+        The ExtractionBackend, or None if no such backend is registered.
+    """
+    key = name.lower()
+    return _backends.get(_aliases.get(key, key))
+
+def list_backends(extension=None, available_only=True):
+    """
+    List the registered backends.
+
+    Args:
+        extension: Only list backends that read this extension (e.g. '.pdf').
+        available_only: Only list backends whose library is installed.
+
+    Returns:
+        A list of ExtractionBackend instances in registration order.
+    """
+    return [
+        backend for backend in _backends.values()
+        if (extension is None or extension in backend.extensions)
+        and (not available_only or backend.is_available())
+    ]
+
+def get_backend_chain(extension):
+    """
+    Get the backends to try, in order, for a file extension.
+
+    The configured backend comes first, followed by the configured fallbacks
+    (PDF_EXTRACTION_FALLBACKS, 'stdlib' by default). The fallback 'all' stands
+    for every other available backend for the extension; DOCX files always
+    use it.
+
+    Args:
+        extension: Lower-cased file extension.
+
+    Returns:
+        A list of available ExtractionBackend instances (empty if the
+        extension is not supported).
+    """
+    if extension == '.pdf':
+        preferred, fallbacks = config.PDF_EXTRACTION_METHOD, config.PDF_EXTRACTION_FALLBACKS
+    elif extension == '.docx':
+        preferred, fallbacks = config.DOCX_EXTRACTION_METHOD, ["all"]
+    else:
+        return []
+
+    candidates = [get_backend(preferred)]
+    if candidates[0] is None:
+        logging.warning(f"Unknown extraction backend '{preferred}', using fallbacks")
+    for name in fallbacks:
+        if name.lower() == "all":
+            candidates.extend(list_backends(extension))
+        else:
+            candidates.append(get_backend(name))
+
+    chain = []
+    for backend in candidates:
+        if (backend is not None and backend not in chain
+                and extension in backend.extensions and backend.is_available()):
+            chain.append(backend)
+    return chain
+
+def _importable(module_name):
+    """Check whether a module can be imported, without importing it twice."""
+    try:
+        __import__(module_name)
+    except ImportError:
+        return False
+    return True
+
+class _BufferStream(io.RawIOBase):
+    """
+    Read-only, seekable stream over a buffer such as a memoryview.
+
+    Unlike io.BytesIO, wrapping a memoryview or bytearray does not copy it; only
+    the chunks the reader asks for are copied out.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        # Slice the view directly: zip and PDF readers issue many small reads
+        # and the generic read() round-trip through readinto is much slower
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._position + size)
+        if end <= self._position:
+            return b""
+        data = self._view[self._position:end].tobytes()
+        self._position = end
+        return data
+
+    def readinto(self, b):
+        size = min(len(b), len(self._view) - self._position)
+        if size <= 0:
+            return 0
+        b[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def tell(self):
+        return self._position
+
+def _as_stream(data):
+    """
+    Wrap document contents in a seekable binary stream without copying them.
+
+    Args:
+        data: bytes or any object supporting the buffer protocol.
+
+    Returns:
+        A binary stream over the data.
+    """
+    if isinstance(data, bytes):
+        # BytesIO shares the bytes object until it is written to
+        return io.BytesIO(data)
+    return _BufferStream(data)
+
+# Built-in backends; the order is the default fallback order
+register_backend(PyPDF2Backend())
+register_backend(PypdfBackend())
+register_backend(PyMuPDFBackend())
+register_backend(PdfminerBackend())
+register_backend(StdlibPdfBackend())
+register_backend(StdlibDocxBackend())
+register_backend(Docx2txtBackend())
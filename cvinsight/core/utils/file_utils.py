@@ -1,111 +1,876 @@
 import os
+import re
+import mmap
+import atexit
+import hashlib
 import logging
-import PyPDF2
+import threading
+import zipfile
+import concurrent.futures
+from itertools import repeat
 from .. import config
-# Import docx2txt for DOCX processing
-import docx2txt
+from .text_cache import get_text_cache
+from .extraction_backends import get_backend, get_backend_chain, _as_stream
 
-def validate_file(file_path):
+class ResumeDocument:
     """
-    Validates a file to ensure it meets requirements.
-    
+    Handle for a resume document that is opened, validated and parsed once.
+
+    The raw bytes are read from their source a single time and the parsed text is kept on
+    the handle, so the processor and the extractors can share it without touching
+    the file again. Pages are extracted lazily and remembered, so iterating over
+    the first pages and later asking for the full text never parses a page twice.
+
+    Text is extracted with the configured backend chain (see
+    extraction_backends.get_backend_chain): pages for which the preferred
+    backend returns no text are retried with the fallback backends.
+    """
+
+    def __init__(self, file_path, extension, data):
+        """
+        Initialize the document handle.
+
+        Args:
+            file_path: Path to the source file, or the file name for in-memory documents.
+            extension: Lower-cased file extension (e.g. '.pdf').
+            data: The raw file contents (bytes or any buffer such as a memoryview).
+        """
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.extension = extension
+        self.data = data
+        self.pages = []
+        self.from_cache = False
+        # Set by the processor when the pre-classifier rejects the document
+        self.rejection = None
+        self._content_hash = None
+        self._chain = get_backend_chain(extension)
+        self._handles = {}
+        self._open_errors = {}
+        self._primary = None
+        self._page_total = None
+        self._complete = False
+
+    @property
+    def text(self):
+        """
+        Get the extracted text of the whole document, parsing remaining pages if needed.
+
+        Returns:
+            The concatenated text of all pages.
+        """
+        self.parse()
+        return "".join(self.pages)
+
+    @property
+    def backend(self):
+        """
+        Get the identifier of the backends used to extract this document's text.
+
+        Returns:
+            The backend chain names and versions, used as part of the text cache key.
+        """
+        return "+".join(backend.identifier for backend in self._chain) or "unsupported"
+
+    @property
+    def content_hash(self):
+        """
+        Get the SHA-256 of the raw file contents, computed once over the shared buffer.
+
+        Returns:
+            The hex digest.
+        """
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.data).hexdigest()
+        return self._content_hash
+
+    @property
+    def page_count(self):
+        """
+        Get the number of pages extracted from the document.
+
+        Returns:
+            The number of pages (DOCX files are treated as a single page).
+        """
+        return len(self.pages)
+
+    def set_pages(self, pages):
+        """
+        Set the pages of the document from an earlier extraction (e.g. the text cache).
+
+        Args:
+            pages: The list of page texts.
+        """
+        self.pages = list(pages)
+        self._complete = True
+
+    def close(self):
+        """
+        Release the backend handles and unmap the file contents.
+
+        The extracted pages stay available. Closing is optional: a mapping that
+        is still referenced by a backend is left to be unmapped by the garbage
+        collector.
+        """
+        self._handles = {}
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_backend(self, position):
+        """
+        Open the document with the backend at a position of the chain.
+
+        Returns:
+            The backend handle, or None if the backend cannot open the document.
+        """
+        if position not in self._handles:
+            backend = self._chain[position]
+            try:
+                self._handles[position] = backend.open(self.data)
+            except Exception as e:
+                logging.debug(f"Backend {backend.name} could not open {self.file_name}: {e}")
+                self._handles[position] = None
+                self._open_errors[position] = e
+        return self._handles[position]
+
+    def validate(self):
+        """
+        Open the document with the first backend of the chain that accepts it,
+        which validates it without extracting PDF pages.
+
+        Raises:
+            ValueError: If the document is not a valid PDF/DOCX file.
+        """
+        if self._complete or self._primary is not None:
+            return
+
+        if not self._chain:
+            raise ValueError(f"Unsupported file type: {self.extension}")
+
+        for position, backend in enumerate(self._chain):
+            handle = self._open_backend(position)
+            if handle is None:
+                continue
+            self._primary = position
+            self._page_total = backend.page_count(handle)
+            if position > 0:
+                logging.info(f"Opened {self.file_name} with fallback backend {backend.name}")
+            return
+
+        error = self._open_errors[0]
+        raise ValueError(f"Invalid {self.extension[1:].upper()} file: {str(error)}")
+
+    def _extract_page(self, index, first_position=None):
+        """
+        Extract a page, falling back along the backend chain while it has no text.
+
+        Args:
+            index: Zero-based page index.
+            first_position: Position in the chain of the first backend to try.
+                Defaults to the backend that opened the document.
+
+        Returns:
+            The page text (empty if no backend found any text).
+
+        Raises:
+            IOError: If every backend that was tried failed on the page.
+        """
+        first_position = self._primary if first_position is None else first_position
+        first_error = None
+        extracted = False
+        for position in range(first_position, len(self._chain)):
+            handle = self._open_backend(position)
+            if handle is None:
+                continue
+            backend = self._chain[position]
+            try:
+                if index >= backend.page_count(handle):
+                    continue
+                text = backend.extract_page(handle, index) or ""
+            except Exception as e:
+                first_error = first_error or e
+                continue
+            extracted = True
+            if text.strip():
+                if position != self._primary:
+                    logging.debug(f"Page {index + 1} of {self.file_name} extracted with fallback backend {backend.name}")
+                return text
+
+        if not extracted and first_error is not None:
+            raise IOError(f"Error reading {self.extension[1:].upper()} file: {first_error}")
+        return ""
+
+    def iter_pages(self):
+        """
+        Iterate over the page texts, extracting each page only when it is requested.
+
+        Yields:
+            The text of each page in order.
+
+        Raises:
+            ValueError: If the document is not a valid PDF/DOCX file.
+            IOError: If the document is valid but text extraction fails.
+        """
+        index = 0
+        while True:
+            if index < len(self.pages):
+                yield self.pages[index]
+                index += 1
+                continue
+            if self._complete:
+                return
+
+            self.validate()
+            if index >= self._page_total:
+                self._complete = True
+                return
+            self.pages.append(self._extract_page(index))
+
+    def parse(self):
+        """
+        Validate and extract the text of every remaining page in a single pass.
+
+        Raises:
+            ValueError: If the document is not a valid PDF/DOCX file.
+            IOError: If the document is valid but text extraction fails.
+        """
+        if self._complete:
+            return
+
+        self.validate()
+
+        if (config.PDF_PARALLEL_EXTRACTION and self.extension == '.pdf' and not self.pages
+                and self._page_total >= config.PDF_PARALLEL_MIN_PAGES):
+            backend = self._chain[self._primary]
+            try:
+                pages = _extract_pdf_pages_parallel(self.data, self._page_total, backend.name)
+            except Exception as e:
+                raise IOError(f"Error reading PDF file: {e}")
+            # Pages without text still go through the fallback backends
+            for index, page_text in enumerate(pages):
+                if not page_text.strip():
+                    pages[index] = self._extract_page(index, self._primary + 1)
+            self.set_pages(pages)
+        else:
+            for _ in self.iter_pages():
+                pass
+
+def _detect_extension(data):
+    """
+    Detect the document type of in-memory contents from their magic bytes.
+
     Args:
-        file_path: Path to the file to validate.
-        
+        data: The raw document contents.
+
     Returns:
-        A tuple (is_valid, message) where is_valid is a boolean and message is an error message if invalid.
+        '.pdf', '.docx' or an empty string if the type is unknown.
+    """
+    view = memoryview(data).cast('B')
+    # The PDF header may be preceded by up to 1KB of junk
+    if b"%PDF-" in view[:1024].tobytes():
+        return '.pdf'
+    if view[:4].tobytes() == b"PK\x03\x04":
+        try:
+            with zipfile.ZipFile(_as_stream(data)) as archive:
+                if 'word/document.xml' in archive.namelist():
+                    return '.docx'
+        except zipfile.BadZipFile:
+            pass
+    return ''
+
+# Bytes requested per read() when streaming uploads
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+def _declared_size(stream):
+    """Get the size of a file-backed stream from its descriptor, or None if it has none."""
+    try:
+        return os.fstat(stream.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def read_stream(stream, max_size_mb=None, chunk_size=_STREAM_CHUNK_SIZE):
+    """
+    Read an upload chunk by chunk, enforcing the size limit while the bytes arrive.
+
+    Reading stops at the first chunk that crosses the limit, so an oversized
+    upload is rejected after at most max_size_mb plus one chunk instead of
+    being buffered whole. File-backed streams are rejected from their
+    descriptor's size before anything is read.
+
+    Args:
+        stream: A binary file object, or an iterable of byte chunks (e.g. a
+            request body iterator).
+        max_size_mb: The size limit in MB. Defaults to config.MAX_PDF_SIZE_MB.
+        chunk_size: Bytes requested per read() from file objects.
+
+    Returns:
+        The contents as a bytearray.
+
+    Raises:
+        ValueError: If the upload is larger than the limit.
+    """
+    max_size_mb = config.MAX_PDF_SIZE_MB if max_size_mb is None else max_size_mb
+    max_bytes = int(max_size_mb * 1024 * 1024)
+
+    size = _declared_size(stream)
+    if size is not None and size > max_bytes:
+        raise ValueError(f"File too large. Maximum size is {max_size_mb}MB, got {size / (1024 * 1024):.2f}MB")
+
+    if hasattr(stream, 'read'):
+        chunks = iter(lambda: stream.read(chunk_size), b'')
+    else:
+        chunks = iter(stream)
+
+    data = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            # e.g. None from a non-blocking stream at its end
+            break
+        if len(data) + len(chunk) > max_bytes:
+            raise ValueError(f"File too large. Maximum size is {max_size_mb}MB, "
+                             f"received more than {max_size_mb}MB")
+        data += chunk
+    return data
+
+def _is_path(source):
+    """Check whether a document source is a filesystem path."""
+    return isinstance(source, (str, os.PathLike))
+
+def _check_buffer(data, file_name):
+    """
+    Run the cheap checks (type, size) on in-memory document contents.
+
+    Args:
+        data: The raw document contents.
+        file_name: Optional file name used to determine the type.
+
+    Returns:
+        A tuple (is_valid, message, extension).
+    """
+    if file_name:
+        _, ext = os.path.splitext(file_name)
+    else:
+        ext = _detect_extension(data)
+    if ext.lower() not in config.ALLOWED_FILE_EXTENSIONS:
+        return False, f"Invalid file type. Expected one of {config.ALLOWED_FILE_EXTENSIONS}, got {ext or 'unknown'}", ext
+
+    file_size_mb = memoryview(data).nbytes / (1024 * 1024)  # Convert bytes to MB
+    if file_size_mb > config.MAX_PDF_SIZE_MB:
+        return False, f"File too large. Maximum size is {config.MAX_PDF_SIZE_MB}MB, got {file_size_mb:.2f}MB", ext
+
+    return True, "File is valid", ext
+
+def _read_source(source, file_name=None):
+    """
+    Check a document source and read its contents.
+
+    File objects and iterables of byte chunks are read with read_stream, so
+    the size limit is enforced while they are read.
+
+    Args:
+        source: A file path, bytes, bytearray, memoryview, binary file object or
+            iterable of byte chunks.
+        file_name: Optional file name for in-memory sources, used to determine
+            the type (detected from the contents otherwise) and to name results.
+
+    Returns:
+        A tuple (name, extension, data). For paths the name is the path itself.
+
+    Raises:
+        ValueError: If the source fails the existence/type/size checks.
+        TypeError: If the source is not a supported type.
+    """
+    if _is_path(source):
+        file_path = os.fspath(source)
+        _, ext = os.path.splitext(file_path)
+        return file_path, ext.lower(), _read_path(file_path)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = source
+    elif hasattr(source, 'read'):
+        data = read_stream(source)
+        source_name = getattr(source, 'name', None)
+        if not file_name and isinstance(source_name, str):
+            file_name = os.path.basename(source_name)
+    elif hasattr(source, '__iter__'):
+        data = read_stream(source)
+    else:
+        raise TypeError(f"Unsupported document source: {type(source).__name__}")
+
+    is_valid, message, ext = _check_buffer(data, file_name)
+    if not is_valid:
+        raise ValueError(message)
+    if not file_name:
+        # Give anonymous uploads a stable name so their results do not collide
+        file_name = f"document_{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+    return file_name, ext.lower(), data
+
+def _read_path(file_path):
+    """
+    Check a file and read its contents with a single open.
+
+    The size check uses the open descriptor. Files of at least MMAP_MIN_SIZE_KB
+    are memory-mapped (unless MMAP_READS_ENABLED is off), so validation, hashing
+    and extraction all share the page cache instead of a private copy of the
+    file; smaller files are cheaper to read in one call.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        A read-only mmap over the file, or bytes for small files and when
+        memory-mapping is disabled.
+
+    Raises:
+        ValueError: If the file does not exist or fails the type/size checks.
+    """
+    _, ext = os.path.splitext(file_path)
+    if ext.lower() not in config.ALLOWED_FILE_EXTENSIONS:
+        raise ValueError(f"Invalid file type. Expected one of {config.ALLOWED_FILE_EXTENSIONS}, got {ext}")
+
+    try:
+        file = open(file_path, 'rb')
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {file_path}")
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        file_size_mb = size / (1024 * 1024)  # Convert bytes to MB
+        if file_size_mb > config.MAX_PDF_SIZE_MB:
+            raise ValueError(f"File too large. Maximum size is {config.MAX_PDF_SIZE_MB}MB, got {file_size_mb:.2f}MB")
+        # Empty files cannot be mapped
+        if config.MMAP_READS_ENABLED and size and size >= config.MMAP_MIN_SIZE_KB * 1024:
+            # The mapping stays valid after the file is closed
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return file.read()
+
+def describe_source(source, file_name=None):
+    """
+    Get a short display name for a document source, for log messages.
+
+    Args:
+        source: A file path, bytes, bytearray, memoryview or binary file object.
+        file_name: Optional file name given for in-memory sources.
+
+    Returns:
+        The file name of the source, or a placeholder for anonymous buffers.
+    """
+    if file_name:
+        return file_name
+    if _is_path(source):
+        return os.path.basename(os.fspath(source))
+    source_name = getattr(source, 'name', None)
+    if isinstance(source_name, str):
+        return os.path.basename(source_name)
+    return "<in-memory document>"
+
+def _check_file(file_path):
+    """
+    Run the cheap checks (existence, extension, size) on a file.
+
+    Args:
+        file_path: Path to the file to check.
+
+    Returns:
+        A tuple (is_valid, message).
     """
     # Check if file exists
     if not os.path.exists(file_path):
         return False, f"File not found: {file_path}"
-    
+
     # Check file extension
     _, ext = os.path.splitext(file_path)
     if ext.lower() not in config.ALLOWED_FILE_EXTENSIONS:
         return False, f"Invalid file type. Expected one of {config.ALLOWED_FILE_EXTENSIONS}, got {ext}"
-    
+
     # Check file size
     file_size_mb = os.path.getsize(file_path) / (1024 * 1024)  # Convert bytes to MB
     if file_size_mb > config.MAX_PDF_SIZE_MB:
         return False, f"File too large. Maximum size is {config.MAX_PDF_SIZE_MB}MB, got {file_size_mb:.2f}MB"
-    
-    # Validation specific to file type
-    if ext.lower() == '.pdf':
-        # Try opening the PDF to verify it's valid
-        try:
-            with open(file_path, 'rb') as file:
-                PyPDF2.PdfReader(file)
-        except Exception as e:
-            return False, f"Invalid PDF file: {str(e)}"
-    elif ext.lower() == '.docx':
-        # Basic validation for DOCX files
-        try:
-            # Simple validation attempt
-            docx2txt.process(file_path)
-        except Exception as e:
-            return False, f"Invalid DOCX file: {str(e)}"
-    
+
     return True, "File is valid"
 
-def read_file(file_path):
+def _extract_pdf_page_range(data, start, stop, backend_name="PyPDF2"):
+    """
+    Extract the text of a range of pages from PDF bytes.
+
+    Runs in a worker process, so it re-opens the PDF from the raw bytes.
+
+    Args:
+        data: The raw PDF contents.
+        start: Index of the first page to extract.
+        stop: Index one past the last page to extract.
+        backend_name: Name of the extraction backend to use.
+
+    Returns:
+        A list with the text of each page in the range.
+    """
+    backend = get_backend(backend_name)
+    handle = backend.open(data)
+    return [backend.extract_page(handle, i) for i in range(start, stop)]
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+# Default of the cache arguments: use the shared cache; an explicit None or False disables caching
+_SHARED_CACHE = object()
+
+def _resolve_cache(cache):
+    """Get the TextCache to use for a cache argument, or None if caching is disabled."""
+    if cache is _SHARED_CACHE:
+        return get_text_cache()
+    return None if cache is False else cache
+
+def _get_page_pool():
+    """Get the shared process pool used for parallel page extraction."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = concurrent.futures.ProcessPoolExecutor(max_workers=config.PDF_PARALLEL_WORKERS)
+            atexit.register(shutdown_page_pool)
+        return _page_pool
+
+def shutdown_page_pool():
+    """Shut down the parallel page extraction pool, so its worker processes exit; it restarts on demand."""
+    global _page_pool
+    with _page_pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        atexit.unregister(shutdown_page_pool)
+        pool.shutdown()
+
+def _extract_pdf_pages_parallel(data, page_count, backend_name="PyPDF2"):
+    """
+    Extract the text of every page of a PDF across the shared process pool.
+
+    The pages are split into one contiguous range per worker; results are
+    collected in submission order so the page order is preserved.
+
+    Args:
+        data: The raw PDF contents.
+        page_count: Number of pages in the PDF.
+        backend_name: Name of the extraction backend to use.
+
+    Returns:
+        A list with the text of each page.
+    """
+    workers = max(1, min(config.PDF_PARALLEL_WORKERS, page_count))
+    chunk_size = -(-page_count // workers)  # Ceiling division
+    starts = list(range(0, page_count, chunk_size))
+    stops = [min(start + chunk_size, page_count) for start in starts]
+
+    logging.debug(f"Extracting {page_count} pages in {len(starts)} parallel chunks")
+    # Worker processes need picklable bytes rather than a memoryview
+    data = data if isinstance(data, bytes) else bytes(data)
+    chunks = _get_page_pool().map(_extract_pdf_page_range, repeat(data), starts, stops, repeat(backend_name))
+    return [page for chunk in chunks for page in chunk]
+
+def _load_document(source, cache, file_name=None):
+    """
+    Check and read a resume, filling its pages from the text cache if possible.
+
+    Args:
+        source: A file path, bytes, bytearray, memoryview or binary file object.
+        cache: The TextCache to consult, or None.
+        file_name: Optional file name for in-memory sources.
+
+    Returns:
+        A tuple (document, cache_key); cache_key is None when no cache is used.
+
+    Raises:
+        ValueError: If the source fails the existence/type/size checks.
+    """
+    name, ext, data = _read_source(source, file_name)
+    document = ResumeDocument(name, ext, data)
+
+    key = None
+    if cache is not None:
+        key = cache.make_key(data, document.backend, content_hash=document.content_hash)
+        pages = cache.get(key)
+        if pages is not None:
+            logging.debug(f"Text cache hit for {document.file_name}")
+            document.set_pages(pages)
+            document.from_cache = True
+    return document, key
+
+def open_document(source, cache=_SHARED_CACHE, file_name=None, on_first_page=None):
+    """
+    Open, validate and extract the text of a resume file in a single pass.
+
+    If a text cache is in use and already holds the text for these exact file
+    bytes and backend, the document is not parsed at all.
+
+    Args:
+        source: Path to the resume file, or its contents as bytes, bytearray,
+            memoryview or a binary file object. Buffers are handed to the
+            readers without being copied.
+        cache: The TextCache to consult, or None/False to bypass caching.
+            Defaults to the shared cache from get_text_cache() (None when the
+            cache is disabled).
+        file_name: Optional file name for in-memory sources. If omitted, the
+            type is detected from the contents.
+        on_first_page: Optional callable called with the text of the first page
+            as soon as it is extracted, before the remaining pages are parsed
+            (e.g. to start an extraction early). It should return quickly.
+
+    Returns:
+        A ResumeDocument with its pages extracted.
+
+    Raises:
+        ValueError: If the file fails validation.
+        IOError: If the file is valid but text extraction fails.
+    """
+    cache = _resolve_cache(cache)
+    document, key = _load_document(source, cache, file_name)
+    if document.from_cache:
+        if on_first_page is not None:
+            on_first_page(document.pages[0] if document.pages else "")
+        return document
+
+    if on_first_page is not None:
+        on_first_page(next(document.iter_pages(), ""))
+    document.parse()
+
+    if cache is not None:
+        cache.put(key, document.pages)
+    return document
+
+def iter_text(source, max_pages=None, max_chars=None, cache=_SHARED_CACHE, file_name=None):
+    """
+    Lazily yield the text of a resume file page by page.
+
+    Pages are only parsed when the caller asks for them, and iteration stops as
+    soon as either limit is reached, so pages past the limits are never parsed.
+
+    Args:
+        source: Path to the resume file, or its contents as bytes, bytearray,
+            memoryview or a binary file object.
+        max_pages: Maximum number of pages to yield, or None for no limit.
+        max_chars: Maximum total number of characters to yield, or None for no
+            limit. The last page yielded is truncated to fit.
+        cache: The TextCache to consult, or None/False to bypass caching.
+            Defaults to the shared cache from get_text_cache() (None when the
+            cache is disabled).
+        file_name: Optional file name for in-memory sources.
+
+    Yields:
+        The text of each page in order.
+
+    Raises:
+        ValueError: If the file fails validation (raised on first iteration).
+        IOError: If the file is valid but text extraction fails.
+    """
+    cache = _resolve_cache(cache)
+    document, _ = _load_document(source, cache, file_name)
+
+    pages = document.iter_pages()
+    remaining_chars = max_chars
+    page_number = 0
+    while max_pages is None or page_number < max_pages:
+        if remaining_chars is not None and remaining_chars <= 0:
+            return
+        page_text = next(pages, None)
+        if page_text is None:
+            return
+        if remaining_chars is not None:
+            page_text = page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+        page_number += 1
+        yield page_text
+
+_STARTXREF_RE = re.compile(rb'startxref\s+(\d+)')
+_XREF_TARGET_RE = re.compile(rb'\s*(xref|\d+\s+\d+\s+obj)')
+
+def _check_pdf_structure(stream, size):
+    """
+    Check the structure of a PDF without parsing it.
+
+    Only the header, the trailer and the cross-reference section the trailer
+    points to are read.
+
+    Args:
+        stream: A seekable binary stream over the file.
+        size: Size of the file in bytes.
+
+    Returns:
+        A tuple (is_valid, message).
+    """
+    head = stream.read(1024)
+    header_offset = head.find(b"%PDF-")
+    if header_offset == -1:
+        return False, "Invalid PDF file: missing %PDF- header"
+
+    stream.seek(max(0, size - 1024))
+    tail = stream.read()
+    if b"%%EOF" not in tail:
+        return False, "Invalid PDF file: missing %%EOF marker"
+    offsets = _STARTXREF_RE.findall(tail)
+    if not offsets:
+        return False, "Invalid PDF file: missing startxref"
+
+    # Offsets are relative to the header when junk precedes it
+    xref_offset = int(offsets[-1])
+    for base in {0, header_offset}:
+        if xref_offset + base >= size:
+            continue
+        stream.seek(xref_offset + base)
+        if _XREF_TARGET_RE.match(stream.read(32)):
+            return True, "File is valid"
+    return False, "Invalid PDF file: startxref does not point to a cross-reference section"
+
+def _check_docx_structure(stream):
+    """
+    Check the structure of a DOCX without decompressing it.
+
+    Only the zip central directory is read.
+
+    Args:
+        stream: A seekable binary stream over the file.
+
+    Returns:
+        A tuple (is_valid, message).
+    """
+    if stream.read(4) != b"PK\x03\x04":
+        return False, "Invalid DOCX file: not a ZIP archive"
+    stream.seek(0)
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            names = archive.namelist()
+    except zipfile.BadZipFile as e:
+        return False, f"Invalid DOCX file: {str(e)}"
+    if 'word/document.xml' not in names:
+        return False, "Invalid DOCX file: word/document.xml is missing"
+    return True, "File is valid"
+
+def _check_structure(stream, size, ext):
+    """
+    Run the cheap structural check for a file type.
+
+    Args:
+        stream: A seekable binary stream over the file.
+        size: Size of the file in bytes.
+        ext: Lower-cased file extension.
+
+    Returns:
+        A tuple (is_valid, message).
+    """
+    if ext == '.pdf':
+        return _check_pdf_structure(stream, size)
+    if ext == '.docx':
+        return _check_docx_structure(stream)
+    return False, f"Unsupported file type: {ext}"
+
+def validate_file(file_path, file_name=None, deep=None):
+    """
+    Validates a file to ensure it meets requirements.
+
+    By default only the file structure is checked (magic bytes, the PDF
+    trailer and cross-reference section, the DOCX zip central directory with
+    word/document.xml), which reads a few KB per file without decoding any
+    content. The deep check opens the document with the extraction backends.
+
+    Args:
+        file_path: Path to the file to validate, or its contents as bytes,
+            bytearray, memoryview or a binary file object.
+        file_name: Optional file name for in-memory sources.
+        deep: Whether to fully open the document. Defaults to config.DEEP_FILE_VALIDATION.
+
+    Returns:
+        A tuple (is_valid, message) where is_valid is a boolean and message is an error message if invalid.
+    """
+    deep = config.DEEP_FILE_VALIDATION if deep is None else deep
+
+    if not deep and _is_path(file_path):
+        # Check paths without reading the whole file
+        path = os.fspath(file_path)
+        is_valid, message = _check_file(path)
+        if not is_valid:
+            return is_valid, message
+        with open(path, 'rb') as file:
+            return _check_structure(file, os.fstat(file.fileno()).st_size, os.path.splitext(path)[1].lower())
+
+    try:
+        name, ext, data = _read_source(file_path, file_name)
+        if not deep:
+            return _check_structure(_as_stream(data), memoryview(data).nbytes, ext)
+        # Opening the document with the extraction backends verifies it is valid
+        with ResumeDocument(name, ext, data) as document:
+            document.validate()
+    except (ValueError, TypeError) as e:
+        return False, str(e)
+
+    return True, "File is valid"
+
+def read_file(file_path, file_name=None):
     """
     Reads a file and extracts the text.
-    
+
+    The file is validated and parsed in a single pass via open_document.
+
+    Args:
+        file_path: The path to the file, or its contents as bytes, bytearray,
+            memoryview or a binary file object.
+        file_name: Optional file name for in-memory sources.
+
+    Returns:
+        The extracted text.
+    """
+    return open_document(file_path, file_name=file_name).text
+
+def _read_typed_file(file_path, extension):
+    """
+    Extract the text of a file of a known type with the configured backend chain.
+
     Args:
         file_path: The path to the file.
-        
+        extension: The file type, '.pdf' or '.docx'.
+
     Returns:
         The extracted text.
+
+    Raises:
+        IOError: If the file cannot be read or its text cannot be extracted.
     """
-    is_valid, message = validate_file(file_path)
-    if not is_valid:
-        raise ValueError(message)
-    
-    # Determine file type and call appropriate processor
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() == '.pdf':
-        return read_pdf_file(file_path)
-    elif ext.lower() == '.docx':
-        return read_docx_file(file_path)
-    else:
-        raise ValueError(f"Unsupported file type: {ext}")
+    try:
+        with ResumeDocument(os.fspath(file_path), extension, _read_path(file_path)) as document:
+            return document.text
+    except Exception as e:
+        raise IOError(f"Error reading {extension[1:].upper()} file: {e}")
 
 def read_pdf_file(file_path):
     """
     Reads a PDF file and extracts the text.
-    
+
+    Uses the same backend chain as read_file (PDF_EXTRACTION_METHOD first,
+    then the fallback backends).
+
     Args:
         file_path: The path to the PDF file.
-        
+
     Returns:
         The extracted text.
     """
-    text = ""
-    try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
-        return text
-    except Exception as e:
-        raise IOError(f"Error reading PDF file: {e}")
+    return _read_typed_file(file_path, '.pdf')
 
 def read_docx_file(file_path):
     """
     Reads a DOCX file and extracts the text.
-    
+
+    Uses the same backend chain as read_file (DOCX_EXTRACTION_METHOD first,
+    then the fallback backends).
+
     Args:
         file_path: The path to the DOCX file.
-        
+
     Returns:
         The extracted text.
     """
-    try:
-        # Using docx2txt for extraction - handles text from paragraphs, tables, headers, and footers
-        text = docx2txt.process(file_path)
-        return text
-    except Exception as e:
-        logging.error(f"Error extracting text from DOCX file: {e}")
-        raise IOError(f"Error reading DOCX file: {e}") 
\ No newline at end of file
+    return _read_typed_file(file_path, '.docx')
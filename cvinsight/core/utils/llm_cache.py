@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from .. import config
+
+class LLMResponseCache:
+    """
+    Persistent cache of LLM extraction responses, stored in SQLite.
+
+    Entries are keyed by the model name, a hash of the prompt template and
+    output model, the plugin version and a hash of the input data, so re-running
+    a resume (or retrying after a failure) returns the stored result without an
+    LLM call, while a new model, prompt or plugin version misses. Entries expire
+    after ttl_seconds, and the cache is capped in size, evicting the least
+    recently used entries first.
+    """
+
+    def __init__(self, path=None, ttl_seconds=None, max_size_mb=None):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: Path of the SQLite database. Defaults to config.LLM_CACHE_PATH.
+            ttl_seconds: Seconds an entry stays valid, or 0 for no expiry.
+                Defaults to config.LLM_CACHE_TTL_HOURS.
+            max_size_mb: Maximum total size of the stored responses in MB.
+                Defaults to config.LLM_CACHE_MAX_SIZE_MB.
+        """
+        self.path = path or config.LLM_CACHE_PATH
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.LLM_CACHE_TTL_HOURS * 3600
+        max_size_mb = max_size_mb if max_size_mb is not None else config.LLM_CACHE_MAX_SIZE_MB
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # One connection shared by the extractor threads, serialized by _lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, result TEXT, token_usage TEXT, "
+            "size INTEGER, created_at REAL, last_used REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name, pydantic_model, prompt_template, plugin_version, input_data):
+        """
+        Build the cache key for an extraction call.
+
+        Args:
+            model_name: The LLM model name.
+            pydantic_model: The Pydantic model the output is parsed into.
+            prompt_template: The prompt template.
+            plugin_version: The version of the plugin making the call, or None.
+            input_data: The input data passed to the prompt template.
+
+        Returns:
+            A hex digest identifying the call.
+        """
+        template_hash = hashlib.sha256(
+            f"{getattr(pydantic_model, '__name__', pydantic_model)}:{prompt_template}".encode("utf-8")).hexdigest()
+        input_hash = hashlib.sha256(
+            json.dumps(input_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            f"{model_name}:{template_hash}:{plugin_version}:{input_hash}".encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Look up a stored response.
+
+        Args:
+            key: A key returned by make_key.
+
+        Returns:
+            A tuple (result, token usage of the original call), or None on a
+            miss or if the entry has expired.
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT result, token_usage, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl_seconds and now - row[2] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                # Mark the entry as recently used
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Could not read LLM cache entry {key}: {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return json.loads(row[0]), json.loads(row[1])
+
+    def put(self, key, model_name, result, token_usage):
+        """
+        Store a response, evicting old entries if needed.
+
+        Args:
+            key: A key returned by make_key.
+            model_name: The LLM model name.
+            result: The extracted result (JSON serializable).
+            token_usage: The token usage of the call.
+        """
+        result_json = json.dumps(result, default=str)
+        usage_json = json.dumps(token_usage, default=str)
+        size = len(result_json) + len(usage_json)
+        if size > self.max_size_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, result, token_usage, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model_name, result_json, usage_json, size, now, now))
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Could not write LLM cache entry {key}: {e}")
+
+    def _evict(self):
+        """Remove expired entries, then least recently used ones until the cache fits its size cap."""
+        if self.ttl_seconds:
+            self.evictions += self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)).rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if total <= self.max_size_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+            logging.debug(f"Evicted LLM cache entry: {key}")
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            A dictionary with hits, misses, evictions, the number of entries and
+            their size in bytes.
+        """
+        with self._lock:
+            entries, size_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": size_bytes
+            }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """
+    Get the shared LLM response cache configured in config.
+
+    Returns:
+        The shared LLMResponseCache, or None if the cache is disabled.
+    """
+    global _default_cache
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMResponseCache()
+        return _default_cache
@@ -0,0 +1,163 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+
+MANIFEST_VERSION = 1
+
+def hash_bytes(data):
+    """
+    Hash file contents for the manifest.
+
+    Args:
+        data: The raw file contents.
+
+    Returns:
+        The SHA-256 hex digest.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """
+    Hash a file for the manifest without reading it into memory at once.
+
+    Args:
+        path: Path to the file.
+        chunk_size: Number of bytes read per step.
+
+    Returns:
+        The SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ProcessingManifest:
+    """
+    Persistent record of the resumes a batch run has already processed.
+
+    Each entry stores the file's size, mtime and content hash, the versions of
+    the plugins that processed it, the settings that shape the output and the
+    path of the saved result, so re-runs only process new or changed files. A
+    file is unchanged when its size and mtime match; if only the mtime differs
+    (e.g. the file was touched or copied) the content hash decides. A plugin
+    upgrade, a settings change or a missing result file makes the file due
+    again. Files the pre-classifier rejected as non-resumes are
+    recorded with the reason, the classifier version and no result, and are
+    skipped while the classifier is enabled and its version is unchanged.
+    """
+
+    def __init__(self, path):
+        """
+        Load the manifest, starting empty if it is missing or unreadable.
+
+        Args:
+            path: Path of the manifest JSON file.
+        """
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.entries = manifest.get("files", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"Ignoring unreadable manifest {path}: {e}")
+
+    def is_unchanged(self, key, size, mtime, plugin_versions, get_hash, skip_rejected=False,
+                     classifier_version=None, settings=None):
+        """
+        Check whether a file was already processed in its current form.
+
+        Args:
+            key: The file's key (its path, or archive path and member name).
+            size: The file size in bytes.
+            mtime: The file modification time, or None if it has none (archive members).
+            plugin_versions: Dictionary of plugin name to version for this run.
+            get_hash: Callable returning the content hash, only called when the
+                      size and mtime alone cannot decide.
+            skip_rejected: Treat files rejected as non-resumes as unchanged.
+            classifier_version: Version of the pre-classifier; rejections by another
+                                version are checked again.
+            settings: Dictionary of the settings that shape the output for this run.
+
+        Returns:
+            True if the file can be skipped.
+        """
+        entry = self.entries.get(key)
+        if (entry is None or entry.get("size") != size or entry.get("plugin_versions") != plugin_versions
+                or entry.get("settings") != settings):
+            return False
+        if entry.get("rejected") is not None:
+            if not skip_rejected or entry.get("classifier_version") != classifier_version:
+                return False
+        elif not os.path.exists(entry.get("output_path") or ""):
+            return False
+        if mtime is not None and entry.get("mtime") == mtime:
+            return True
+        if get_hash() != entry.get("sha256"):
+            return False
+        # Same content under a new mtime: remember it so the next check is a stat only
+        entry["mtime"] = mtime
+        return True
+
+    def record(self, key, size, mtime, content_hash, plugin_versions, output_path, rejected=None,
+               classifier_version=None, settings=None):
+        """
+        Record a processed file.
+
+        Args:
+            key: The file's key.
+            size: The file size in bytes.
+            mtime: The file modification time, or None.
+            content_hash: The content hash from hash_file or hash_bytes.
+            plugin_versions: Dictionary of plugin name to version used.
+            output_path: Path of the saved result, or None if the file was rejected.
+            rejected: Why the pre-classifier rejected the file, or None.
+            classifier_version: Version of the pre-classifier that rejected the file.
+            settings: Dictionary of the settings that shaped the output.
+        """
+        self.entries[key] = {
+            "size": size,
+            "mtime": mtime,
+            "sha256": content_hash,
+            "plugin_versions": plugin_versions,
+            "settings": settings,
+            "output_path": output_path,
+            "rejected": rejected,
+            "classifier_version": classifier_version if rejected is not None else None
+        }
+
+    def snapshot(self):
+        """
+        Copy the entries, so they can be saved while other threads keep recording.
+
+        Returns:
+            A copy of the entries to pass to save.
+        """
+        return {key: dict(entry) for key, entry in self.entries.items()}
+
+    def save(self, entries=None):
+        """
+        Write the manifest atomically, so an interrupted run never leaves it corrupt.
+
+        Args:
+            entries: The entries to write, from snapshot. Defaults to the current entries.
+        """
+        entries = self.entries if entries is None else entries
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "files": entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Could not write manifest {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
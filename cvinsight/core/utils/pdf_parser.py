@@ -0,0 +1,435 @@
+"""
+Minimal pure-stdlib PDF text extractor.
+
+This is the fallback text-extraction backend used when no PDF library returns
+text. It understands the subset of PDF that resume generators produce: plain
+and compressed (object stream) objects, Flate-encoded content streams, simple
+fonts and ToUnicode CMaps. Anything more exotic yields empty text rather than
+an error.
+"""
+import re
+import mmap
+import zlib
+import logging
+
+PARSER_VERSION = "1.0.0"
+
+_OBJECT_RE = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_STREAM_RE = re.compile(rb'stream\r?\n')
+_REF_RE = re.compile(rb'(\d+)\s+\d+\s+R')
+_PAGE_TYPE_RE = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+_HEX_RE = re.compile(rb'<([0-9A-Fa-f\s]*)>')
+
+# Operators that move the text position to a new line
+_NEWLINE_OPERATORS = {b"T*", b"'", b'"'}
+
+class PdfObject:
+    """An indirect PDF object: its dictionary/value source and optional stream data."""
+
+    def __init__(self, header, stream=None):
+        self.header = header
+        self.stream = stream
+
+    def get_ref(self, key):
+        """Get the object number referenced by /key, or None."""
+        match = re.search(rb'/' + key + rb'\s+(\d+)\s+\d+\s+R', self.header)
+        return int(match.group(1)) if match else None
+
+    def get_refs(self, key):
+        """Get the object numbers referenced by /key as a single ref or an array."""
+        match = re.search(rb'/' + key + rb'\s*\[([^\]]*)\]', self.header)
+        if match:
+            return [int(num) for num in _REF_RE.findall(match.group(1))]
+        ref = self.get_ref(key)
+        return [ref] if ref is not None else []
+
+    def get_int(self, key):
+        """Get a direct integer value of /key, or None."""
+        match = re.search(rb'/' + key + rb'\s+(\d+)(?!\s+\d+\s+R)', self.header)
+        return int(match.group(1)) if match else None
+
+    def get_inline_dict(self, key):
+        """Get the source of an inline (non-nested) dictionary value of /key, or None."""
+        match = re.search(rb'/' + key + rb'\s*<<(.*?)>>', self.header, re.S)
+        return match.group(1) if match else None
+
+class SimplePdfPage:
+    """A page of a SimplePdfReader document."""
+
+    def __init__(self, reader, page_object, fonts):
+        self._reader = reader
+        self._page_object = page_object
+        self._fonts = fonts
+
+    def extract_text(self):
+        """
+        Extract the text of the page.
+
+        Returns:
+            The page text, with line breaks where the text position moves down.
+        """
+        parts = []
+        for ref in self._page_object.get_refs(b'Contents'):
+            content = self._reader.decode_stream(ref)
+            if content:
+                parts.append(_extract_content_text(content, self._fonts, self._reader))
+        return "\n".join(part for part in parts if part)
+
+class SimplePdfReader:
+    """
+    Read the page structure of a PDF without third-party libraries.
+
+    Mirrors the small part of the PyPDF2.PdfReader interface used by CVInsight:
+    a `pages` list whose items have an `extract_text()` method.
+    """
+
+    def __init__(self, data):
+        """
+        Parse the object structure of a PDF.
+
+        Args:
+            data: The raw PDF contents (bytes or any buffer).
+
+        Raises:
+            ValueError: If the data is not a PDF or has no pages.
+        """
+        # bytes and memory maps are searched in place; other buffers need a copy
+        data = data if isinstance(data, (bytes, mmap.mmap)) else bytes(data)
+        if b"%PDF-" not in data[:1024]:
+            raise ValueError("Missing %PDF- header")
+
+        self._objects = {}
+        self._decoded = {}
+        self._cmaps = {}
+        # Objects hold copies of their slices, so the file data is not kept
+        self._scan_objects(data)
+        self._expand_object_streams()
+
+        self.pages = [SimplePdfPage(self, page, fonts) for page, fonts in self._walk_pages()]
+        if not self.pages:
+            raise ValueError("No pages found")
+
+    def _scan_objects(self, data):
+        """Find every indirect object, skipping over stream data."""
+        position = 0
+        while True:
+            match = _OBJECT_RE.search(data, position)
+            if not match:
+                break
+            number = int(match.group(1))
+            start = match.end()
+            end_object = data.find(b"endobj", start)
+            stream_match = _STREAM_RE.search(data, start)
+
+            if stream_match and (end_object == -1 or stream_match.start() < end_object):
+                header = data[start:stream_match.start()]
+                stream_start = stream_match.end()
+                length = PdfObject(header).get_int(b'Length')
+                if length is not None and b"endstream" in data[stream_start + length:stream_start + length + 32]:
+                    stream_end = stream_start + length
+                else:
+                    stream_end = data.find(b"endstream", stream_start)
+                    if stream_end == -1:
+                        break
+                self._objects[number] = PdfObject(header, data[stream_start:stream_end])
+                end_object = data.find(b"endobj", stream_end)
+            elif end_object == -1:
+                break
+            else:
+                self._objects[number] = PdfObject(data[start:end_object])
+            position = end_object + len(b"endobj") if end_object != -1 else len(data)
+
+    def _expand_object_streams(self):
+        """Add the objects stored inside compressed object streams."""
+        for number, obj in list(self._objects.items()):
+            if obj.stream is None or not re.search(rb'/Type\s*/ObjStm', obj.header):
+                continue
+            content = self.decode_stream(number)
+            first = obj.get_int(b'First')
+            if content is None or first is None:
+                continue
+            numbers = [int(value) for value in content[:first].split()]
+            entries = list(zip(numbers[0::2], numbers[1::2]))
+            for i, (object_number, offset) in enumerate(entries):
+                end = entries[i + 1][1] if i + 1 < len(entries) else len(content) - first
+                # Objects written directly in the file take precedence
+                self._objects.setdefault(object_number, PdfObject(content[first + offset:first + end]))
+
+    def decode_stream(self, number):
+        """
+        Get the decoded stream data of an object.
+
+        Args:
+            number: The object number.
+
+        Returns:
+            The decoded bytes, or None if the object has no stream or uses an
+            unsupported filter.
+        """
+        if number in self._decoded:
+            return self._decoded[number]
+        obj = self._objects.get(number)
+        decoded = None
+        if obj is not None and obj.stream is not None:
+            filters = re.findall(rb'/(\w+Decode)', obj.header)
+            decoded = obj.stream
+            for name in filters:
+                if name == b"FlateDecode":
+                    try:
+                        decoded = zlib.decompressobj().decompress(decoded)
+                    except zlib.error as e:
+                        logging.debug(f"Could not inflate PDF stream {number}: {e}")
+                        decoded = None
+                        break
+                else:
+                    decoded = None
+                    break
+        self._decoded[number] = decoded
+        return decoded
+
+    def _walk_pages(self):
+        """List (page object, fonts) in document order by walking the page tree."""
+        root = None
+        for obj in self._objects.values():
+            if re.search(rb'/Type\s*/Catalog', obj.header):
+                root = obj.get_ref(b'Pages')
+                break
+
+        pages = []
+        if root is not None:
+            self._walk_page_node(root, None, pages, set())
+        if not pages:
+            # No usable page tree: fall back to every page object in number order
+            for number in sorted(self._objects):
+                obj = self._objects[number]
+                if _PAGE_TYPE_RE.search(obj.header):
+                    pages.append((obj, self._fonts_for(obj, None)))
+        return pages
+
+    def _walk_page_node(self, number, inherited_fonts, pages, seen):
+        if number in seen or number not in self._objects:
+            return
+        seen.add(number)
+        node = self._objects[number]
+        fonts = self._fonts_for(node, inherited_fonts)
+        if _PAGE_TYPE_RE.search(node.header):
+            pages.append((node, fonts))
+            return
+        for kid in node.get_refs(b'Kids'):
+            self._walk_page_node(kid, fonts, pages, seen)
+
+    def _fonts_for(self, node, inherited_fonts):
+        """Map font resource names of a page tree node to their ToUnicode decoders."""
+        resources = node
+        resources_ref = node.get_ref(b'Resources')
+        if resources_ref is not None and resources_ref in self._objects:
+            resources = self._objects[resources_ref]
+
+        font_dict = None
+        font_ref = resources.get_ref(b'Font')
+        if font_ref is not None and font_ref in self._objects:
+            font_dict = self._objects[font_ref].header
+        else:
+            match = re.search(rb'/Font\s*<<(.*?)>>', resources.header, re.S)
+            if match:
+                font_dict = match.group(1)
+        if font_dict is None:
+            return inherited_fonts or {}
+
+        fonts = {}
+        for name, ref in re.findall(rb'/([^\s/<>\[\]()]+)\s+(\d+)\s+\d+\s+R', font_dict):
+            fonts[name] = self._font_decoder(int(ref))
+        return fonts
+
+    def _font_decoder(self, number):
+        """Build the decoder (a ToUnicode CMap or None for simple fonts) for a font."""
+        if number in self._cmaps:
+            return self._cmaps[number]
+        cmap = None
+        font = self._objects.get(number)
+        if font is not None:
+            to_unicode = font.get_ref(b'ToUnicode')
+            if to_unicode is not None:
+                content = self.decode_stream(to_unicode)
+                if content:
+                    cmap = _parse_cmap(content)
+        self._cmaps[number] = cmap
+        return cmap
+
+def _parse_cmap(content):
+    """
+    Parse the bfchar/bfrange mappings of a ToUnicode CMap.
+
+    Returns:
+        A tuple (code_width, mapping) of the code width in bytes and a dict from
+        character code to unicode text.
+    """
+    mapping = {}
+    code_width = 1
+    for block in re.findall(rb'beginbfchar(.*?)endbfchar', content, re.S):
+        hex_values = _HEX_RE.findall(block)
+        for source, target in zip(hex_values[0::2], hex_values[1::2]):
+            source = re.sub(rb'\s', b'', source)
+            code_width = max(code_width, len(source) // 2)
+            mapping[int(source, 16)] = _utf16_hex(target)
+    for block in re.findall(rb'beginbfrange(.*?)endbfrange', content, re.S):
+        for low, high, target in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]+>|\[[^\]]*\])', block):
+            code_width = max(code_width, len(low) // 2)
+            low, high = int(low, 16), int(high, 16)
+            if target.startswith(b'['):
+                for offset, value in enumerate(_HEX_RE.findall(target)):
+                    mapping[low + offset] = _utf16_hex(value)
+            else:
+                target = target[1:-1]
+                base = int(target, 16)
+                for offset in range(high - low + 1):
+                    mapping[low + offset] = _utf16_hex(b"%0*X" % (len(target), base + offset))
+    return code_width, mapping
+
+def _utf16_hex(value):
+    value = re.sub(rb'\s', b'', value)
+    try:
+        return bytes.fromhex(value.decode('ascii')).decode('utf-16-be', errors='ignore')
+    except ValueError:
+        return ""
+
+def _decode_string(raw, cmap):
+    """Decode the bytes of a PDF string shown with the given font decoder."""
+    if cmap is None:
+        # Simple fonts in resumes are almost always WinAnsi (cp1252) encoded
+        return raw.decode('cp1252', errors='replace')
+    code_width, mapping = cmap
+    chars = []
+    for i in range(0, len(raw) - code_width + 1, code_width):
+        code = int.from_bytes(raw[i:i + code_width], 'big')
+        chars.append(mapping.get(code, ""))
+    return "".join(chars)
+
+def _read_literal_string(content, position):
+    """Read a (...) string starting after the opening parenthesis."""
+    depth = 1
+    output = bytearray()
+    length = len(content)
+    while position < length:
+        char = content[position]
+        if char == 0x5C:  # backslash
+            position += 1
+            if position >= length:
+                break
+            escaped = content[position]
+            if 0x30 <= escaped <= 0x37:
+                digits = content[position:position + 3]
+                octal = re.match(rb'[0-7]{1,3}', digits).group(0)
+                output.append(int(octal, 8) & 0xFF)
+                position += len(octal)
+                continue
+            output.extend({0x6E: b"\n", 0x72: b"\r", 0x74: b"\t", 0x62: b"\b", 0x66: b"\f",
+                           0x0A: b"", 0x0D: b""}.get(escaped, bytes([escaped])))
+        elif char == 0x28:
+            depth += 1
+            output.append(char)
+        elif char == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(output), position + 1
+            output.append(char)
+        else:
+            output.append(char)
+        position += 1
+    return bytes(output), position
+
+_TOKEN_RE = re.compile(rb'\s*(?:(%[^\r\n]*)|(<<|>>|\[|\])|(<[0-9A-Fa-f\s]*>)|(/[^\s/<>\[\]()%{}]*)|(\()|([^\s/<>\[\]()%{}]+))')
+
+def _tokenize(content):
+    """Yield (kind, value) tokens of a content stream."""
+    position = 0
+    length = len(content)
+    while position < length:
+        match = _TOKEN_RE.match(content, position)
+        if not match or match.end() == position:
+            position += 1
+            continue
+        position = match.end()
+        comment, delimiter, hex_string, name, string_start, word = match.groups()
+        if comment is not None:
+            continue
+        if delimiter is not None:
+            yield 'delimiter', delimiter
+        elif hex_string is not None:
+            digits = re.sub(rb'\s', b'', hex_string[1:-1])
+            if len(digits) % 2:
+                digits += b'0'
+            yield 'string', bytes.fromhex(digits.decode('ascii'))
+        elif name is not None:
+            yield 'name', name[1:]
+        elif string_start is not None:
+            value, position = _read_literal_string(content, position)
+            yield 'string', value
+        elif word == b'ID':
+            # Skip inline image data
+            end = content.find(b'EI', position)
+            position = length if end == -1 else end + 2
+        else:
+            yield 'word', word
+
+def _extract_content_text(content, fonts, reader):
+    """Extract the text shown by a page content stream."""
+    lines = [[]]
+    operands = []
+    array = None
+    cmap = None
+    last_y = None
+
+    def new_line():
+        if lines[-1]:
+            lines.append([])
+
+    for kind, value in _tokenize(content):
+        if kind == 'delimiter':
+            if value == b'[':
+                array = []
+            elif value == b']' and array is not None:
+                operands.append(('array', array))
+                array = None
+            continue
+        if array is not None:
+            array.append((kind, value))
+            continue
+        if kind != 'word' or re.match(rb'^[-+.\d]+$', value):
+            operands.append((kind, value))
+            continue
+
+        operator = value
+        if operator == b'Tf' and len(operands) >= 2 and operands[-2][0] == 'name':
+            cmap = fonts.get(operands[-2][1])
+        elif operator in _NEWLINE_OPERATORS:
+            new_line()
+        elif operator in (b'Td', b'TD') and len(operands) >= 2:
+            if _number(operands[-1][1]) != 0:
+                new_line()
+            elif _number(operands[-2][1]) > 0 and lines[-1]:
+                lines[-1].append(" ")
+        elif operator == b'Tm' and len(operands) >= 6:
+            y = _number(operands[-1][1])
+            if last_y is not None and y != last_y:
+                new_line()
+            last_y = y
+
+        if operator in (b'Tj', b"'", b'"') and operands and operands[-1][0] == 'string':
+            lines[-1].append(_decode_string(operands[-1][1], cmap))
+        elif operator == b'TJ' and operands and operands[-1][0] == 'array':
+            for item_kind, item in operands[-1][1]:
+                if item_kind == 'string':
+                    lines[-1].append(_decode_string(item, cmap))
+                elif item_kind == 'word' and _number(item) < -200:
+                    # A large negative adjustment is the usual way to render a space
+                    lines[-1].append(" ")
+        operands = []
+
+    return "\n".join("".join(line).rstrip() for line in lines if line).strip()
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
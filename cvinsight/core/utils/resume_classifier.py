@@ -0,0 +1,80 @@
+"""
+Local pre-classifier that rejects documents which are clearly not resumes.
+
+It runs on the extracted text before any LLM call and only looks at cheap
+signals: the amount of text, resume section headings, contact details and
+phrases typical of cover letters, invoices and transcripts. It is deliberately
+conservative: a document with two or more resume sections, or with one section
+and contact details, is always accepted.
+"""
+import re
+from .section_segmenter import classify_heading
+from .. import config
+
+CLASSIFIER_VERSION = "1.0.0"
+
+# Sections that only resumes have; 'other' (summary, languages, ...) is too generic
+RESUME_SECTIONS = ("skills", "experience", "education", "projects")
+
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_PHONE_RE = re.compile(r'(?:\+?\d[\d\s().-]{7,}\d)')
+_PROFILE_URL_RE = re.compile(r'(linkedin\.com|github\.com)/', re.IGNORECASE)
+
+# Phrases of other document kinds; a kind is detected when at least two of its phrases appear
+NON_RESUME_MARKERS = {
+    "cover letter": ("dear hiring", "dear sir", "dear madam", "to whom it may concern", "sincerely",
+                     "i am writing to", "yours faithfully", "best regards"),
+    "invoice": ("invoice", "bill to", "amount due", "subtotal", "payment terms", "due date", "tax id", "vat"),
+    "transcript": ("transcript", "credit hours", "cumulative gpa", "semester gpa", "course code",
+                   "grade points", "registrar"),
+}
+
+def _detect_kind(lowered):
+    """Return the non-resume document kind whose phrases appear most often, or None."""
+    best_kind, best_hits = None, 1
+    for kind, phrases in NON_RESUME_MARKERS.items():
+        hits = sum(1 for phrase in phrases if phrase in lowered)
+        if hits > best_hits:
+            best_kind, best_hits = kind, hits
+    return best_kind
+
+def classify_resume(text, min_chars=None):
+    """
+    Decide whether extracted text is worth sending to the extractors.
+
+    Args:
+        text: The extracted (normalized) document text.
+        min_chars: Minimum number of non-whitespace characters. Defaults to
+            config.RESUME_MIN_CHARS.
+
+    Returns:
+        A dictionary with 'is_resume', the rejection 'reason' (None if accepted)
+        and the signals it was based on: 'chars', 'sections', 'contact' and 'kind'.
+    """
+    min_chars = config.RESUME_MIN_CHARS if min_chars is None else min_chars
+    chars = len(re.sub(r'\s+', '', text))
+    sections = sorted({name for name in map(classify_heading, text.split('\n')) if name in RESUME_SECTIONS})
+    contact = bool(_EMAIL_RE.search(text) or _PHONE_RE.search(text) or _PROFILE_URL_RE.search(text))
+    kind = _detect_kind(text.lower())
+
+    if chars == 0:
+        reason = "no text could be extracted (empty or scanned document)"
+    elif chars < min_chars:
+        reason = f"too little text ({chars} characters)"
+    elif len(sections) >= 2 or (sections and contact):
+        reason = None
+    elif kind is not None:
+        reason = f"not a resume ({kind})"
+    elif not sections and not contact:
+        reason = "no resume sections or contact details"
+    else:
+        reason = None
+
+    return {
+        "is_resume": reason is None,
+        "reason": reason,
+        "chars": chars,
+        "sections": sections,
+        "contact": contact,
+        "kind": kind
+    }
@@ -0,0 +1,130 @@
+import re
+from .. import config
+
+# Heading keywords per section, checked in order. Project headings are checked
+# first so that e.g. "Project Experience" is not taken for work experience.
+SECTION_KEYWORDS = [
+    ("projects", ("project",)),
+    ("skills", ("skill", "competenc", "technologies", "tech stack", "technical proficienc", "expertise")),
+    ("experience", ("experience", "employment", "work history", "career history", "professional background")),
+    ("education", ("education", "academic", "qualification", "degree")),
+    ("other", ("summary", "profile", "objective", "about me", "certification", "certificate", "award",
+               "achievement", "publication", "language", "interest", "hobbies", "reference", "volunteer",
+               "activities", "courses", "training", "contact", "personal details", "accomplishment")),
+]
+
+_HEADING_MAX_WORDS = 5
+
+class ResumeSections:
+    """
+    Result of segmenting a resume into its sections.
+
+    Each section holds the text under its heading(s); text before the first
+    heading is kept under 'preamble'.
+    """
+
+    def __init__(self, full_text, sections, headings):
+        """
+        Initialize the segmentation result.
+
+        Args:
+            full_text: The text that was segmented.
+            sections: Dictionary of section name to section text.
+            headings: The heading lines that were recognized, in order.
+        """
+        self.full_text = full_text
+        self.sections = sections
+        self.headings = headings
+
+    @property
+    def confident(self):
+        """
+        Check whether the resume has enough recognizable structure to be sliced.
+
+        Returns:
+            True if at least two distinct sections were found.
+        """
+        found = [name for name in self.sections if name != "preamble"]
+        return len(found) >= 2
+
+    def text_for(self, section_names):
+        """
+        Get the text an extractor should receive.
+
+        Args:
+            section_names: The sections the extractor needs, or None for the full text.
+
+        Returns:
+            The requested sections joined together, or the full text if segmentation
+            is not confident or any requested section is missing or too short.
+        """
+        if not section_names or not self.confident:
+            return self.full_text
+        slices = []
+        for name in section_names:
+            text = self.sections.get(name, "")
+            if len(text) < config.SECTION_MIN_CHARS:
+                return self.full_text
+            slices.append(text)
+        return "\n\n".join(slices)
+
+def classify_heading(line):
+    """
+    Classify a line as a section heading.
+
+    A heading is a short line (at most five words, no digits, commas or inline
+    content after a colon) in upper or title case, or ending with a colon, that
+    contains a known section keyword.
+
+    Args:
+        line: A line of resume text.
+
+    Returns:
+        The section name, or None if the line is not a heading.
+    """
+    stripped = line.strip().strip("•*#=-_|").strip()
+    ends_with_colon = stripped.endswith(":")
+    stripped = stripped.rstrip(":").strip()
+    if not stripped or ":" in stripped or re.search(r'[\d,.;]', stripped):
+        return None
+    if len(stripped.split()) > _HEADING_MAX_WORDS:
+        return None
+    words = [word for word in re.findall(r"[A-Za-z]+", stripped) if len(word) > 3]
+    heading_case = stripped.isupper() or all(word[0].isupper() for word in words)
+    if not (heading_case or ends_with_colon):
+        return None
+
+    lowered = stripped.lower().replace("&", "and")
+    for name, keywords in SECTION_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return name
+    return None
+
+def segment_sections(text):
+    """
+    Split resume text into sections by recognizing common headings.
+
+    The segmentation is purely local and deterministic, so it is cheap enough to
+    run once per resume before the extractors.
+
+    Args:
+        text: The resume text.
+
+    Returns:
+        A ResumeSections instance.
+    """
+    sections = {}
+    headings = []
+    current = "preamble"
+    for line in text.split("\n"):
+        name = classify_heading(line)
+        if name is not None:
+            current = name
+            headings.append(line.strip())
+            # Keep the heading itself so repeated sections stay readable
+            sections[current] = (sections[current] + "\n" + line.strip()) if current in sections else line.strip()
+            continue
+        sections[current] = (sections[current] + "\n" + line) if current in sections else line
+
+    sections = {name: body.strip() for name, body in sections.items() if body.strip()}
+    return ResumeSections(text, sections, headings)
@@ -0,0 +1,187 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from .. import config
+
+class TextCache:
+    """
+    On-disk cache of extracted resume text, keyed by file content.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the extraction backend
+    and its version, so re-submitted files skip parsing while a backend upgrade
+    invalidates old entries. The cache is capped in size and evicts the least
+    recently used entries first (entry mtimes are bumped on every hit).
+    """
+
+    def __init__(self, cache_dir=None, max_size_mb=None):
+        """
+        Initialize the text cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in. Defaults to config.TEXT_CACHE_DIR.
+            max_size_mb: Maximum total size of the cache in MB. Defaults to config.TEXT_CACHE_MAX_SIZE_MB.
+        """
+        self.cache_dir = cache_dir or config.TEXT_CACHE_DIR
+        max_size_mb = max_size_mb if max_size_mb is not None else config.TEXT_CACHE_MAX_SIZE_MB
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._size_bytes = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(data, backend, content_hash=None):
+        """
+        Build the cache key for a document.
+
+        Args:
+            data: The raw file contents.
+            backend: Identifier of the extraction backend and its version.
+            content_hash: The SHA-256 hex digest of data, if already computed.
+
+        Returns:
+            A hex digest identifying the (content, backend) pair.
+        """
+        content_hash = content_hash or hashlib.sha256(data).hexdigest()
+        return hashlib.sha256(f"{content_hash}:{backend}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """
+        Look up the extracted pages for a key.
+
+        Args:
+            key: A key returned by make_key.
+
+        Returns:
+            The list of page texts, or None on a cache miss.
+        """
+        path = self._entry_path(key)
+        with self._lock:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    pages = json.load(f)
+                # Mark the entry as recently used
+                os.utime(path, None)
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return pages
+
+    def put(self, key, pages):
+        """
+        Store the extracted pages for a key, evicting old entries if needed.
+
+        Args:
+            key: A key returned by make_key.
+            pages: The list of page texts to store.
+        """
+        path = self._entry_path(key)
+        payload = json.dumps(pages).encode('utf-8')
+        if len(payload) > self.max_size_bytes:
+            return
+
+        with self._lock:
+            size_bytes = self._current_size()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write to a temporary file first so readers never see partial entries
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logging.warning(f"Could not write text cache entry {key}: {e}")
+                return
+
+            self._size_bytes = size_bytes - old_size + len(payload)
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def _entries(self):
+        """List (mtime, size, path) for every cache entry."""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _current_size(self):
+        if self._size_bytes is None:
+            self._size_bytes = sum(size for _, size, _ in self._entries())
+        return self._size_bytes
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its size cap."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+                logging.debug(f"Evicted text cache entry: {path}")
+            except OSError as e:
+                logging.warning(f"Could not evict text cache entry {path}: {e}")
+        self._size_bytes = total
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size_bytes = 0
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            A dictionary with hits, misses, evictions and the current size in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size_bytes": self._current_size()
+            }
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_text_cache():
+    """
+    Get the shared text cache configured in config.
+
+    Returns:
+        The shared TextCache, or None if the cache is disabled.
+    """
+    global _default_cache
+    if not config.TEXT_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TextCache()
+        return _default_cache
@@ -0,0 +1,117 @@
+import re
+
+# Rough estimate: 4 chars per token, as in LLMService
+CHARS_PER_TOKEN = 4
+
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE = rf'(?:{_MONTH}\s*\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})'
+_DATE_RANGE_RE = re.compile(
+    rf'{_DATE}\s*(?:-|–|—|to|until)\s*(?:{_DATE}|present|current|now|today|date)',
+    re.IGNORECASE
+)
+_BULLET_RE = re.compile(r'^\s*[•●▪◦\-*·–]')
+# Lines just above a date range that still belong to the role (company, title, location)
+_MAX_ROLE_HEADER_LINES = 2
+_MAX_ROLE_HEADER_CHARS = 100
+
+def estimate_tokens(text):
+    """
+    Estimate the number of tokens in a text.
+
+    Args:
+        text: The text to estimate.
+
+    Returns:
+        The estimated token count.
+    """
+    return len(text) // CHARS_PER_TOKEN
+
+def _role_starts(lines):
+    """Find the line indexes where a new role begins."""
+    starts = []
+    for i, line in enumerate(lines):
+        if not _DATE_RANGE_RE.search(line) or _BULLET_RE.match(line):
+            continue
+        # Include the company/title lines written just above the dates
+        start = i
+        while (i - start < _MAX_ROLE_HEADER_LINES and start > 0
+               and (not starts or start - 1 > starts[-1])
+               and lines[start - 1].strip()
+               and not _BULLET_RE.match(lines[start - 1])
+               and not _DATE_RANGE_RE.search(lines[start - 1])
+               and len(lines[start - 1]) <= _MAX_ROLE_HEADER_CHARS):
+            start -= 1
+        if not starts or start > starts[-1]:
+            starts.append(start)
+    return starts
+
+def _split_lines(lines, max_chars):
+    """
+    Split a role that is too large on its own into line-aligned pieces.
+
+    The role header (company, title and dates) is repeated at the top of every
+    continuation piece, so each piece can still be attributed to its company.
+    """
+    header = []
+    for i, line in enumerate(lines[:_MAX_ROLE_HEADER_LINES + 1]):
+        if _DATE_RANGE_RE.search(line):
+            header = lines[:i + 1]
+            break
+    header_size = sum(len(line) + 1 for line in header)
+    if header_size * 2 > max_chars:
+        header, header_size = [], 0
+
+    pieces, current = [], []
+    size = 0
+    for line in lines:
+        if current and size + len(line) + 1 > max_chars:
+            pieces.append("\n".join(current))
+            current, size = list(header), header_size
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+def split_on_role_boundaries(text, max_tokens):
+    """
+    Split work experience text into chunks under a token budget.
+
+    The text is cut where a new role starts (a line with a date range such as
+    "Jan 2019 - Present", together with the company/title lines just above it),
+    and consecutive roles are packed into chunks of at most max_tokens. Only a
+    single role larger than the budget is split in the middle, on line breaks.
+
+    Args:
+        text: The work experience text.
+        max_tokens: Token budget per chunk.
+
+    Returns:
+        A list of text chunks in document order.
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    if len(text) <= max_chars:
+        return [text]
+
+    lines = text.split("\n")
+    starts = _role_starts(lines)
+    if not starts or starts[0] != 0:
+        # Text before the first role (e.g. the section heading) is its own block
+        starts = [0] + starts
+    blocks = [lines[start:end] for start, end in zip(starts, starts[1:] + [len(lines)])]
+
+    chunks, current = [], []
+    size = 0
+    for block in blocks:
+        block_size = sum(len(line) + 1 for line in block)
+        if current and size + block_size > max_chars:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        if block_size > max_chars:
+            chunks.extend(_split_lines(block, max_chars))
+            continue
+        current.extend(block)
+        size += block_size
+    if current:
+        chunks.append("\n".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
@@ -0,0 +1,105 @@
+import re
+import math
+
+# Lines at the top and bottom of each page that may be running headers/footers
+_EDGE_LINES = 3
+
+_PAGE_NUMBER_RE = re.compile(r'^[-–—\s]*(page\s*)?\d+(\s*(of|/)\s*\d+)?[-–—\s]*$', re.IGNORECASE)
+_SPACE_RE = re.compile(r'[ \t\f\v\u00a0\u2000-\u200b\u202f\u205f\u3000]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+def _line_key(line):
+    """Key under which a header/footer line is compared across pages (page numbers ignored)."""
+    return re.sub(r'\d+', '#', _SPACE_RE.sub(' ', line).strip().lower())
+
+def _edge_indexes(lines):
+    """Indexes of the first and last few non-empty lines of a page."""
+    non_empty = [i for i, line in enumerate(lines) if line.strip()]
+    return set(non_empty[:_EDGE_LINES] + non_empty[-_EDGE_LINES:])
+
+def _collapse_whitespace(text):
+    """Collapse runs of spaces and blank lines and strip trailing spaces."""
+    lines = [_SPACE_RE.sub(' ', line).strip() for line in text.split('\n')]
+    return _BLANK_LINES_RE.sub('\n\n', '\n'.join(lines)).strip()
+
+def _strip_repeated_lines(pages, min_repeat_ratio):
+    """
+    Remove repeated header/footer lines and bare page numbers from each page.
+
+    Returns:
+        A tuple (kept_pages, removed_lines, original_chars).
+    """
+    pages = [page.replace('\r\n', '\n').replace('\r', '\n') for page in pages]
+    original_chars = sum(len(page) for page in pages)
+    split_pages = [page.split('\n') for page in pages]
+
+    repeated = set()
+    if len(pages) >= 2:
+        min_pages = max(2, math.ceil(len(pages) * min_repeat_ratio))
+        counts = {}
+        for lines in split_pages:
+            for key in {_line_key(lines[i]) for i in _edge_indexes(lines)}:
+                counts[key] = counts.get(key, 0) + 1
+        repeated = {key for key, count in counts.items() if key and count >= min_pages}
+
+    removed_lines = 0
+    seen = set()
+    kept_pages = []
+    for lines in split_pages:
+        edges = _edge_indexes(lines) if len(pages) >= 2 else set()
+        kept = []
+        for i, line in enumerate(lines):
+            if i in edges:
+                key = _line_key(line)
+                # Keep the first occurrence, e.g. a name header is still the candidate's name
+                if _PAGE_NUMBER_RE.match(line.strip()) or (key in repeated and key in seen):
+                    removed_lines += 1
+                    continue
+                seen.add(key)
+            kept.append(line)
+        kept_pages.append('\n'.join(kept))
+    return kept_pages, removed_lines, original_chars
+
+def normalize_pages(pages, min_repeat_ratio=0.5):
+    """
+    Normalize extracted resume text before it is sent to the extractors.
+
+    Lines repeated at the top or bottom of most pages (running headers, footers,
+    "Page 2 of 3") are kept only where they first appear, bare page numbers are
+    removed, and runs of whitespace and blank lines are collapsed.
+
+    Args:
+        pages: The list of page texts.
+        min_repeat_ratio: Fraction of pages a header/footer line must appear on
+            to be removed (at least two pages).
+
+    Returns:
+        A tuple (text, stats) of the normalized text and a dictionary with the
+        original and normalized character counts, the removed repeated lines
+        and the estimated tokens saved per prompt.
+    """
+    kept_pages, removed_lines, original_chars = _strip_repeated_lines(pages, min_repeat_ratio)
+    text = _collapse_whitespace('\n'.join(kept_pages))
+    stats = {
+        "original_chars": original_chars,
+        "normalized_chars": len(text),
+        "removed_chars": original_chars - len(text),
+        "removed_lines": removed_lines,
+        # Rough estimate: 4 chars per token, as in LLMService
+        "estimated_tokens_saved": max(0, original_chars - len(text)) // 4
+    }
+    return text, stats
+
+def normalize_page_texts(pages, min_repeat_ratio=0.5):
+    """
+    Normalize each page separately, for extractors that only need some pages.
+
+    Args:
+        pages: The list of page texts.
+        min_repeat_ratio: As in normalize_pages.
+
+    Returns:
+        The list of normalized page texts.
+    """
+    kept_pages, _, _ = _strip_repeated_lines(pages, min_repeat_ratio)
+    return [_collapse_whitespace(page) for page in kept_pages]
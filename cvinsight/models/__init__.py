@@ -9,7 +9,8 @@ from .resume_models import (
     ResumeWorkExperience,
     WorkDates,
     Resume,
-    Skills
+    Skills,
+    CombinedExtraction
 )
 
 # Alias for backwards compatibility (old code that imports ProfileInfo from models)
@@ -57,6 +57,13 @@ class WorkDates(BaseModel):
     newest_working_date: str
     total_experience: Optional[str] = None
 
+class CombinedExtraction(BaseModel):
+    """Model for the profile, skills, education and work experience extracted in one call"""
+    profile: ResumeProfile
+    skills: Skills
+    education: ResumeEducation
+    experience: ResumeWorkExperience
+
 class Resume(BaseModel):
     """A complete resume with all extracted information."""
     # Profile information
@@ -2,11 +2,13 @@
 Core plugin base classes and interfaces.
 """
 
-from .base import BasePlugin, ExtractorPlugin, PluginMetadata, PluginCategory
+from .base import BasePlugin, ExtractorPlugin, LLMExtractorPlugin, PluginMetadata, PluginCategory, InputWindow
 
 __all__ = [
     'BasePlugin',
     'ExtractorPlugin',
+    'LLMExtractorPlugin',
     'PluginMetadata',
-    'PluginCategory'
+    'PluginCategory',
+    'InputWindow'
 ]
\ No newline at end of file
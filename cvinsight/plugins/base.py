@@ -1,3 +1,5 @@
+import asyncio
+import concurrent.futures
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import Dict, Any, Type, List, Tuple, Optional
@@ -18,6 +20,40 @@ class PluginMetadata:
         self.description = description
         self.category = category
         self.author = author
+
+class InputWindow:
+    """
+    Part of a resume an extractor needs, in pages and characters.
+    
+    Pages are taken from the start and/or the end of the document, in document
+    order; max_chars then caps the text (keeping the end when only last pages
+    are selected).
+    """
+    def __init__(self, first_pages: Optional[int] = None, last_pages: Optional[int] = None,
+                 max_chars: Optional[int] = None):
+        self.first_pages = first_pages
+        self.last_pages = last_pages
+        self.max_chars = max_chars
+    
+    def apply(self, pages: List[str]) -> str:
+        """
+        Select the window from the page texts of a resume.
+        
+        Args:
+            pages: The text of each page.
+            
+        Returns:
+            The text inside the window.
+        """
+        indexes = range(len(pages))
+        if self.first_pages is not None or self.last_pages is not None:
+            first = set(indexes[:self.first_pages or 0])
+            last = set(indexes[len(pages) - self.last_pages:]) if self.last_pages else set()
+            indexes = sorted(first | last)
+        text = "\n".join(pages[i] for i in indexes if pages[i])
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[-self.max_chars:] if self.last_pages and not self.first_pages else text[:self.max_chars]
+        return text
         
 class BasePlugin(ABC):
     """Base class for all plugins."""
@@ -56,6 +92,33 @@ class ExtractorPlugin(BasePlugin):
         """Prepare the input data for the LLM."""
         pass
     
+    def get_input_sections(self) -> Optional[List[str]]:
+        """
+        Get the resume sections the extractor needs.
+        
+        The processor segments each resume once and passes only these sections
+        (e.g. ["skills"]) to extract, falling back to the full text when the
+        sections cannot be found reliably.
+        
+        Returns:
+            A list of section names ('skills', 'experience', 'education',
+            'projects', 'other', 'preamble'), or None for the full text.
+        """
+        return None
+    
+    def get_input_window(self) -> Optional[InputWindow]:
+        """
+        Get the pages (and character budget) of the resume the extractor needs.
+        
+        Used when the extractor's sections (get_input_sections) are not declared
+        or cannot be found reliably, e.g. InputWindow(first_pages=1) for
+        contact details.
+        
+        Returns:
+            An InputWindow, or None for the full text.
+        """
+        return None
+    
     @abstractmethod
     def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
@@ -67,4 +130,109 @@ class ExtractorPlugin(BasePlugin):
         Returns:
             A tuple of (extracted_data, token_usage)
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def aextract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract information from text asynchronously.
+        
+        The default runs extract in a worker thread; LLMExtractorPlugin awaits
+        LLMService.aextract_with_llm instead, so no thread is needed.
+        
+        Args:
+            text: The text to extract information from.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        return await asyncio.to_thread(self.extract, text)
+    
+    def extract_batch(self, texts: List[str],
+                      max_concurrency: Optional[int] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Extract information from the texts of many resumes.
+        
+        The default runs extract on up to max_concurrency texts at a time in a
+        thread pool; LLMExtractorPlugin uses LLMService.batch_extract_with_llm
+        instead.
+        
+        Args:
+            texts: The texts to extract information from.
+            max_concurrency: Maximum number of extractions running at the same time,
+                             or None for all of them.
+            
+        Returns:
+            A list of (extracted_data, token_usage) tuples, one per text.
+        """
+        if not texts:
+            return []
+        workers = max(1, min(max_concurrency or len(texts), len(texts)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract, texts))
+
+class LLMExtractorPlugin(ExtractorPlugin):
+    """
+    Base class for extractor plugins that make one LLM call per text.
+    
+    Subclasses set self.llm_service and provide the model, prompt template and
+    input data; the async (aextract) and batched (extract_batch) paths are
+    shared. Override _process_result to normalize the raw LLM result.
+    """
+    
+    llm_service: Any = None
+    
+    def _process_result(self, result: Any, token_usage: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Normalize the LLM result into the extractor's output.
+        
+        Args:
+            result: The result returned by the LLM service.
+            token_usage: The token usage of the call.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        token_usage["extractor"] = self.metadata.name
+        return (result if isinstance(result, dict) else {}), token_usage
+    
+    async def aextract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract information from text with one awaited LLM call (LLMService.aextract_with_llm).
+        
+        Args:
+            text: The text to extract information from.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        result, token_usage = await self.llm_service.aextract_with_llm(
+            self.get_model(),
+            self.get_prompt_template(),
+            self.get_input_variables(),
+            self.prepare_input_data(text),
+            plugin_version=self.metadata.version
+        )
+        return self._process_result(result, token_usage)
+    
+    def extract_batch(self, texts: List[str],
+                      max_concurrency: Optional[int] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Extract information from the texts of many resumes with one batched LLM
+        call (LLMService.batch_extract_with_llm).
+        
+        Args:
+            texts: The texts to extract information from.
+            max_concurrency: Maximum number of LLM requests in flight.
+            
+        Returns:
+            A list of (extracted_data, token_usage) tuples, one per text.
+        """
+        outputs = self.llm_service.batch_extract_with_llm(
+            self.get_model(),
+            self.get_prompt_template(),
+            self.get_input_variables(),
+            [self.prepare_input_data(text) for text in texts],
+            plugin_version=self.metadata.version,
+            max_concurrency=max_concurrency
+        )
+        return [self._process_result(result, token_usage) for result, token_usage in outputs]
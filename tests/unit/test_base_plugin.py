@@ -1,7 +1,7 @@
 """Unit tests for base plugin functionality."""
 import pytest
 from unittest.mock import MagicMock, patch
-from cvinsight.plugins.base import BasePlugin, ExtractorPlugin, PluginMetadata, PluginCategory
+from cvinsight.plugins.base import BasePlugin, ExtractorPlugin, PluginMetadata, PluginCategory, InputWindow
 
 class TestBasePlugin(BasePlugin):
     """Test implementation of BasePlugin."""
@@ -102,9 +102,24 @@ def test_extractor_plugin_methods():
     result, token_usage = plugin.extract("test text")
     assert result == {"test": "data"}
     assert token_usage is None
+    
+    # Extractors receive the full text unless they ask for sections
+    assert plugin.get_input_sections() is None
+    assert plugin.get_input_window() is None
 
 def test_extractor_plugin_initialize():
     """Test extractor plugin initialize method."""
     plugin = TestExtractorPlugin()
     # Should not raise any exception
-    plugin.initialize() 
\ No newline at end of file
+    plugin.initialize() 
+
+def test_input_window_apply():
+    """Test that an input window selects the first/last pages and caps the text."""
+    pages = ["page one", "page two", "page three"]
+    assert InputWindow(first_pages=1).apply(pages) == "page one"
+    assert InputWindow(last_pages=1).apply(pages) == "page three"
+    assert InputWindow(first_pages=1, last_pages=1).apply(pages) == "page one\npage three"
+    assert InputWindow(first_pages=5).apply(pages) == "page one\npage two\npage three"
+    assert InputWindow(max_chars=4).apply(pages) == "page"
+    # Last-page windows keep the end of the text
+    assert InputWindow(last_pages=1, max_chars=5).apply(pages) == "three"
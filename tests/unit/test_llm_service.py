@@ -117,4 +117,106 @@ def test_extract_with_llm_empty_response(llm_service, mock_llm):
     assert isinstance(token_usage, dict)
     assert "total_tokens" in token_usage
     assert "prompt_tokens" in token_usage
-    assert "completion_tokens" in token_usage 
\ No newline at end of file
+    assert "completion_tokens" in token_usage 
+
+def test_extraction_chain_is_cached(llm_service):
+    """Test that a chain is compiled once per model, prompt and input variables."""
+    with patch.object(llm_service, 'create_extraction_chain', wraps=llm_service.create_extraction_chain) as mock_create:
+        chain = llm_service.get_extraction_chain(TestModel, "Extract information from: {text}", ["text"])
+        assert llm_service.get_extraction_chain(TestModel, "Extract information from: {text}", ["text"]) is chain
+        assert mock_create.call_count == 1
+        
+        llm_service.get_extraction_chain(TestModel, "Extract the skills from: {text}", ["text"])
+        assert mock_create.call_count == 2
+
+def test_extract_with_llm_estimates_tokens_with_format_instructions(mock_llm):
+    """Test that token estimation works for prompts with format instructions."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    
+    service = LLMService()
+    service.llm = FakeListChatModel(responses=['{"name": "John Doe", "skills": ["Python"]}'])
+    
+    result, token_usage = service.extract_with_llm(
+        TestModel,
+        "Extract information.\n{format_instructions}\nText: {text}",
+        ["text"],
+        {"text": "John Doe is skilled in Python"}
+    )
+    
+    assert result == {"name": "John Doe", "skills": ["Python"]}
+    assert token_usage["source"] == "estimation"
+    # The schema in the format instructions counts towards the prompt
+    assert token_usage["prompt_tokens"] > len("Extract information.\n\nText: John Doe is skilled in Python") // 4
+
+def test_extract_with_llm_uses_response_cache(mock_llm, tmp_path):
+    """Test that cached responses cost no tokens and the bypass/refresh flags."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from cvinsight.core.utils.llm_cache import LLMResponseCache
+    
+    cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"))
+    service = LLMService(response_cache=cache)
+    service.llm = FakeListChatModel(responses=['{"name": "John Doe", "skills": ["Python"]}'])
+    args = (TestModel, "Extract information from: {text}", ["text"], {"text": "John Doe, Python"})
+    
+    with patch.object(service, 'get_extraction_chain', wraps=service.get_extraction_chain) as mock_chain:
+        result, token_usage = service.extract_with_llm(*args, plugin_version="1.0.0")
+        cached_result, cached_usage = service.extract_with_llm(*args, plugin_version="1.0.0")
+        assert mock_chain.call_count == 1
+        
+        assert cached_result == result == {"name": "John Doe", "skills": ["Python"]}
+        assert cached_usage["source"] == "cache"
+        assert cached_usage["total_tokens"] == 0
+        assert cached_usage["saved_tokens"] == token_usage["total_tokens"]
+        
+        # A new plugin version misses the cache
+        service.extract_with_llm(*args, plugin_version="1.1.0")
+        assert mock_chain.call_count == 2
+        
+        service.refresh_cache = True
+        service.extract_with_llm(*args, plugin_version="1.0.0")
+        assert mock_chain.call_count == 3
+        
+        service.refresh_cache = False
+        service.bypass_cache = True
+        service.extract_with_llm(*args, plugin_version="2.0.0")
+        assert mock_chain.call_count == 4
+    assert cache.stats()["entries"] == 2
+
+def test_aextract_with_llm(mock_llm):
+    """Test the async extraction path awaits the chain."""
+    import asyncio
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    
+    service = LLMService()
+    service.llm = FakeListChatModel(responses=['{"name": "John Doe", "skills": ["Python"]}'])
+    
+    result, token_usage = asyncio.run(service.aextract_with_llm(
+        TestModel,
+        "Extract information from: {text}",
+        ["text"],
+        {"text": "John Doe is skilled in Python"}
+    ))
+    
+    assert result == {"name": "John Doe", "skills": ["Python"]}
+    assert token_usage["total_tokens"] > 0
+
+def test_batch_extract_with_llm(mock_llm, tmp_path):
+    """Test batched extraction keeps the input order, skips cached inputs and isolates failures."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from cvinsight.core.utils.llm_cache import LLMResponseCache
+    
+    service = LLMService(response_cache=LLMResponseCache(path=str(tmp_path / "llm.sqlite3")))
+    service.llm = FakeListChatModel(responses=['{"name": "Ann", "skills": []}'])
+    args = (TestModel, "Extract information from: {text}", ["text"])
+    service.extract_with_llm(*args, {"text": "Ann"})
+    
+    service.llm = FakeListChatModel(responses=['{"name": "Bob", "skills": []}', 'not json',
+                                               '{"name": "Dan", "skills": []}'])
+    # Chains are cached per service, so compile a new one for the new model
+    service._chains.clear()
+    outputs = service.batch_extract_with_llm(*args, [{"text": "Ann"}, {"text": "Bob"}, {"text": "Cat"},
+                                                     {"text": "Dan"}], max_concurrency=1)
+    
+    assert [result for result, _ in outputs] == [{"name": "Ann", "skills": []}, {"name": "Bob", "skills": []},
+                                                 {}, {"name": "Dan", "skills": []}]
+    assert [usage["source"] for _, usage in outputs] == ["cache", "estimation", "error", "estimation"]
@@ -283,4 +283,59 @@ def test_plugin_integration(plugin_manager, mock_llm_service):
     assert result["email"] == "john@example.com"
     assert "skills" in result
     assert "Python" in result["skills"]
-    assert "Testing" in result["skills"] 
\ No newline at end of file
+    assert "Testing" in result["skills"] 
+
+def test_experience_extractor_chunked():
+    """Test chunked experience extraction merges entries per company"""
+    from cvinsight.base_plugins.experience_extractor import ExperienceExtractorPlugin
+    
+    responses = {
+        "Acme": {"work_experiences": [
+            {"company": "Acme Corp", "role": "Engineer", "start_date": "01/01/2015", "end_date": "01/12/2018",
+             "description": ["Built pipelines"], "location": "Berlin"}
+        ]},
+        "ACME": {"work_experiences": [
+            {"company": "ACME", "role": "Senior Engineer", "start_date": "01/01/2019", "end_date": "01/06/2022",
+             "description": ["Built pipelines", "Led team"], "location": None}
+        ]},
+        "Globex": {"work_experiences": [
+            {"company": "Globex Inc.", "role": "Intern", "start_date": "01/06/2014", "end_date": "01/12/2014",
+             "description": [], "location": None}
+        ]},
+    }
+    
+    def extract_with_llm(model, template, variables, input_data, plugin_version=None):
+        key = next(name for name in responses if input_data["text"].startswith(name))
+        return responses[key], {"total_tokens": 10, "prompt_tokens": 8, "completion_tokens": 2, "source": "llm_output"}
+    
+    llm_service = MagicMock()
+    llm_service.extract_with_llm.side_effect = extract_with_llm
+    plugin = ExperienceExtractorPlugin(llm_service)
+    text = "\n".join([
+        "Acme Corp\nEngineer Jan 2015 - Dec 2018\n" + "• Built pipelines\n" * 10,
+        "ACME\nSenior Engineer Jan 2019 - Jun 2022\n" + "• Led team\n" * 10,
+        "Globex Inc.\nIntern Jun 2014 - Dec 2014\n" + "• Coffee\n" * 10,
+    ])
+    
+    with patch('cvinsight.core.config.EXPERIENCE_CHUNKING_ENABLED', True), \
+         patch('cvinsight.core.config.EXPERIENCE_CHUNK_TOKENS', 60):
+        result, token_usage = plugin.extract(text)
+    
+    assert llm_service.extract_with_llm.call_count == 3
+    assert token_usage["chunks"] == 3
+    assert token_usage["total_tokens"] == 30
+    assert result["work_experiences"] == [
+        {"company": "Acme Corp", "role": "Senior Engineer", "start_date": "01/01/2015", "end_date": "01/06/2022",
+         "description": ["Built pipelines", "Led team"], "location": "Berlin"},
+        {"company": "Globex Inc.", "role": "Intern", "start_date": "01/06/2014", "end_date": "01/12/2014",
+         "description": [], "location": None},
+    ]
+    
+    # Without chunked mode the whole text goes into a single prompt
+    llm_service.extract_with_llm.reset_mock()
+    llm_service.extract_with_llm.side_effect = None
+    llm_service.extract_with_llm.return_value = ({"work_experiences": []}, {"total_tokens": 5})
+    with patch('cvinsight.core.config.EXPERIENCE_CHUNKING_ENABLED', False):
+        plugin.extract(text)
+    llm_service.extract_with_llm.assert_called_once()
+
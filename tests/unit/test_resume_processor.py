@@ -230,4 +230,514 @@ def test_save_resume(mock_json_dump, mock_file, mock_datetime, resume_processor)
     assert mock_json_dump.call_count == 2  # Once for resume, once for token usage
     
     # Verify that model_dump was called with exclude
-    mock_resume.model_dump.assert_called_once_with(exclude={'file_path', 'token_usage'}) 
\ No newline at end of file
+    mock_resume.model_dump.assert_called_once_with(exclude={'file_path', 'token_usage'}) 
+
+def test_process_resume_from_bytes(resume_processor, mock_plugin_manager, make_pdf):
+    """Test processing a resume passed as in-memory bytes"""
+    mock_plugin_manager.plugins = {}
+    pdf_bytes = make_pdf(["John Doe resume"]).read_bytes()
+    
+    resume = resume_processor.process_resume(pdf_bytes, file_name="upload.pdf")
+    
+    assert resume is not None
+    assert resume.file_name == "upload.pdf"
+    assert resume.skills == ["Python", "Testing"]
+    assert resume.token_usage["total_tokens"] == 500
+
+def test_process_all_resumes_from_archives(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that resumes inside zip and tar.gz archives are processed from memory"""
+    import io
+    import tarfile
+    import zipfile
+    
+    mock_plugin_manager.plugins = {}
+    pdf_bytes = make_pdf(["Archived resume"]).read_bytes()
+    
+    with zipfile.ZipFile(os.path.join(resume_processor.resume_dir, "batch.zip"), 'w') as archive:
+        archive.writestr("team_a/resume.pdf", pdf_bytes)
+        archive.writestr("team_b/resume.pdf", pdf_bytes)
+        archive.writestr("notes.txt", "not a resume")
+    with tarfile.open(os.path.join(resume_processor.resume_dir, "batch.tar.gz"), 'w:gz') as archive:
+        info = tarfile.TarInfo("candidate.pdf")
+        info.size = len(pdf_bytes)
+        archive.addfile(info, io.BytesIO(pdf_bytes))
+    
+    with patch.object(resume_processor, 'save_resume', return_value=str(make_pdf([""], name="result.json"))) as mock_save:
+        processed, errors = resume_processor.process_all_resumes()
+    
+    assert (processed, errors) == (3, 0)
+    saved = sorted(call.args[0].file_name for call in mock_save.call_args_list)
+    assert saved == ["candidate.pdf", "team_a_resume.pdf", "team_b_resume.pdf"]
+
+def test_process_all_resumes_skips_unchanged(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that re-runs only process new or changed resumes unless forced"""
+    mock_plugin_manager.plugins = {}
+    pdf_bytes = make_pdf(["John Doe resume"]).read_bytes()
+    for name in ("first.pdf", "second.pdf"):
+        with open(os.path.join(resume_processor.resume_dir, name), 'wb') as f:
+            f.write(pdf_bytes)
+    
+    assert resume_processor.process_all_resumes() == (2, 0)
+    assert os.path.exists(resume_processor.manifest_path)
+    
+    # Touching a file changes its mtime but not its content
+    os.utime(os.path.join(resume_processor.resume_dir, "first.pdf"), (0, 0))
+    assert resume_processor.process_all_resumes() == (0, 0)
+    assert resume_processor.run_stats["skipped"] == 2
+    
+    with open(os.path.join(resume_processor.resume_dir, "second.pdf"), 'wb') as f:
+        f.write(make_pdf(["Jane Roe resume"]).read_bytes())
+    assert resume_processor.process_all_resumes() == (1, 0)
+    assert resume_processor.run_stats["skipped"] == 1
+    
+    # A change in the plugins or the output settings, or --force, makes every resume due again
+    custom_plugin = MagicMock(spec=['metadata'])
+    custom_plugin.metadata = PluginMetadata(name="custom", version="1.0.0", description="Custom plugin")
+    mock_plugin_manager.plugins = {"custom": custom_plugin}
+    assert resume_processor.process_all_resumes() == (2, 0)
+    with patch('cvinsight.core.config.LLM_MODEL', "another-model"):
+        assert resume_processor.process_all_resumes() == (2, 0)
+        assert resume_processor.process_all_resumes() == (0, 0)
+    with patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True):
+        assert resume_processor.process_all_resumes() == (2, 0)
+    assert resume_processor.process_all_resumes(force=True) == (2, 0)
+    assert resume_processor.run_stats["skipped"] == 0
+
+def test_process_all_resumes_pipelined(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that the next resume is parsed while the current one is being extracted"""
+    import threading
+    import zipfile
+    
+    mock_plugin_manager.plugins = {}
+    pdf_bytes = make_pdf(["John Doe resume"]).read_bytes()
+    for name in ("first.pdf", "second.pdf", "third.pdf"):
+        with open(os.path.join(resume_processor.resume_dir, name), 'wb') as f:
+            f.write(pdf_bytes)
+    with zipfile.ZipFile(os.path.join(resume_processor.resume_dir, "batch.zip"), 'w') as archive:
+        archive.writestr("member.pdf", pdf_bytes)
+    
+    # The first extraction only finishes once a later resume has been parsed
+    later_parsed = threading.Event()
+    open_document = resume_processor._open_document
+    def tracking_open(source, file_name=None):
+        document = open_document(source, file_name)
+        if "second" in document.file_name:
+            later_parsed.set()
+        return document
+    
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    extract = profile_plugin.extract
+    overlapped = []
+    def slow_extract(text):
+        overlapped.append(later_parsed.wait(timeout=5))
+        return extract(text)
+    
+    with patch.object(resume_processor, '_open_document', side_effect=tracking_open), \
+         patch.object(profile_plugin, 'extract', side_effect=slow_extract), \
+         patch('cvinsight.core.config.PIPELINE_EXTRACT_WORKERS', 1):
+        assert resume_processor.process_all_resumes(pipelined=True) == (4, 0)
+    
+    assert overlapped[0] is True
+    assert sorted(os.listdir(resume_processor.output_dir)) == [
+        ".cvinsight_manifest.json", "first.json", "member.json", "second.json", "third.json"]
+    assert resume_processor.process_all_resumes(pipelined=True) == (0, 0)
+    assert resume_processor.run_stats["skipped"] == 4
+
+@patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True)
+def test_process_resume_speculative_profile(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that the profile extraction starts on the first page and falls back to the full text"""
+    mock_plugin_manager.plugins = {}
+    pdf_path = make_pdf(["Jane Roe jane@example.com", "Work history on page two"])
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    usage = {"total_tokens": 10, "prompt_tokens": 8, "completion_tokens": 2}
+    profile = {"name": "Jane Roe", "email": "jane@example.com", "phone": "555-0100"}
+    
+    with patch.object(profile_plugin, 'extract', return_value=(profile, dict(usage))) as mock_extract:
+        resume = resume_processor.process_resume(str(pdf_path), speculative=True)
+    
+    mock_extract.assert_called_once_with("Jane Roe jane@example.com")
+    assert resume.name == "Jane Roe"
+    assert resume.token_usage["speculative_profile"] == {"accepted": True}
+    
+    # Nothing found on the first page: the extraction is repeated on the full text
+    with patch.object(profile_plugin, 'extract', side_effect=[({"name": None}, dict(usage)),
+                                                              ({"name": "Jane Roe"}, dict(usage))]) as mock_extract:
+        resume = resume_processor.process_resume(str(pdf_path), speculative=True)
+    
+    assert mock_extract.call_args_list[1].args[0] == "Jane Roe jane@example.com\nWork history on page two"
+    assert resume.name == "Jane Roe"
+    assert resume.token_usage["speculative_profile"] == {"accepted": False}
+    assert resume.token_usage["by_extractor"]["profile"]["total_tokens"] == 20
+
+@patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True)
+def test_speculative_profile_retries_once(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that an incomplete speculative profile is retried once on the full text and is skipped by the pre-classifier"""
+    import concurrent.futures
+    from cvinsight.plugins.base import InputWindow
+    mock_plugin_manager.plugins = {}
+    pdf_path = make_pdf(["Jane Roe", "Contact: jane@example.com"])
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    usage = {"total_tokens": 10, "prompt_tokens": 8, "completion_tokens": 2}
+    
+    # Whatever the extractor's window, the only retry is on the full text
+    for window in (InputWindow(last_pages=1), InputWindow(first_pages=1)):
+        profile_plugin.get_input_window = lambda: window
+        with patch.object(profile_plugin, 'extract', return_value=({"name": "Jane Roe"}, dict(usage))) as mock_extract:
+            resume = resume_processor.process_resume(str(pdf_path), speculative=True)
+        assert [call.args[0] for call in mock_extract.call_args_list] == ["Jane Roe", "Jane Roe\nContact: jane@example.com"]
+        assert resume.token_usage["speculative_profile"] == {"accepted": False}
+    
+    with patch('cvinsight.core.config.RESUME_CLASSIFIER_ENABLED', True), \
+         patch.object(resume_processor, '_speculative_profile_starter', return_value=None) as mock_starter:
+        resume_processor.process_resume(str(pdf_path), speculative=True)
+    assert mock_starter.call_args.args[2] is False
+    
+    # A speculative call that already ran is waited for when the resume is rejected
+    finished = concurrent.futures.Future()
+    finished.set_result(({"name": "Jane Roe"}, dict(usage), "Jane Roe"))
+    document = MagicMock(file_name="blank.pdf")
+    with patch.object(resume_processor, '_prepare_extraction', return_value=None), \
+         patch.object(resume_processor, '_discard_speculation', wraps=resume_processor._discard_speculation) as mock_discard:
+        assert resume_processor.process_document(document, early_profile=finished) is None
+    mock_discard.assert_called_once_with(finished, "the resume was rejected")
+    # A finished call cannot be cancelled, so its token usage is reported
+    assert resume_processor._discard_speculation(finished, "the resume was rejected") == usage
+
+@patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True)
+def test_extract_profile_only(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that extract_profile only runs the profile extractor"""
+    from cvinsight.plugins.base import InputWindow
+    
+    pdf_path = make_pdf(["Jane Roe jane@example.com", "Work history on page two"])
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    skills_plugin = mock_plugin_manager.get_plugin("skills_extractor")
+    
+    profile = {"name": "Jane Roe", "email": "jane@example.com", "phone": "555-0100"}
+    
+    with patch.object(profile_plugin, 'extract', return_value=(profile, {})) as mock_profile, \
+         patch.object(skills_plugin, 'extract') as mock_skills:
+        assert resume_processor.extract_profile(str(pdf_path), speculative=True) == profile
+        mock_profile.assert_called_once_with("Jane Roe jane@example.com")
+        
+        assert resume_processor.extract_profile(str(pdf_path), speculative=False) == profile
+        assert mock_profile.call_args.args[0] == "Jane Roe jane@example.com\nWork history on page two"
+        
+        # The extractor's input window applies as in process_resume
+        profile_plugin.get_input_window = lambda: InputWindow(first_pages=1)
+        assert resume_processor.extract_profile(str(pdf_path), speculative=False) == profile
+        assert mock_profile.call_args.args[0] == "Jane Roe jane@example.com"
+    mock_skills.assert_not_called()
+
+def test_watcher_waits_for_files_to_settle(resume_processor, make_pdf):
+    """Test that a watched file is only ready once it stops changing"""
+    from cvinsight.core.resume_watcher import ResumeWatcher
+    
+    watcher = ResumeWatcher(resume_processor, settle_seconds=2)
+    path = os.path.join(resume_processor.resume_dir, "dropped.pdf")
+    with open(path, 'wb') as f:
+        f.write(b"%PDF-1.4 partial")
+    
+    assert watcher.poll(now=0) == []
+    with open(path, 'ab') as f:
+        f.write(b" more bytes")
+    assert watcher.poll(now=3) == []  # Still growing: the settle timer restarts
+    assert watcher.poll(now=4) == []
+    assert [ready[0] for ready in watcher.poll(now=5)] == [path]
+
+def test_watcher_processes_arrivals(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that the watcher processes new resumes and saves them incrementally"""
+    import threading
+    import time
+    from cvinsight.core.resume_watcher import ResumeWatcher
+    
+    mock_plugin_manager.plugins = {}
+    watcher = ResumeWatcher(resume_processor, poll_interval=0.01, settle_seconds=0, max_workers=2)
+    stop_event = threading.Event()
+    thread = threading.Thread(target=watcher.run, args=(stop_event,))
+    thread.start()
+    try:
+        pdf_bytes = make_pdf(["John Doe resume"]).read_bytes()
+        for name in ("first.pdf", "second.pdf"):
+            with open(os.path.join(resume_processor.resume_dir, name), 'wb') as f:
+                f.write(pdf_bytes)
+        
+        deadline = time.time() + 10
+        while resume_processor.run_stats["processed"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop_event.set()
+        thread.join()
+    
+    assert resume_processor.run_stats == {"processed": 2, "skipped": 0, "rejected": 0, "errors": 0}
+    assert sorted(os.listdir(resume_processor.output_dir)) == [".cvinsight_manifest.json", "first.json", "second.json"]
+
+def test_run_api_processes_paths(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that begin_run/process_path/end_run process files and save the manifest"""
+    mock_plugin_manager.plugins = {}
+    path = os.path.join(resume_processor.resume_dir, "first.pdf")
+    with open(path, 'wb') as f:
+        f.write(make_pdf(["John Doe resume"]).read_bytes())
+    
+    with pytest.raises(RuntimeError):
+        resume_processor.process_path(path)
+    
+    resume_processor.begin_run()
+    resume_processor.process_path(path)
+    resume_processor.process_path(path)
+    assert resume_processor.end_run() == {"processed": 1, "skipped": 1, "rejected": 0, "errors": 0}
+    assert os.path.exists(resume_processor.manifest_path)
+    with pytest.raises(RuntimeError):
+        resume_processor.process_path(path)
+
+def test_process_resume_normalizes_text(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that extractors receive normalized text and the savings are reported"""
+    mock_plugin_manager.plugins = {}
+    pdf_path = make_pdf(["Jane Roe   Resume", "Jane Roe   Resume", "Jane Roe   Resume"])
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    
+    with patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True), \
+         patch.object(profile_plugin, 'extract', wraps=profile_plugin.extract) as mock_extract:
+        resume = resume_processor.process_resume(str(pdf_path))
+    
+    mock_extract.assert_called_once_with("Jane Roe Resume")
+    normalization = resume.token_usage["normalization"]
+    assert normalization["normalized_chars"] == len("Jane Roe Resume")
+    assert normalization["prompts"] == 4
+    assert normalization["estimated_prompt_tokens_saved"] == normalization["estimated_tokens_saved"] * 4
+
+@patch('cvinsight.core.config.TEXT_NORMALIZATION_ENABLED', True)
+def test_process_resume_feeds_sections(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that extractors asking for a section only receive that section"""
+    mock_plugin_manager.plugins = {}
+    pdf_path = make_pdf(["Jane Roe", "SKILLS", "Python, SQL, Spark, Kafka, Airflow, Docker and Kubernetes",
+                         "EDUCATION", "State University - Bachelor of Science in Computer Science"])
+    skills_plugin = mock_plugin_manager.get_plugin("skills_extractor")
+    skills_plugin.get_input_sections = lambda: ["skills"]
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    
+    with patch('cvinsight.core.config.SECTION_SEGMENTATION_ENABLED', True), \
+         patch.object(skills_plugin, 'extract', wraps=skills_plugin.extract) as mock_skills, \
+         patch.object(profile_plugin, 'extract', wraps=profile_plugin.extract) as mock_profile:
+        resume = resume_processor.process_resume(str(pdf_path))
+    
+    mock_skills.assert_called_once_with("SKILLS\nPython, SQL, Spark, Kafka, Airflow, Docker and Kubernetes")
+    # Extractors without get_input_sections get the full text
+    assert mock_profile.call_args.args[0].startswith("Jane Roe\nSKILLS")
+    assert resume.token_usage["segmentation"]["estimated_prompt_tokens_saved"] > 0
+
+def test_process_resume_honours_page_windows(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that an extractor declaring a page window only receives those pages"""
+    import asyncio
+    from cvinsight.plugins.base import InputWindow
+    
+    mock_plugin_manager.plugins = {}
+    pdf_path = make_pdf(["Jane Roe jane@example.com", "Work history on page two", "Education on page three"])
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    profile_plugin.get_input_window = lambda: InputWindow(first_pages=1)
+    skills_plugin = mock_plugin_manager.get_plugin("skills_extractor")
+    
+    usage = {"total_tokens": 10, "prompt_tokens": 8, "completion_tokens": 2}
+    profile = {"name": "Jane Roe", "email": "jane@example.com", "phone": "555-0100"}
+    
+    with patch.object(profile_plugin, 'extract', return_value=(profile, dict(usage))) as mock_profile, \
+         patch.object(skills_plugin, 'extract', wraps=skills_plugin.extract) as mock_skills:
+        resume = resume_processor.process_resume(str(pdf_path))
+    
+    mock_profile.assert_called_once_with("Jane Roe jane@example.com")
+    assert mock_skills.call_args.args[0].endswith("Education on page three")
+    by_extractor = resume.token_usage["by_extractor"]
+    assert by_extractor["profile"]["input_chars"] == len("Jane Roe jane@example.com")
+    assert by_extractor["profile"]["estimated_prompt_tokens_saved"] > 0
+    assert by_extractor["skills"]["estimated_prompt_tokens_saved"] == 0
+    
+    # Contact details incomplete on the first page: the profile is extracted again from the full text
+    with patch.object(profile_plugin, 'extract', side_effect=[({"name": "Jane Roe", "email": None}, dict(usage)),
+                                                              ({"name": "Jane Roe"}, dict(usage))]) as mock_profile:
+        resume = resume_processor.process_resume(str(pdf_path))
+    
+    assert mock_profile.call_args.args[0].endswith("Education on page three")
+    assert resume.name == "Jane Roe"
+    assert resume.token_usage["by_extractor"]["profile"]["total_tokens"] == 20
+    
+    with patch.object(profile_plugin, 'extract', side_effect=[({"name": "Jane Roe", "email": None}, dict(usage)),
+                                                              ({"name": "Jane Roe"}, dict(usage))]) as mock_profile:
+        async_resume = asyncio.run(resume_processor.aprocess_resume(str(pdf_path)))
+    assert async_resume.name == "Jane Roe"
+    assert mock_profile.call_count == 2
+
+def test_process_all_resumes_rejects_non_resumes(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that documents rejected by the pre-classifier never reach the extractors"""
+    mock_plugin_manager.plugins = {}
+    with open(os.path.join(resume_processor.resume_dir, "blank.pdf"), 'wb') as f:
+        f.write(make_pdf([""]).read_bytes())
+    profile_plugin = mock_plugin_manager.get_plugin("profile_extractor")
+    
+    with patch('cvinsight.core.config.RESUME_CLASSIFIER_ENABLED', True), \
+         patch.object(profile_plugin, 'extract') as mock_extract:
+        assert resume_processor.process_all_resumes() == (0, 0)
+        assert resume_processor.run_stats["rejected"] == 1
+        
+        with open(resume_processor.manifest_path) as f:
+            entry = next(iter(json.load(f)["files"].values()))
+        assert entry["rejected"].startswith("no text")
+        
+        # The rejection is remembered for unchanged files
+        assert resume_processor.process_all_resumes() == (0, 0)
+        assert resume_processor.run_stats["skipped"] == 1
+        
+        # ... until the classifier's heuristics change
+        with patch('cvinsight.core.utils.resume_classifier.CLASSIFIER_VERSION', "2.0.0"):
+            assert resume_processor.process_all_resumes() == (0, 0)
+        assert resume_processor.run_stats["rejected"] == 1
+    mock_extract.assert_not_called()
+
+def test_aprocess_resume_awaits_extractors(resume_processor, mock_plugin_manager, make_pdf):
+    """Test the async path awaits aextract coroutines and falls back to extract"""
+    import asyncio
+    
+    class AsyncMockExtractorPlugin(MockExtractorPlugin):
+        async def aextract(self, resume_text):
+            self.awaited = True
+            return self.extract(resume_text)
+    
+    mock_plugin_manager.plugins = {}
+    async_plugin = AsyncMockExtractorPlugin(name="skills_extractor")
+    extractors = mock_plugin_manager.get_extractor_plugins.return_value
+    extractors["skills_extractor"] = async_plugin
+    pdf = make_pdf(["John Doe resume"])
+    
+    resume = asyncio.run(resume_processor.aprocess_resume(str(pdf)))
+    
+    assert resume is not None
+    assert async_plugin.awaited
+    assert all(plugin.processed for plugin in extractors.values())
+    assert resume.skills == ["Python", "Testing"]
+    assert resume.token_usage["total_tokens"] == 500
+    assert asyncio.run(resume_processor.aprocess_resume(str(pdf.parent / "missing.pdf"))) is None
+
+def test_aprocess_resume_plugin_selection(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that concurrent async calls each use their own plugin selection"""
+    import asyncio
+    
+    mock_plugin_manager.plugins = {}
+    selected = MockExtractorPlugin(name="skills_extractor")
+    extractors = mock_plugin_manager.get_extractor_plugins.return_value
+    pdf = make_pdf(["John Doe resume"])
+    
+    async def run_both():
+        return await asyncio.gather(
+            resume_processor.aprocess_resume(str(pdf), plugins={"skills_extractor": selected}),
+            resume_processor.aprocess_resume(str(pdf)))
+    
+    only_skills, full = asyncio.run(run_both())
+    
+    assert selected.processed
+    assert only_skills.token_usage["total_tokens"] == 100
+    assert full.token_usage["total_tokens"] == 500
+    assert all(plugin.processed for plugin in extractors.values())
+    assert mock_plugin_manager.plugins == {}
+
+def test_process_resume_combined_extraction(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that combined mode makes one LLM call and splits the reply per extractor"""
+    import asyncio
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from cvinsight.core.llm_service import LLMService
+    from cvinsight.core.combined_extraction import can_combine
+    from cvinsight.base_plugins.profile_extractor import ProfileExtractorPlugin
+    from cvinsight.base_plugins.skills_extractor import SkillsExtractorPlugin
+    from cvinsight.base_plugins.education_extractor import EducationExtractorPlugin
+    from cvinsight.base_plugins.experience_extractor import ExperienceExtractorPlugin
+    
+    with patch('cvinsight.core.llm_service.ChatGoogleGenerativeAI'):
+        service = LLMService(api_key="test", bypass_cache=True)
+    service.llm = FakeListChatModel(responses=[json.dumps({
+        "profile": {"name": "Jane Roe", "email": "jane@example.com"},
+        "skills": {"skills": ["Python", "SQL"]},
+        "education": {"educations": [{"degree": "BSc", "institution": "State University",
+                                      "start_date": "01/09/2012", "end_date": "01/06/2016"}]},
+        "experience": {"work_experiences": [{"company": "Acme Corp", "role": "Engineer", "description": ["Built things"],
+                                             "start_date": "01/07/2016", "end_date": "01/06/2020"}]}
+    })])
+    extractors = mock_plugin_manager.get_extractor_plugins.return_value
+    assert not can_combine({"profile": extractors["profile_extractor"]})
+    for name, plugin_class in [("profile_extractor", ProfileExtractorPlugin), ("skills_extractor", SkillsExtractorPlugin),
+                               ("education_extractor", EducationExtractorPlugin),
+                               ("experience_extractor", ExperienceExtractorPlugin)]:
+        extractors[name] = plugin_class(service)
+    mock_plugin_manager.plugins = {}
+    pdf = make_pdf(["Jane Roe jane@example.com\nSKILLS\nPython, SQL"])
+    
+    with patch('cvinsight.core.config.COMBINED_EXTRACTION_ENABLED', True), \
+         patch.object(service, 'extract_with_llm', wraps=service.extract_with_llm) as mock_extract:
+        resume = resume_processor.process_resume(str(pdf))
+        assert mock_extract.call_count == 1
+        async_resume = asyncio.run(resume_processor.aprocess_resume(str(pdf)))
+    
+    assert resume.name == "Jane Roe"
+    assert resume.skills == ["Python", "SQL"]
+    assert resume.educations[0].institution == "State University"
+    assert resume.work_experiences[0].company == "Acme Corp"
+    combined = resume.token_usage["combined"]
+    assert combined["extractors"] == ["profile", "skills", "education", "experience"]
+    assert resume.token_usage["by_extractor"]["skills"]["source"] == "combined"
+    # The combined call plus the (mock) YoE extractor
+    assert resume.token_usage["total_tokens"] == combined["total_tokens"] + 100
+    assert async_resume.model_dump(exclude={"token_usage"}) == resume.model_dump(exclude={"token_usage"})
+
+def test_process_all_resumes_batched(resume_processor, mock_plugin_manager, make_pdf):
+    """Test that each extractor receives the inputs of a group of resumes as one batch"""
+    
+    class BatchMockExtractorPlugin(MockExtractorPlugin):
+        def __init__(self, name):
+            super().__init__(name=name)
+            self.batches = []
+        
+        def extract_batch(self, texts, max_concurrency=None):
+            self.batches.append((len(texts), max_concurrency))
+            return [self.extract(text) for text in texts]
+    
+    mock_plugin_manager.plugins = {}
+    batch_plugin = BatchMockExtractorPlugin(name="skills_extractor")
+    extractors = mock_plugin_manager.get_extractor_plugins.return_value
+    extractors["skills_extractor"] = batch_plugin
+    pdf_bytes = make_pdf(["John Doe resume"]).read_bytes()
+    for name in ("first.pdf", "second.pdf", "third.pdf"):
+        with open(os.path.join(resume_processor.resume_dir, name), 'wb') as f:
+            f.write(pdf_bytes)
+    
+    with patch('cvinsight.core.config.LLM_BATCH_SIZE', 2):
+        assert resume_processor.process_all_resumes(batched=True, max_concurrency=3) == (3, 0)
+    
+    assert batch_plugin.batches == [(2, 3), (1, 3)]
+    assert sorted(os.listdir(resume_processor.output_dir)) == [
+        ".cvinsight_manifest.json", "first.json", "second.json", "third.json"]
+    with open(os.path.join(resume_processor.output_dir, "first.json")) as f:
+        result = json.load(f)
+    assert result["skills"] == ["Python", "Testing"]
+    assert resume_processor.process_all_resumes(batched=True) == (0, 0)
+    assert resume_processor.run_stats["skipped"] == 3
+
+def test_manifest_is_saved_periodically(resume_processor):
+    """Test that the manifest is saved every MANIFEST_SAVE_INTERVAL records and at the end of a run"""
+    with patch('cvinsight.core.config.MANIFEST_SAVE_INTERVAL', 2), \
+         patch('cvinsight.core.config.MANIFEST_SAVE_SECONDS', 3600), \
+         patch('cvinsight.core.config.INCREMENTAL_PROCESSING_ENABLED', True), \
+         patch('cvinsight.core.utils.manifest.ProcessingManifest.save', autospec=True,
+               side_effect=lambda manifest, entries=None: saves.append(len(entries or manifest.entries))):
+        saves = []
+        plugin_versions = resume_processor._begin_run()
+        for i in range(3):
+            resume_processor._record(f"resume{i}.pdf", 10, 1.0, "hash", plugin_versions, f"resume{i}.json")
+        assert saves == [2]
+        resume_processor._end_run()
+    assert saves == [2, 3]
+
+def test_text_cache_can_be_disabled(mock_plugin_manager, tmp_path):
+    """Test that an explicit text_cache of None or False disables the shared cache"""
+    shared_cache = MagicMock()
+    with patch('cvinsight.core.utils.text_cache.get_text_cache', return_value=shared_cache):
+        assert PluginResumeProcessor(output_dir=str(tmp_path), log_dir=str(tmp_path),
+                                     plugin_manager=mock_plugin_manager).text_cache is shared_cache
+        for disabled in (None, False):
+            assert PluginResumeProcessor(output_dir=str(tmp_path), log_dir=str(tmp_path),
+                                         plugin_manager=mock_plugin_manager, text_cache=disabled).text_cache is None
@@ -1,7 +1,9 @@
 """Unit tests for utility functions in the core/utils/ directory."""
 import pytest
+import io
 import os
 import tempfile
+import zipfile
 from unittest.mock import patch, mock_open, MagicMock
 from datetime import datetime, timedelta
 import shutil
@@ -10,7 +12,34 @@ import shutil
 from cvinsight.core.utils.date_utils import parse_date, calculate_experience
 
 # File utils
-from cvinsight.core.utils.file_utils import validate_file, read_file, read_pdf_file, read_docx_file
+from cvinsight.core.utils.file_utils import validate_file, read_file, read_pdf_file, read_docx_file, open_document, iter_text, read_stream
+
+# Archive utils
+from cvinsight.core.utils.archive_utils import is_archive, iter_archive
+
+# Section segmenter
+from cvinsight.core.utils.section_segmenter import segment_sections, classify_heading
+
+# Resume classifier
+from cvinsight.core.utils.resume_classifier import classify_resume
+
+# Text chunker
+from cvinsight.core.utils.text_chunker import split_on_role_boundaries
+
+# Text cache
+from cvinsight.core.utils.text_cache import TextCache
+
+# LLM response cache
+from cvinsight.core.utils.llm_cache import LLMResponseCache
+
+# Text normalizer
+from cvinsight.core.utils.text_normalizer import normalize_pages, normalize_page_texts
+
+# Extraction backends
+from cvinsight.core.utils.extraction_backends import get_backend, get_backend_chain, list_backends
+
+# DOCX reader
+from cvinsight.core.utils.docx_reader import read_docx_text
 
 # Cleanup utils
 from cvinsight.core.utils.cleanup import cleanup_pycache
@@ -79,9 +108,9 @@ class TestFileUtils:
             temp_file.write(b"%PDF-1.5\n%Test PDF content")
             temp_file.flush()
             
-            # Test PDF file validation with mocked PdfReader
+            # Test deep PDF file validation with mocked PdfReader
             with patch('PyPDF2.PdfReader') as mock_pdf_reader:
-                is_valid, _ = validate_file(temp_file.name)
+                is_valid, _ = validate_file(temp_file.name, deep=True)
                 assert is_valid is True
                 mock_pdf_reader.assert_called_once()
             
@@ -122,37 +151,259 @@ class TestFileUtils:
             temp_file.close()
             os.unlink(temp_file.name)
     
+    def test_validate_file_structure(self, make_pdf):
+        """Test the fast structural validation of PDF and DOCX files"""
+        pdf_data = make_pdf(["Structure only"]).read_bytes()
+        
+        with patch('PyPDF2.PdfReader') as mock_pdf_reader:
+            assert validate_file(pdf_data, file_name="resume.pdf") == (True, "File is valid")
+            mock_pdf_reader.assert_not_called()
+        
+        is_valid, message = validate_file(pdf_data[:len(pdf_data) // 2], file_name="resume.pdf")
+        assert is_valid is False
+        assert "%%EOF" in message
+        
+        is_valid, message = validate_file(pdf_data.replace(b"startxref", b"startxrex"), file_name="resume.pdf")
+        assert is_valid is False
+        assert "startxref" in message
+        
+        docx_buffer = io.BytesIO()
+        with zipfile.ZipFile(docx_buffer, 'w') as archive:
+            archive.writestr('word/document.xml', "<w:document/>")
+        assert validate_file(docx_buffer.getvalue(), file_name="resume.docx") == (True, "File is valid")
+        
+        other_buffer = io.BytesIO()
+        with zipfile.ZipFile(other_buffer, 'w') as archive:
+            archive.writestr('content.xml', "<document/>")
+        is_valid, message = validate_file(other_buffer.getvalue(), file_name="resume.docx")
+        assert is_valid is False
+        assert "word/document.xml" in message
+    
     def test_read_file(self):
         """Test reading different file types"""
-        # Mock validate_file to avoid PDF validation errors
-        with patch('cvinsight.core.utils.file_utils.validate_file', return_value=(True, "")):
-            # Mock read_pdf_file for PDF files
-            with patch('cvinsight.core.utils.file_utils.read_pdf_file', return_value="PDF content"):
-                # Create temp PDF file
-                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-                    temp_file.write(b"%PDF-1.5\n%Test PDF content")
-                    temp_file.flush()
-                    
-                    content = read_file(temp_file.name)
-                    assert content == "PDF content"
-                    
-                    # Clean up
-                    temp_file.close()
-                    os.unlink(temp_file.name)
+        # Mock PyPDF2.PdfReader so the dummy PDF parses
+        with patch('PyPDF2.PdfReader') as mock_reader:
+            mock_page = MagicMock()
+            mock_page.extract_text.return_value = "PDF content"
+            mock_reader.return_value.pages = [mock_page]
             
-            # Test with unsupported file extension
-            with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as temp_file:
-                temp_file.write(b"Test text content")
+            # Create temp PDF file
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+                temp_file.write(b"%PDF-1.5\n%Test PDF content")
                 temp_file.flush()
                 
-                # Override the validation for this test
-                with patch('os.path.splitext', return_value=("test", ".txt")):
-                    with pytest.raises(ValueError, match="Unsupported file type"):
-                        read_file(temp_file.name)
+                content = read_file(temp_file.name)
+                assert content == "PDF content"
+                
+                # The PDF is parsed exactly once (no separate validation parse)
+                mock_reader.assert_called_once()
                 
                 # Clean up
                 temp_file.close()
                 os.unlink(temp_file.name)
+        
+        # Test with unsupported file extension
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as temp_file:
+            temp_file.write(b"Test text content")
+            temp_file.flush()
+            
+            # Allow the extension through validation so parsing rejects it
+            with patch('cvinsight.core.config.ALLOWED_FILE_EXTENSIONS', ['.pdf', '.docx', '.txt']):
+                with pytest.raises(ValueError, match="Unsupported file type"):
+                    read_file(temp_file.name)
+            
+            # Clean up
+            temp_file.close()
+            os.unlink(temp_file.name)
+    
+    def test_open_document(self):
+        """Test opening a document validates and parses it once"""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(b"%PDF-1.5\n%Test PDF content")
+            temp_file.flush()
+            
+            with patch('PyPDF2.PdfReader') as mock_reader:
+                mock_page1 = MagicMock()
+                mock_page1.extract_text.return_value = "Page 1 content"
+                mock_page2 = MagicMock()
+                mock_page2.extract_text.return_value = None
+                mock_reader.return_value.pages = [mock_page1, mock_page2]
+                
+                document = open_document(temp_file.name)
+                
+                assert document.file_name == os.path.basename(temp_file.name)
+                assert document.page_count == 2
+                assert document.text == "Page 1 content"
+                mock_reader.assert_called_once()
+            
+            # An unparseable PDF is reported as a validation error
+            with patch('PyPDF2.PdfReader', side_effect=Exception("broken")):
+                with pytest.raises(ValueError, match="Invalid PDF file"):
+                    open_document(temp_file.name)
+            
+            # Clean up
+            temp_file.close()
+            os.unlink(temp_file.name)
+        
+        # Missing files fail validation
+        with pytest.raises(ValueError, match="not found"):
+            open_document("non_existent_file.pdf")
+    
+    def test_open_document_parallel(self, make_pdf):
+        """Test parallel page extraction preserves page order"""
+        pages = [f"Page {i} content" for i in range(7)]
+        pdf_path = make_pdf(pages)
+        
+        with patch('cvinsight.core.config.PDF_PARALLEL_EXTRACTION', True), \
+             patch('cvinsight.core.config.PDF_PARALLEL_MIN_PAGES', 3), \
+             patch('cvinsight.core.config.PDF_PARALLEL_WORKERS', 2):
+            document = open_document(str(pdf_path))
+        
+        assert document.pages == pages
+        assert document.text == "".join(pages)
+        
+        # The worker processes exit when the pool is shut down
+        from cvinsight.core.utils import file_utils
+        file_utils.shutdown_page_pool()
+        assert file_utils._page_pool is None
+    
+    def test_iter_text(self, make_pdf):
+        """Test lazily iterating page text with page and character limits"""
+        pdf_path = str(make_pdf(["First page", "Second page", "Third page"]))
+        
+        assert list(iter_text(pdf_path)) == ["First page", "Second page", "Third page"]
+        assert list(iter_text(pdf_path, max_pages=2)) == ["First page", "Second page"]
+        assert list(iter_text(pdf_path, max_chars=15)) == ["First page", "Secon"]
+        assert list(iter_text(pdf_path, max_pages=1, max_chars=5)) == ["First"]
+        
+        # Validation errors surface on first iteration
+        with pytest.raises(ValueError, match="not found"):
+            next(iter_text("non_existent_file.pdf"))
+    
+    def test_iter_text_stops_early(self):
+        """Test that pages past the limit are never parsed"""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(b"%PDF-1.5\n%Test PDF content")
+            temp_file.flush()
+            
+            with patch('PyPDF2.PdfReader') as mock_reader:
+                mock_pages = [MagicMock() for _ in range(3)]
+                for i, page in enumerate(mock_pages):
+                    page.extract_text.return_value = f"Page {i}"
+                mock_reader.return_value.pages = mock_pages
+                
+                assert list(iter_text(temp_file.name, max_pages=1)) == ["Page 0"]
+                mock_pages[0].extract_text.assert_called_once()
+                mock_pages[1].extract_text.assert_not_called()
+                mock_pages[2].extract_text.assert_not_called()
+            
+            # Clean up
+            temp_file.close()
+            os.unlink(temp_file.name)
+    
+    def test_open_document_from_buffers(self, make_pdf):
+        """Test opening documents from bytes, memoryviews and file objects"""
+        pdf_bytes = make_pdf(["Buffer page"]).read_bytes()
+        
+        for source in (pdf_bytes, bytearray(pdf_bytes), memoryview(pdf_bytes), io.BytesIO(pdf_bytes)):
+            document = open_document(source)
+            assert document.text == "Buffer page"
+            assert document.extension == ".pdf"
+            assert document.file_name.endswith(".pdf")
+        
+        # An explicit file name is used for the results
+        document = open_document(pdf_bytes, file_name="upload.pdf")
+        assert document.file_name == "upload.pdf"
+        
+        assert read_file(memoryview(pdf_bytes)) == "Buffer page"
+        assert validate_file(pdf_bytes) == (True, "File is valid")
+        
+        # Unknown contents and oversized buffers are rejected
+        is_valid, message = validate_file(b"not a resume")
+        assert is_valid is False
+        assert "Invalid file type" in message
+        
+        with patch('cvinsight.core.config.MAX_PDF_SIZE_MB', 0.0001):
+            is_valid, message = validate_file(pdf_bytes)
+            assert is_valid is False
+            assert "File too large" in message
+        
+        with pytest.raises(TypeError):
+            open_document(12345)
+    
+    def test_read_stream_enforces_size_while_reading(self, make_pdf):
+        """Test that oversized uploads are rejected without reading them whole"""
+        pdf_bytes = make_pdf(["Streamed page"]).read_bytes()
+        consumed = []
+        
+        def chunks(count):
+            for _ in range(count):
+                consumed.append(1)
+                yield b"x" * 1024
+        
+        assert read_stream(chunks(3), max_size_mb=0.01) == bytearray(b"x" * 3072)
+        consumed.clear()
+        with pytest.raises(ValueError, match="File too large"):
+            read_stream(chunks(1000), max_size_mb=0.01)
+        # Reading stopped at the first chunk past the 10KB limit
+        assert len(consumed) == 11
+        
+        # Uploads arriving as chunks go through the same limit in open_document
+        assert open_document(iter([pdf_bytes[:100], pdf_bytes[100:]])).text == "Streamed page"
+        with patch('cvinsight.core.config.MAX_PDF_SIZE_MB', 0.0001), pytest.raises(ValueError, match="File too large"):
+            open_document(io.BytesIO(pdf_bytes))
+    
+    def test_read_stream_checks_file_size_first(self, temp_dir):
+        """Test that file-backed streams are rejected from their size before reading"""
+        path = temp_dir / "large.pdf"
+        path.write_bytes(b"%PDF-1.4" + b"0" * 4096)
+        
+        with open(path, 'rb') as f:
+            with pytest.raises(ValueError, match="File too large"):
+                read_stream(f, max_size_mb=0.001)
+            assert f.tell() == 0
+    
+
+    def test_open_document_memory_maps_files(self, make_pdf):
+        """Test that files are mapped once and hashed over the shared mapping"""
+        import hashlib
+        import mmap
+        pdf_path = make_pdf(["Mapped page", "Second page"])
+        
+        with patch('cvinsight.core.config.MMAP_READS_ENABLED', True), \
+             patch('cvinsight.core.config.MMAP_MIN_SIZE_KB', 0), \
+             patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "stdlib"):
+            document = open_document(str(pdf_path))
+        
+        assert isinstance(document.data, mmap.mmap)
+        assert document.text == "Mapped pageSecond page"
+        assert document.content_hash == hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+        with document:
+            pass
+        assert document.data.closed
+        assert document.pages == ["Mapped page", "Second page"]
+        
+        with patch('cvinsight.core.config.MMAP_READS_ENABLED', False):
+            document = open_document(str(pdf_path))
+        assert isinstance(document.data, bytes)
+        assert document.content_hash == hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+        
+        with patch('cvinsight.core.config.MAX_PDF_SIZE_MB', 0.0001), pytest.raises(ValueError, match="File too large"):
+            open_document(str(pdf_path))
+    
+    def test_deep_validation_closes_document(self, make_pdf):
+        """Test that the deep check releases the memory-mapped file"""
+        from cvinsight.core.utils.file_utils import ResumeDocument
+        pdf_path = make_pdf(["Mapped page"])
+        
+        with patch('cvinsight.core.config.MMAP_READS_ENABLED', True), \
+             patch('cvinsight.core.config.MMAP_MIN_SIZE_KB', 0), \
+             patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "stdlib"), \
+             patch.object(ResumeDocument, 'close', autospec=True, side_effect=ResumeDocument.close) as close:
+            assert validate_file(str(pdf_path), deep=True) == (True, "File is valid")
+        
+        close.assert_called_once()
+        assert close.call_args[0][0].data.closed
     
     def test_read_pdf_file(self):
         """Test reading PDF files"""
@@ -212,6 +463,429 @@ class TestFileUtils:
             with pytest.raises(IOError):
                 read_docx_file("test.docx")
 
+class TestArchiveUtils:
+    """Tests for streaming resumes out of archives"""
+    
+    def test_is_archive(self):
+        """Test archive detection by file name"""
+        assert is_archive("batch.zip")
+        assert is_archive("batch.TAR.GZ")
+        assert is_archive("batch.tgz")
+        assert not is_archive("resume.pdf")
+    
+    def test_iter_archive(self, temp_dir):
+        """Test that only resume members within the size limit are yielded"""
+        archive_path = temp_dir / "batch.zip"
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            archive.writestr("a/resume.pdf", b"%PDF-1.4 first")
+            archive.writestr("b/resume.docx", b"PK docx")
+            archive.writestr("__MACOSX/a/._resume.pdf", b"resource fork")
+            archive.writestr("readme.txt", b"not a resume")
+            archive.writestr("huge.pdf", b"x" * (2 * 1024 * 1024))
+        
+        with patch('cvinsight.core.config.MAX_PDF_SIZE_MB', 1):
+            members = list(iter_archive(archive_path))
+        
+        assert members == [("a_resume.pdf", b"%PDF-1.4 first"), ("b_resume.docx", b"PK docx")]
+    
+    def test_iter_archive_invalid(self, temp_dir):
+        """Test that a corrupt archive raises ValueError"""
+        archive_path = temp_dir / "broken.tar.gz"
+        archive_path.write_bytes(b"not an archive")
+        
+        with pytest.raises(ValueError, match="Invalid archive"):
+            list(iter_archive(archive_path))
+
+class TestTextNormalizer:
+    """Tests for the text normalization stage"""
+    
+    def test_strips_repeated_headers_and_page_numbers(self):
+        """Test that running headers are kept once and page numbers are removed"""
+        pages = [
+            "John Doe | john@example.com\nSKILLS\nPython\nPage 1 of 3",
+            "John Doe | john@example.com\nEXPERIENCE\nAcme Corp\nPage 2 of 3",
+            "John Doe | john@example.com\nEDUCATION\nState University\n3",
+        ]
+        
+        text, stats = normalize_pages(pages)
+        
+        assert text == ("John Doe | john@example.com\nSKILLS\nPython\nEXPERIENCE\nAcme Corp\n"
+                        "EDUCATION\nState University")
+        assert stats["removed_lines"] == 5
+        assert stats["normalized_chars"] == len(text)
+        assert stats["removed_chars"] == stats["original_chars"] - len(text)
+    
+    def test_collapses_whitespace(self):
+        """Test that runs of spaces and blank lines are collapsed"""
+        text, stats = normalize_pages(["Python,\t  SQL   \n\n\n\n\nDocker\u00a0\u00a0Kubernetes  "])
+        
+        assert text == "Python, SQL\n\nDocker Kubernetes"
+        assert stats["estimated_tokens_saved"] == (stats["original_chars"] - len(text)) // 4
+        # A single page has no repeated headers to strip
+        assert normalize_pages(["Page 1"])[0] == "Page 1"
+    
+    def test_normalizes_pages_separately(self):
+        """Test that per-page normalization strips the same headers as normalize_pages"""
+        pages = ["Jane Roe\nSKILLS\nPython  SQL\nPage 1", "Jane Roe\nEDUCATION\nState University\nPage 2"]
+        
+        assert normalize_page_texts(pages) == ["Jane Roe\nSKILLS\nPython SQL", "EDUCATION\nState University"]
+
+class TestSectionSegmenter:
+    """Tests for the resume section segmenter"""
+    
+    RESUME = """Jane Roe
+jane@example.com
+WORK EXPERIENCE
+Acme Corp - Senior Engineer, Jan 2020 - Present
+Built data pipelines processing billions of events per day.
+Personal Projects
+Resume parser written in Python.
+Skills & Interests:
+Skills: Python | SQL | Spark | Kafka | Airflow | Docker | Kubernetes
+Interests: Reading, Chess
+EDUCATION
+State University - B.Sc. in Computer Science, 2015 - 2019"""
+    
+    def test_classify_heading(self):
+        """Test heading recognition"""
+        assert classify_heading("WORK EXPERIENCE") == "experience"
+        assert classify_heading("Skills & Interests:") == "skills"
+        assert classify_heading("Project Experience") == "projects"
+        assert classify_heading("education") is None
+        assert classify_heading("Interests: Reading, Chess") is None
+        assert classify_heading("Acme Corp - Senior Engineer, Jan 2020 - Present") is None
+    
+    def test_segment_sections(self):
+        """Test that each section gets the lines under its heading"""
+        sections = segment_sections(self.RESUME)
+        
+        assert sections.confident
+        assert sections.sections["preamble"] == "Jane Roe\njane@example.com"
+        assert "Acme Corp" in sections.text_for(["experience"])
+        assert "Resume parser" not in sections.text_for(["experience"])
+        assert sections.text_for(["skills"]).startswith("Skills & Interests:")
+        assert "Kubernetes" in sections.text_for(["skills"])
+        assert sections.text_for(["education"]).endswith("2015 - 2019")
+        assert sections.text_for(None) == self.RESUME
+    
+    def test_fallback_to_full_text(self):
+        """Test that missing, short or unstructured sections fall back to the full text"""
+        sections = segment_sections(self.RESUME.replace("EDUCATION\n", ""))
+        # The education lines now belong to the skills section and no education section exists
+        assert sections.text_for(["education"]) == sections.full_text
+        
+        with patch('cvinsight.core.config.SECTION_MIN_CHARS', 1000):
+            assert sections.text_for(["skills"]) == sections.full_text
+
+class TestResumeClassifier:
+    """Tests for the local resume pre-classifier"""
+    
+    def test_accepts_resumes(self):
+        """Test that text with resume sections is accepted"""
+        result = classify_resume(TestSectionSegmenter.RESUME)
+        
+        assert result["is_resume"]
+        assert result["reason"] is None
+        assert result["sections"] == ["education", "experience", "projects", "skills"]
+        assert result["contact"]
+    
+    def test_rejects_empty_and_short_text(self):
+        """Test that blank scans and near-empty documents are rejected"""
+        assert classify_resume("  \n\n ")["reason"].startswith("no text")
+        assert classify_resume("Jane Roe\njane@example.com")["reason"].startswith("too little text")
+        assert classify_resume("Jane Roe\njane@example.com", min_chars=10)["is_resume"]
+    
+    def test_rejects_other_documents(self):
+        """Test that cover letters and invoices are rejected with their kind"""
+        letter = ("Dear Hiring Manager,\nI am writing to apply for the data engineer role at Acme Corp. "
+                  "Over the last five years I have built data pipelines in Python and Spark, and I would "
+                  "welcome the chance to bring that experience to your team.\nSincerely,\nJane Roe")
+        invoice = ("INVOICE 2024-118\nBill to: Acme Corp, 1 Main Street, Springfield\n"
+                   "Consulting services, March 2024 .......... 4,000.00\nSubtotal 4,000.00\nVAT 800.00\n"
+                   "Amount due 4,800.00\nPayment terms: 30 days from the invoice date")
+        
+        assert classify_resume(letter)["reason"] == "not a resume (cover letter)"
+        assert classify_resume(invoice, min_chars=100)["reason"] == "not a resume (invoice)"
+        
+        unstructured = segment_sections("Jane Roe, engineer at Acme Corp since 2020.")
+        assert not unstructured.confident
+        assert unstructured.text_for(["skills"]) == unstructured.full_text
+
+class TestTextChunker:
+    """Tests for splitting work experience on role boundaries"""
+    
+    EXPERIENCE = "\n".join(
+        f"Company {i}\nEngineer Jan {2000 + i} - Dec {2001 + i}\n" + "\n".join(f"• Achievement {i}.{j}" for j in range(5))
+        for i in range(6)
+    )
+    
+    def test_short_text_is_one_chunk(self):
+        """Test that text under the budget is not split"""
+        assert split_on_role_boundaries(self.EXPERIENCE, 10000) == [self.EXPERIENCE]
+    
+    def test_splits_on_roles(self):
+        """Test that chunks stay under the budget and never split a role"""
+        chunks = split_on_role_boundaries(self.EXPERIENCE, 60)
+        
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 60 * 4 for chunk in chunks)
+        assert "\n".join(chunks) == self.EXPERIENCE
+        for chunk in chunks:
+            assert chunk.startswith("Company ")
+    
+    def test_oversized_role_repeats_header(self):
+        """Test that a role larger than the budget keeps its header in every piece"""
+        role = "Acme Corp\nEngineer Jan 2010 - Present\n" + "\n".join(f"• Built system {i}" for i in range(40))
+        
+        chunks = split_on_role_boundaries(role, 50)
+        
+        assert len(chunks) > 1
+        assert all(chunk.startswith("Acme Corp\nEngineer Jan 2010 - Present\n") for chunk in chunks)
+
+class TestTextCache:
+    """Tests for the extracted text cache"""
+    
+    def test_get_and_put(self):
+        """Test cache hits, misses and content-based keys"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TextCache(cache_dir=cache_dir, max_size_mb=1)
+            key = cache.make_key(b"file bytes", "PyPDF2-3.0.1")
+            
+            assert cache.get(key) is None
+            cache.put(key, ["Page 1", "Page 2"])
+            assert cache.get(key) == ["Page 1", "Page 2"]
+            
+            # Same bytes with another backend version is a different entry
+            assert cache.make_key(b"file bytes", "PyPDF2-3.0.2") != key
+            assert cache.make_key(b"file bytes", "PyPDF2-3.0.1") == key
+            
+            stats = cache.stats()
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted first"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            page = "x" * 400 * 1024
+            cache = TextCache(cache_dir=cache_dir, max_size_mb=1)
+            
+            first = cache.make_key(b"first", "backend")
+            second = cache.make_key(b"second", "backend")
+            third = cache.make_key(b"third", "backend")
+            
+            cache.put(first, [page])
+            cache.put(second, [page])
+            # Touch the first entry so the second becomes least recently used
+            os.utime(cache._entry_path(second), (0, 0))
+            assert cache.get(first) == [page]
+            cache.put(third, [page])
+            
+            assert cache.get(second) is None
+            assert cache.get(first) == [page]
+            assert cache.get(third) == [page]
+            assert cache.stats()["evictions"] == 1
+    
+    def test_open_document_uses_cache(self):
+        """Test that a cached document is not parsed again"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TextCache(cache_dir=cache_dir)
+            
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+                temp_file.write(b"%PDF-1.5\n%Cached PDF content")
+                temp_file.flush()
+                
+                with patch('PyPDF2.PdfReader') as mock_reader:
+                    mock_page = MagicMock()
+                    mock_page.extract_text.return_value = "Cached text"
+                    mock_reader.return_value.pages = [mock_page]
+                    
+                    first = open_document(temp_file.name, cache=cache)
+                    second = open_document(temp_file.name, cache=cache)
+                    
+                    assert first.from_cache is False
+                    assert second.from_cache is True
+                    assert second.text == "Cached text"
+                    mock_reader.assert_called_once()
+                    
+                    # An explicit None bypasses the shared cache
+                    with patch('cvinsight.core.utils.file_utils.get_text_cache', return_value=cache):
+                        assert open_document(temp_file.name).from_cache is True
+                        assert open_document(temp_file.name, cache=None).from_cache is False
+                
+                # Clean up
+                temp_file.close()
+                os.unlink(temp_file.name)
+
+class TestLLMCache:
+    """Tests for the persistent LLM response cache"""
+    
+    def test_get_and_put(self, temp_dir):
+        """Test cache hits, misses and the parts of the key"""
+        cache = LLMResponseCache(path=str(temp_dir / "llm.sqlite3"), ttl_seconds=0, max_size_mb=1)
+        key = cache.make_key("gemini-2.0-flash", dict, "Extract: {text}", "1.0.0", {"text": "resume"})
+        
+        assert cache.get(key) is None
+        cache.put(key, "gemini-2.0-flash", {"skills": ["Python"]}, {"total_tokens": 120})
+        assert cache.get(key) == ({"skills": ["Python"]}, {"total_tokens": 120})
+        
+        # Another model, prompt, plugin version or input is a different entry
+        assert cache.make_key("gemini-2.5-pro", dict, "Extract: {text}", "1.0.0", {"text": "resume"}) != key
+        assert cache.make_key("gemini-2.0-flash", dict, "Extract {text}", "1.0.0", {"text": "resume"}) != key
+        assert cache.make_key("gemini-2.0-flash", dict, "Extract: {text}", "1.1.0", {"text": "resume"}) != key
+        assert cache.make_key("gemini-2.0-flash", dict, "Extract: {text}", "1.0.0", {"text": "other"}) != key
+        
+        # Entries survive a restart
+        cache.close()
+        reopened = LLMResponseCache(path=str(temp_dir / "llm.sqlite3"), ttl_seconds=0, max_size_mb=1)
+        assert reopened.get(key) == ({"skills": ["Python"]}, {"total_tokens": 120})
+        assert reopened.stats()["entries"] == 1
+    
+    def test_ttl_expiry(self, temp_dir):
+        """Test that expired entries are misses"""
+        cache = LLMResponseCache(path=str(temp_dir / "llm.sqlite3"), ttl_seconds=60, max_size_mb=1)
+        with patch('cvinsight.core.utils.llm_cache.time.time', return_value=1000.0):
+            cache.put("key", "model", {"name": "Jane"}, {})
+        with patch('cvinsight.core.utils.llm_cache.time.time', return_value=1059.0):
+            assert cache.get("key") == ({"name": "Jane"}, {})
+        with patch('cvinsight.core.utils.llm_cache.time.time', return_value=1061.0):
+            assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+    
+    def test_lru_eviction(self, temp_dir):
+        """Test that the least recently used entries are evicted first"""
+        cache = LLMResponseCache(path=str(temp_dir / "llm.sqlite3"), ttl_seconds=0, max_size_mb=1)
+        result = {"text": "x" * 400 * 1024}
+        
+        with patch('cvinsight.core.utils.llm_cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("first", "model", result, {})
+            cache.put("second", "model", result, {})
+            # Use the first entry so the second becomes least recently used
+            assert cache.get("first") is not None
+            cache.put("third", "model", result, {})
+        
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.stats()["evictions"] == 1
+
+class TestExtractionBackends:
+    """Tests for the text-extraction backend registry"""
+    
+    def test_backend_chain(self):
+        """Test that the configured backend comes first, followed by the fallbacks"""
+        with patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "custom"), \
+             patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["PyPDF2", "not-installed"]):
+            chain = get_backend_chain('.pdf')
+            assert [backend.name for backend in chain] == ["stdlib", "PyPDF2"]
+        
+        # By default only the stdlib reader retries empty pages; 'all' opts into every available backend
+        with patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "PyPDF2"):
+            assert [backend.name for backend in get_backend_chain('.pdf')] == ["PyPDF2", "stdlib"]
+            with patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["all"]):
+                assert [backend.name for backend in get_backend_chain('.pdf')] == [
+                    backend.name for backend in list_backends('.pdf')]
+        
+        assert [backend.name for backend in get_backend_chain(".docx")] == ["docx2txt", "stdlib-docx"]
+        assert get_backend_chain('.txt') == []
+    
+    def test_stdlib_backend(self, make_pdf):
+        """Test that the pure-stdlib backend extracts text on its own"""
+        with patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "stdlib"):
+            document = open_document(str(make_pdf(["Hello (world)", "Page two"])))
+        
+        assert document.pages == ["Hello (world)", "Page two"]
+        assert document.backend.startswith("stdlib-")
+    
+    def test_fallback_on_empty_page(self, make_pdf):
+        """Test that pages without text are retried with the next backend"""
+        pdf_path = make_pdf(["First page", "Second page"])
+        
+        with patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "PyPDF2"), \
+             patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["stdlib"]), \
+             patch('PyPDF2.PdfReader') as mock_reader:
+            first_page = MagicMock()
+            first_page.extract_text.return_value = "First page (PyPDF2)"
+            empty_page = MagicMock()
+            empty_page.extract_text.return_value = ""
+            mock_reader.return_value.pages = [first_page, empty_page]
+            
+            document = open_document(str(pdf_path))
+        
+        assert document.pages == ["First page (PyPDF2)", "Second page"]
+    
+    def test_fallback_when_primary_cannot_open(self, make_pdf):
+        """Test that a document the preferred backend rejects is opened by a fallback"""
+        pdf_path = make_pdf(["Recovered text"])
+        
+        with patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["stdlib"]), \
+             patch('PyPDF2.PdfReader', side_effect=Exception("broken")):
+            assert read_file(str(pdf_path)) == "Recovered text"
+            assert validate_file(str(pdf_path)) == (True, "File is valid")
+        
+        with patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["stdlib"]):
+            is_valid, message = validate_file(b"%PDF-1.5\n%Truncated", file_name="broken.pdf")
+        assert not is_valid
+        assert "Invalid PDF file" in message
+    
+    def test_typed_readers_use_backend_chain(self, make_pdf):
+        """Test that read_pdf_file honours PDF_EXTRACTION_METHOD and the fallbacks like read_file"""
+        pdf_path = make_pdf(["Recovered text"])
+        
+        with patch('cvinsight.core.config.PDF_EXTRACTION_FALLBACKS', ["stdlib"]), \
+             patch('PyPDF2.PdfReader', side_effect=Exception("broken")):
+            assert read_pdf_file(str(pdf_path)) == read_file(str(pdf_path)) == "Recovered text"
+        
+        with patch('cvinsight.core.config.PDF_EXTRACTION_METHOD', "stdlib"), \
+             patch('PyPDF2.PdfReader') as mock_reader:
+            assert read_pdf_file(str(pdf_path)) == "Recovered text"
+        mock_reader.assert_not_called()
+    
+    def test_get_backend_by_alias(self):
+        """Test that the legacy 'custom' method name maps to the stdlib backend"""
+        assert get_backend("custom") is get_backend("stdlib")
+        assert get_backend("pypdf2").name == "PyPDF2"
+        assert get_backend("unknown") is None
+
+class TestDocxReader:
+    """Tests for the streaming DOCX reader"""
+    
+    @staticmethod
+    def _make_docx(parts):
+        """Build an in-memory DOCX from a dict of part name to XML body"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for name, body in parts.items():
+                archive.writestr(name, body)
+        return buffer.getvalue()
+    
+    def test_matches_docx2txt(self, temp_dir):
+        """Test that headers, tabs, breaks and footers come out as docx2txt writes them"""
+        import docx2txt
+        ns = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        data = self._make_docx({
+            "word/document.xml": f'<w:document {ns}><w:body>'
+                                 '<w:p><w:r><w:t>John Doe</w:t></w:r></w:p>'
+                                 '<w:p><w:r><w:t>Python</w:t><w:tab/><w:t>SQL</w:t><w:br/><w:t>Go</w:t></w:r></w:p>'
+                                 '</w:body></w:document>',
+            "word/header1.xml": f'<w:hdr {ns}><w:p><w:r><w:t>Resume</w:t></w:r></w:p></w:hdr>',
+            "word/footer1.xml": f'<w:ftr {ns}><w:p><w:r><w:t>Page 1</w:t></w:r></w:p></w:ftr>',
+            "word/media/image1.png": b"not an image",
+        })
+        docx_path = os.path.join(temp_dir, "resume.docx")
+        with open(docx_path, 'wb') as f:
+            f.write(data)
+        
+        text = read_docx_text(io.BytesIO(data))
+        assert text == docx2txt.process(docx_path)
+        assert text.startswith("Resume")
+        assert "Python\tSQL\nGo" in text
+        assert text.endswith("Page 1")
+    
+    def test_missing_document_part(self):
+        """Test that an archive without word/document.xml is rejected"""
+        with pytest.raises(KeyError):
+            read_docx_text(io.BytesIO(self._make_docx({"word/styles.xml": "<styles/>"})))
+
 class TestCleanupUtils:
     """Tests for cleanup utility functions"""
     